@@ -0,0 +1,57 @@
+from time import time
+import jute
+
+# Create interfaces IShape0 to IShape9 and a class implementing each
+# Repeatedly choose a function for instances of each class, using a chain
+# of provided_by checks, and using a generic function
+# Time both of the above
+
+
+SHAPES = 10
+CALLS = 100000
+
+
+def mkshape(i):
+    interface = jute.Interface(
+        'IShape{}'.format(i), (jute.Opaque,), {'__qualname__': 'IShape'})
+    cls = type('Shape{}'.format(i), (), {})
+    interface.register_implementation(cls)
+    return interface, cls
+
+
+INTERFACES, CLASSES = zip(*[mkshape(i) for i in range(SHAPES)])
+
+
+def describe_chain(shape):
+    for i, interface in enumerate(INTERFACES):
+        if interface.provided_by(shape):
+            return i
+    return None
+
+
+@jute.dispatch
+def describe(shape):
+    return None
+
+
+for i, interface in enumerate(INTERFACES):
+    describe.register(interface, lambda shape, i=i: i)
+
+
+def test(func):
+    shapes = [cls() for cls in CLASSES]
+    start = time()
+    for i in range(CALLS // SHAPES):
+        for shape in shapes:
+            func(shape)
+    stop = time()
+    print(func.__name__, stop - start)
+
+
+def main():
+    test(describe_chain)
+    test(describe)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+from time import time
+import multiprocessing
+import jute
+
+# Create an interface with a CPU-bound method
+# Host providers of the interface in 1, 2, 4, ... worker processes
+# Call the method many times through the process pool
+# Time all the above, and compare with calling a provider in-process
+
+
+class Sums(jute.Opaque):
+
+    def sum_squares(n):
+        """Return the sum of the squares below n"""
+
+
+@jute.implements(Sums)
+class SquareSummer:
+
+    """Sum squares in a loop, to keep a core busy."""
+
+    def sum_squares(self, n):
+        total = 0
+        for i in range(n):
+            total += i * i
+        return total
+
+
+CALLS = 400
+SIZE = 20000
+
+
+def test_local():
+    sums = Sums(SquareSummer())
+    start = time()
+    for i in range(CALLS):
+        sums.sum_squares(SIZE)
+    stop = time()
+    print('local', stop - start)
+
+
+def test_processes(processes):
+    with jute.ProcessPool(Sums, SquareSummer, processes=processes) as pool:
+        sums = Sums(pool)
+        sums.sum_squares(1)     # wait for the workers to start
+        start = time()
+        list(pool.map('sum_squares', [SIZE] * CALLS))
+        stop = time()
+    print(processes, 'processes', stop - start)
+
+
+def main():
+    test_local()
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        test_processes(processes)
+        processes *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+from time import time
+import threading
+import jute
+
+# Create an interface IFoo and a class implementing it
+# In 1, 2, 4 and 8 threads, repeatedly cast an instance to the interface
+# and call foo, while another thread registers new implementations
+# Time all the above, and check that no registration was lost
+
+
+class Increments(jute.Opaque):
+
+    def increment():
+        """Increment something"""
+
+
+@jute.implements(Increments)
+class IncrementingInteger:
+
+    """Increment an integer when increment is called."""
+
+    bar = 0
+
+    def increment(self):
+        self.bar += 1
+
+
+CASTS = 200000
+REGISTRATIONS = 1000
+
+
+def cast(count):
+    inc = IncrementingInteger()
+    for i in range(count):
+        Increments(inc).increment()
+
+
+def register(classes):
+    for cls in classes:
+        Increments.register_implementation(cls)
+
+
+def test_threads(count):
+    classes = [type('Class{}'.format(i), (), {}) for i in range(REGISTRATIONS)]
+    threads = [
+        threading.Thread(target=cast, args=(CASTS // count,))
+        for i in range(count)
+    ]
+    threads.append(threading.Thread(target=register, args=(classes,)))
+    start = time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop = time()
+    lost = sum(not Increments.implemented_by(cls) for cls in classes)
+    print(count, 'threads', stop - start, 'lost registrations', lost)
+
+
+def main():
+    for count in (1, 2, 4, 8):
+        test_threads(count)
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,18 @@
 from ._jute import (
-    Attribute, Interface, Opaque, DynamicInterface, implements,
-    underlying_object, InterfaceConformanceError, InvalidAttributeName
+    Attribute, Interface, Opaque, DynamicInterface, implements, all_of,
+    returns_interface, yields, blocking, underlying_object,
+    InterfaceConformanceError, InvalidAttributeName
 )
+from ._adapt import adapt, adapt_all, register_adapter
+from ._batch import batched
+from ._cache import cached
+from ._columns import Columns
+from ._dispatch import dispatch, AmbiguousDispatchError
+from ._make import make_interface
+from ._pool import Pool
+from ._process import ProcessPool
+from ._protocol import as_abc
+from ._slots import provider_class
 
 __all__ = [
     'Attribute',
@@ -9,7 +20,32 @@ __all__ = [
     'Opaque',
     'DynamicInterface',
     'implements',
+    'all_of',
+    'adapt',
+    'adapt_all',
+    'register_adapter',
+    'dispatch',
+    'as_abc',
+    'returns_interface',
+    'yields',
+    'blocking',
+    'cached',
+    'batched',
     'underlying_object',
+    'make_interface',
+    'Columns',
+    'provider_class',
+    'Pool',
+    'ProcessPool',
     'InterfaceConformanceError',
     'InvalidAttributeName',
+    'AmbiguousDispatchError',
 ]
+
+try:
+    from ._protocol import as_protocol
+except ImportError:
+    # Python 3.7 has no `typing.Protocol`.
+    pass
+else:
+    __all__.append('as_protocol')
@@ -0,0 +1,185 @@
+"""
+Adaptation of objects to interfaces.
+"""
+
+import itertools
+import weakref
+
+from . import _jute
+from ._jute import DynamicInterface, Interface, underlying_object
+
+
+# Map each interface to the adapters that produce it, as tuples of
+# (order, source, factory, target).  Adapters to an interface are also
+# listed under its super-interfaces.
+_adapters = {}
+_order = itertools.count()
+
+# The registry version, and the factory resolved for each class and
+# interface.  The cache is replaced when the registry changes.
+_resolved = (-1, weakref.WeakKeyDictionary())
+
+# Resolution for a class that implements the interface.
+_PROVIDED = object()
+
+_MISSING = object()
+
+
+def register_adapter(source, target, factory=None):
+    '''
+    Register a factory adapting objects to an interface.
+
+    *source* is a class or an interface.  The factory is used for
+    instances of the class, or objects providing the interface, that do
+    not provide the *target* interface themselves.  It is called with the
+    object and returns an object providing the *target* interface::
+
+        jute.register_adapter(str, IPath, Path)
+
+    If *factory* is not given, return a decorator registering the
+    decorated function::
+
+        @jute.register_adapter(IReadable, IWritable)
+        def to_writable(readable):
+            """Wrap a readable object in a buffer that can be written."""
+
+    An adapter to an interface also adapts to its super-interfaces.
+    '''
+    if not isinstance(target, Interface):
+        raise TypeError('Adapter target {!r} is not an interface'.format(
+            target))
+    if not isinstance(source, type):
+        raise TypeError('Adapter source {!r} is not a class'.format(source))
+    if factory is None:
+        def decorator(func):
+            register_adapter(source, target, func)
+            return func
+        return decorator
+    with _jute._registry_lock:
+        adapter = (next(_order), source, factory, target)
+        for base in target.__mro__:
+            if isinstance(base, Interface):
+                _adapters[base] = _adapters.get(base, ()) + (adapter,)
+        _jute._registry_added()
+    return factory
+
+
+def _resolve(cls, interface):
+    # Prefer adapters from classes earlier in the MRO, then adapters from
+    # more specific interfaces.  Prefer adapters declared for the
+    # interface itself over those for sub-interfaces, then the most
+    # recently registered.
+    if not isinstance(interface, Interface):
+        raise TypeError('Cannot adapt to non-interface type {!r}'.format(
+            interface))
+    if interface.implemented_by(cls):
+        return _PROVIDED
+    mro = cls.__mro__
+    best = None
+    best_rank = None
+    for order, source, factory, target in _adapters.get(interface, ()):
+        if isinstance(source, Interface):
+            if not source.implemented_by(cls):
+                continue
+            rank = (len(mro) + 1, -len(source.__mro__))
+        elif source in mro:
+            rank = (mro.index(source), 0)
+        elif issubclass(cls, source):
+            rank = (len(mro), 0)
+        else:
+            continue
+        rank += (target is not interface, -order)
+        if best_rank is None or rank < best_rank:
+            best = factory
+            best_rank = rank
+    return best
+
+
+def _factory(cls, interface):
+    global _resolved
+    version, resolved = _resolved
+    if version != _jute._version:
+        with _jute._registry_lock:
+            if _resolved[0] != _jute._version:
+                _resolved = (_jute._version, weakref.WeakKeyDictionary())
+            version, resolved = _resolved
+    factories = resolved.get(cls)
+    if factories is None:
+        factories = resolved.setdefault(cls, {})
+    try:
+        return factories[interface]
+    except KeyError:
+        # If the registry changes during resolution, the result is stored
+        # in a cache that has already been replaced.
+        factory = factories[interface] = _resolve(cls, interface)
+        return factory
+
+
+def _dynamic_factory(provider, interface):
+    # Objects providing source interfaces dynamically are checked for
+    # each object.
+    if not DynamicInterface.implemented_by(type(provider)):
+        return None
+    for order, source, factory, target in reversed(
+            _adapters.get(interface, ())):
+        if isinstance(source, Interface) and source.provided_by(provider):
+            return factory
+    return None
+
+
+def _adapt(obj, provider, interface, factory, default):
+    if factory is _PROVIDED:
+        return interface(obj)
+    if factory is None:
+        if interface.provided_by(provider):
+            return interface(obj)
+        factory = _dynamic_factory(provider, interface)
+        if factory is None:
+            if default is not _MISSING:
+                return default
+            raise TypeError(
+                'Object {} does not provide interface {}, and has no'
+                ' adapter'.format(obj, interface.__name__))
+    return interface(factory(provider))
+
+
+def adapt(obj, interface, default=_MISSING):
+    """
+    Return an interface object for the object, adapting it if required.
+
+    If the object provides the interface, this is the same as casting
+    the object to the interface.  Otherwise, the best adapter registered
+    using :py:func:`register_adapter` is called, and its result is cast
+    to the interface.
+
+    Adapters registered for a class in the object's MRO are preferred
+    over adapters registered for an interface that the object provides,
+    and adapters for nearer classes or more specific interfaces are
+    preferred.  Of equally good adapters, the most recently registered
+    is used.  The adapter chosen for each class is cached until the
+    registry changes.
+
+    If the object cannot be adapted, return *default* if given, or raise
+    :py:exc:`TypeError`.
+    """
+    provider = underlying_object(obj)
+    factory = _factory(type(provider), interface)
+    return _adapt(obj, provider, interface, factory, default)
+
+
+def adapt_all(objects, interface, default=_MISSING):
+    """
+    Adapt each object in an iterable to the interface.
+
+    Return an iterator of interface objects, as returned by
+    :py:func:`adapt`.  The adapter for each class is only looked up once.
+    """
+    factories = {}
+    for obj in objects:
+        provider = underlying_object(obj)
+        cls = type(provider)
+        try:
+            factory = factories[cls]
+        except KeyError:
+            factory = factories[cls] = _factory(cls, interface)
+        yield _adapt(obj, provider, interface, factory, default)
@@ -0,0 +1,180 @@
+"""
+Coalescing of single calls into batch calls.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+import types
+
+from ._jute import Attribute, InterfaceConformanceError
+
+
+class _Batch:
+
+    """Arguments of calls waiting for a batch call, and its results."""
+
+    __slots__ = ('args', 'results', 'error', 'done')
+
+    def __init__(self):
+        self.args = []
+        self.results = None
+        self.error = None
+        self.done = None
+
+
+def _check_results(results, args):
+    """Return the results of a batch call as a list, one for each call."""
+    results = list(results)
+    if len(results) != len(args):
+        raise ValueError(
+            'Batch method returned {} results for {} arguments'.format(
+                len(results), len(args)))
+    return results
+
+
+class _Batcher:
+
+    """
+    Coalesce calls of one interface method into calls of a batch method.
+
+    Calls for the same provider that arrive while a batch is pending are
+    added to the batch.  The first call of a batch waits for the window,
+    makes the batch call, and passes the results to the other calls.
+    """
+
+    def __init__(self, batch_name, window):
+        self.batch_name = batch_name
+        self.window = window
+        self.lock = threading.Lock()
+        self.pending = {}
+
+    def check_declaration(self, interface_name, name, provider_attributes):
+        """Check that the batch method is a method of the interface."""
+        validators = provider_attributes.get(self.batch_name, ())
+        if not any(
+            isinstance(validator, types.FunctionType)
+            for validator in validators
+        ) or any(isinstance(validator, Attribute) for validator in validators):
+            raise InterfaceConformanceError(
+                'Batch method {!r} of {!r} in interface {!r} must be a method'
+                ' of the interface'.format(
+                    self.batch_name, name, interface_name))
+
+    def __call__(self, provider, method):
+        """Return the method of a provider, wrapped to use batch calls."""
+        batch_method = getattr(provider, self.batch_name)
+        if inspect.iscoroutinefunction(method):
+            async def batched_method(arg):
+                return await self._call_async(provider, batch_method, arg)
+        else:
+            def batched_method(arg):
+                return self._call(provider, batch_method, arg)
+        return batched_method
+
+    def _take(self, key, batch):
+        """Stop a batch accepting calls."""
+        with self.lock:
+            if self.pending.get(key) is batch:
+                del self.pending[key]
+
+    def _call(self, provider, batch_method, arg):
+        key = id(provider)
+        with self.lock:
+            batch = self.pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self.pending[key] = _Batch()
+                batch.done = threading.Event()
+            index = len(batch.args)
+            batch.args.append(arg)
+        if leader:
+            if self.window:
+                time.sleep(self.window)
+            self._take(key, batch)
+            try:
+                batch.results = _check_results(
+                    batch_method(batch.args), batch.args)
+            except BaseException as e:
+                batch.error = e
+            batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.results[index]
+
+    async def _call_async(self, provider, batch_method, arg):
+        loop = asyncio.get_running_loop()
+        # Calls on different event loops are batched separately.
+        key = (id(provider), id(loop))
+        with self.lock:
+            batch = self.pending.get(key)
+            if batch is None:
+                batch = self.pending[key] = _Batch()
+                batch.done = loop.create_future()
+                if self.window:
+                    loop.call_later(
+                        self.window, self._flush_async, key, batch,
+                        batch_method)
+                else:
+                    # Batch the calls made in the same event loop tick.
+                    loop.call_soon(self._flush_async, key, batch, batch_method)
+            index = len(batch.args)
+            batch.args.append(arg)
+        results = await asyncio.shield(batch.done)
+        return results[index]
+
+    def _flush_async(self, key, batch, batch_method):
+        self._take(key, batch)
+        asyncio.ensure_future(self._run_async(batch, batch_method))
+
+    async def _run_async(self, batch, batch_method):
+        try:
+            results = _check_results(
+                await batch_method(batch.args), batch.args)
+        except BaseException as e:
+            batch.done.set_exception(e)
+        else:
+            batch.done.set_result(results)
+
+
+def batched(batch_name, *, window=0.001):
+    '''
+    Decorator to coalesce calls of a method into calls of a batch method.
+
+    Decorate a single-argument interface method with the name of a batch
+    method, also declared in the interface, that takes a list of
+    arguments and returns a list of results in the same order::
+
+        class IStore(jute.Opaque):
+
+            @jute.batched('get_many')
+            def get(self, key):
+                """Return the value for a key."""
+
+            def get_many(self, keys):
+                """Return the values for a list of keys."""
+
+    Calls through the interface for the same provider are collected for
+    *window* seconds, and made as one call to the batch method.  Each
+    caller receives its own result, or the exception raised by the batch
+    method.  A call that starts a batch waits for the window, even if no
+    other calls arrive, so use batching for methods whose round trip is
+    much slower than the window.
+
+    For ``async def`` methods, the batch method must also be ``async
+    def``.  Calls awaited on the same event loop are collected without
+    blocking the loop, and a *window* of 0 batches the calls made in the
+    same event loop iteration, e.g. using :py:func:`asyncio.gather`.
+    '''
+    if window < 0:
+        raise ValueError('Batch window must not be negative')
+
+    def decorator(func):
+        if func.__name__.startswith('__') and func.__name__.endswith('__'):
+            raise TypeError('batched cannot decorate special methods')
+        func._jute_wrapper = _Batcher(batch_name, window)
+        return func
+    return decorator
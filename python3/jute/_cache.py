@@ -0,0 +1,179 @@
+"""
+Caching of pure interface methods.
+"""
+
+import collections
+import inspect
+import threading
+import time
+import weakref
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+# Separates positional from keyword arguments in cache keys.
+_KEYWORDS = object()
+
+
+def _make_key(args, kwargs):
+    if kwargs:
+        return args + (_KEYWORDS,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+class _MethodCache:
+
+    """
+    The caches of one interface method, for all providers.
+
+    Each provider has its own cache, so every interface object wrapping
+    the same provider shares the cached results.  A provider's cache is
+    discarded when the provider is garbage collected.
+    """
+
+    def __init__(self, maxsize, ttl, key):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.key = key
+        # Re-entrant, as garbage collection can discard a provider's
+        # cache while the lock is held.
+        self.lock = threading.RLock()
+        self.caches = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _entries(self, provider):
+        """Return the cache for a provider, or None if it cannot be kept."""
+        ident = id(provider)
+        with self.lock:
+            entries = self.caches.get(ident)
+            if entries is None:
+                try:
+                    weakref.finalize(provider, self._discard, ident)
+                except TypeError:
+                    # The cache cannot be discarded with the provider, so
+                    # providers without weak reference support are not
+                    # cached.
+                    return None
+                entries = self.caches[ident] = collections.OrderedDict()
+            return entries
+
+    def _discard(self, ident):
+        with self.lock:
+            self.caches.pop(ident, None)
+
+    def _lookup(self, entries, key):
+        """Return whether a key is cached, and its value."""
+        with self.lock:
+            entry = entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or time.monotonic() < expires:
+                    entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del entries[key]
+            self.misses += 1
+            return False, None
+
+    def _store(self, entries, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            entries[key] = (value, expires)
+            if self.maxsize is not None:
+                while len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+
+    def __call__(self, provider, method):
+        """Return the method of a provider, wrapped to use the cache."""
+        entries = self._entries(provider)
+        if entries is None:
+            return method
+        key_func = self.key
+
+        if inspect.iscoroutinefunction(method):
+            async def cached_method(*args, **kwargs):
+                if key_func is None:
+                    key = _make_key(args, kwargs)
+                else:
+                    key = key_func(*args, **kwargs)
+                found, value = self._lookup(entries, key)
+                if not found:
+                    value = await method(*args, **kwargs)
+                    self._store(entries, key, value)
+                return value
+        else:
+            def cached_method(*args, **kwargs):
+                if key_func is None:
+                    key = _make_key(args, kwargs)
+                else:
+                    key = key_func(*args, **kwargs)
+                found, value = self._lookup(entries, key)
+                if not found:
+                    value = method(*args, **kwargs)
+                    self._store(entries, key, value)
+                return value
+        return cached_method
+
+    def info(self):
+        """Return the hits, misses, maxsize and size of the caches."""
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize,
+                sum(map(len, list(self.caches.values()))))
+
+    def clear(self, provider=None):
+        """Clear the cache of a provider, or of all providers."""
+        with self.lock:
+            if provider is None:
+                for entries in list(self.caches.values()):
+                    entries.clear()
+                self.hits = self.misses = 0
+            else:
+                entries = self.caches.get(id(provider))
+                if entries is not None:
+                    entries.clear()
+
+
+def cached(maxsize=128, ttl=None, key=None):
+    '''
+    Decorator to cache the results of a pure interface method.
+
+    Interface objects for the same provider share a cache, so every
+    provider of the interface gets caching without implementing it::
+
+        class IConfig(jute.Opaque):
+
+            @jute.cached(maxsize=256, ttl=60)
+            def lookup(self, name):
+                """Return the value of a configuration setting."""
+
+    The least recently used results are evicted when a provider's cache
+    holds more than *maxsize* results.  A *maxsize* of :py:obj:`None`
+    does not limit the cache.  If *ttl* is given, results expire that
+    many seconds after they are cached.  The cache key is made from the
+    call arguments, which must be hashable, unless a *key* function is
+    given.  The *key* function is called with the same arguments as the
+    method.
+
+    Only calls through the interface use the cache.  The declared
+    method's ``cache_info()`` returns the hits and misses for all
+    providers, and ``cache_clear(provider=None)`` clears the cache of a
+    provider, or of all providers.  Providers that do not support weak
+    references are not cached.
+    '''
+    if maxsize is not None and maxsize < 0:
+        raise ValueError('Cache maxsize must not be negative')
+    if ttl is not None and ttl <= 0:
+        raise ValueError('Cache ttl must be positive')
+
+    def decorator(func):
+        if func.__name__.startswith('__') and func.__name__.endswith('__'):
+            raise TypeError('cached cannot decorate special methods')
+        cache = _MethodCache(maxsize, ttl, key)
+        func._jute_wrapper = cache
+        func.cache_info = cache.info
+        func.cache_clear = cache.clear
+        return func
+    return decorator
@@ -0,0 +1,216 @@
+"""
+Columnar storage for interface providers.
+
+An interface made only of :py:class:`.Attribute` entries describes the
+shape of a record.  Instead of storing each record as a separate Python
+object, :py:class:`.Columns` stores each attribute in its own column,
+using a compact :py:mod:`array` where the attribute type allows it.
+"""
+
+import array
+import weakref
+
+from ._jute import Attribute, _register_verified, _registry_lock
+
+
+# Array type codes for attribute types that can be stored compactly.
+# Attributes of other types are stored in a list.  Arrays only store
+# values of exactly these types, as values of subclasses, such as
+# `bool`, would be read back as the base type.
+TYPECODES = {
+    int: 'q',
+    float: 'd',
+}
+
+
+def _attribute_types(interface, name):
+    types = []
+    for validator in interface._provider_attributes[name]:
+        if not isinstance(validator, Attribute):
+            raise TypeError(
+                'Columns cannot provide non-attribute {}.{}'.format(
+                    interface.__name__, name))
+        types.append(validator.type)
+    return types
+
+
+def _check_value(label, name, types, value):
+    for attribute_type in types:
+        if not isinstance(value, attribute_type):
+            raise TypeError(
+                '{}.{} requires type {}, got type {}'.format(
+                    label, name, attribute_type, type(value)
+                )
+            )
+        if attribute_type in TYPECODES and type(value) is not attribute_type:
+            raise TypeError(
+                '{}.{} stored in an array requires exactly type {}, got'
+                ' type {}'.format(label, name, attribute_type, type(value))
+            )
+
+
+def _mkproperty(label, name, position, types):
+    def get(row):
+        return row._columns[position][row._index]
+
+    def set(row, value):
+        _check_value(label, name, types, value)
+        row._columns[position][row._index] = value
+
+    return property(get, set)
+
+
+def _row_repr(row):
+    return '<{} row {}>'.format(type(row).__name__, row._index)
+
+
+# Row classes for each interface.  Weakly keyed, so that dynamically
+# created interfaces can be released.
+_row_classes = weakref.WeakKeyDictionary()
+
+
+def _row_class(interface):
+    """Return the class for rows of columns providing the interface."""
+    try:
+        return _row_classes[interface]
+    except KeyError:
+        pass
+    with _registry_lock:
+        # Another thread may have created the class while waiting.
+        cls = _row_classes.get(interface)
+        if cls is None:
+            cls = _row_classes[interface] = _mkrow_class(interface)
+        return cls
+
+
+def _mkrow_class(interface):
+    names = tuple(interface._provider_attributes)
+    namespace = {
+        '__slots__': ('_columns', '_index'),
+        '__repr__': _row_repr,
+        '_names': names,
+    }
+    # Rows refer to the interface by name only, so that the row class
+    # does not keep the interface alive.
+    label = repr(interface)
+    for position, name in enumerate(names):
+        types = _attribute_types(interface, name)
+        namespace[name] = _mkproperty(label, name, position, types)
+    cls = type('{}Row'.format(interface.__name__), (), namespace)
+    # Every row has every attribute, so rows do not need verification.
+    _register_verified(interface, cls)
+    return cls
+
+
+class Columns:
+
+    """
+    Store providers of an interface as columns of attribute values.
+
+    The interface must contain only :py:class:`.Attribute` entries.  Each
+    attribute is stored in a separate column.  Attributes with type
+    :py:class:`int` or :py:class:`float` are stored in an
+    :py:class:`array.array`, and other attributes in a :py:class:`list`.
+    Use *typecodes* to map attribute names to a different array type code.
+    Values of these attributes must be exactly :py:class:`int` or
+    :py:class:`float`, so that they are read back unchanged.  Instances
+    of subclasses, such as :py:class:`bool`, raise :py:exc:`TypeError`.
+
+    Indexing or iterating over the columns returns lightweight row objects
+    that provide the interface, reading and writing directly into the
+    columns::
+
+        class IPoint(jute.Opaque):
+            x = jute.Attribute(type=float)
+            y = jute.Attribute(type=float)
+
+        points = jute.Columns(IPoint)
+        points.append(x=1.0, y=2.0)
+        point = IPoint(points[0])
+
+    Array columns support the buffer protocol, so can be used for
+    vectorized operations without copying, e.g.
+    ``numpy.frombuffer(points.column('x'))``.
+    """
+
+    def __init__(self, interface, typecodes=None):
+        if typecodes is None:
+            typecodes = {}
+        self.interface = interface
+        self._row = _row_class(interface)
+        self.names = self._row._names
+        self._types = [
+            _attribute_types(interface, name) for name in self.names
+        ]
+        self._columns = []
+        for name, types in zip(self.names, self._types):
+            typecode = typecodes.get(name)
+            if typecode is None:
+                for attribute_type in types:
+                    typecode = TYPECODES.get(attribute_type)
+                    if typecode is not None:
+                        break
+            if typecode is None:
+                self._columns.append([])
+            else:
+                self._columns.append(array.array(typecode))
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Columns index out of range')
+        row = self._row.__new__(self._row)
+        row._columns = self._columns
+        row._index = index
+        return row
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def append(self, *args, **kwargs):
+        """
+        Append a row of attribute values.
+
+        Values can be passed positionally, in the order of :py:attr:`names`,
+        or by keyword.  Every attribute must be given a value.
+        """
+        if len(args) > len(self.names):
+            raise TypeError('Too many attribute values')
+        values = dict(zip(self.names, args))
+        for name in kwargs:
+            if name in values or name not in self.names:
+                raise TypeError('Unexpected attribute {!r}'.format(name))
+        values.update(kwargs)
+        if len(values) != len(self.names):
+            missing = [name for name in self.names if name not in values]
+            raise TypeError(
+                'Missing attributes {}'.format(
+                    ', '.join(repr(m) for m in missing)))
+        for name, types in zip(self.names, self._types):
+            _check_value(self.interface, name, types, values[name])
+        appended = 0
+        try:
+            for name, column in zip(self.names, self._columns):
+                column.append(values[name])
+                appended += 1
+        except Exception:
+            # Keep the columns the same length if an array rejects a value.
+            for column in self._columns[:appended]:
+                column.pop()
+            raise
+        self._length += 1
+
+    def column(self, name):
+        """Return the column of values for the named attribute."""
+        try:
+            return self._columns[self.names.index(name)]
+        except ValueError:
+            raise AttributeError(
+                '{!r} interface has no attribute {!r}'.format(
+                    self.interface.__name__, name)) from None
@@ -0,0 +1,201 @@
+"""
+Generic functions dispatching on the interfaces of their arguments.
+"""
+
+import functools
+import weakref
+
+from . import _jute
+from ._jute import DynamicInterface, Interface
+
+
+# Resolution for argument types that may provide interfaces dynamically,
+# which is resolved for each call.
+_DYNAMIC = object()
+
+
+class AmbiguousDispatchError(Exception):
+
+    """
+    Several implementations of a generic function are equally specific.
+
+    Raised when a generic function is called with arguments matched by
+    more than one implementation, where no implementation is more
+    specific than the others for every dispatched argument.  Register an
+    implementation for the combination to resolve the ambiguity.
+    """
+
+    def __init__(self, func, types, candidates):
+        self.func = func
+        self.types = types
+        self.candidates = candidates
+
+    def __str__(self):
+        return 'Ambiguous dispatch of {} for {}: {}'.format(
+            self.func.__qualname__,
+            ', '.join(cls.__qualname__ for cls in self.types),
+            '; '.join(
+                ', '.join(source.__qualname__ for source in sources)
+                for sources in self.candidates
+            )
+        )
+
+
+def _matches(cls, source):
+    """Return whether instances of the class match a dispatch source."""
+    if isinstance(source, Interface) and not isinstance(cls, Interface):
+        return source.implemented_by(cls)
+    # Interface objects only provide their interface and its bases.
+    return issubclass(cls, source)
+
+
+def _provides(obj, source):
+    """Return whether an object matches a dispatch source."""
+    cls = type(obj)
+    if isinstance(source, Interface) and not isinstance(cls, Interface):
+        return source.provided_by(obj)
+    return _matches(cls, source)
+
+
+def _narrower(first, second):
+    """Return whether a dispatch source is at least as specific."""
+    if first is second or second is object:
+        return True
+    if first is object:
+        return False
+    first_interface = isinstance(first, Interface)
+    if first_interface == isinstance(second, Interface):
+        return issubclass(first, second)
+    # A class matches fewer objects than an interface its instances
+    # provide.
+    return not first_interface
+
+
+def _best(func, classes, registry, matches):
+    candidates = [sources for sources in registry if matches(sources)]
+    best = [
+        sources for sources in candidates
+        if not any(
+            other != sources and all(map(_narrower, other, sources))
+            for other in candidates
+        )
+    ]
+    if len(best) > 1:
+        raise AmbiguousDispatchError(func, classes, best)
+    return registry[best[0]]
+
+
+def dispatch(func=None, *, args=1):
+    '''
+    Decorator to make a generic function dispatching on interfaces.
+
+    The decorated function is the default implementation.  Implementations
+    for arguments providing an interface, or instances of a class, are
+    added using the ``register`` method::
+
+        @jute.dispatch
+        def render(shape):
+            raise TypeError('Cannot render {!r}'.format(shape))
+
+        @render.register(ICircle)
+        def render_circle(circle):
+            """Render a circle."""
+
+    The first *args* positional arguments are dispatched on.  With
+    ``args=2``, each registration names two interfaces or classes,
+    using :py:obj:`object` for any argument.  The implementation used is
+    the most specific matching implementation for every dispatched
+    argument.  A sub-interface is more specific than its bases, and a
+    class is more specific than an interface.  If no single
+    implementation is most specific, :py:exc:`AmbiguousDispatchError` is
+    raised.
+
+    The implementation chosen for each combination of argument types is
+    cached until the registry changes, except for arguments that provide
+    interfaces dynamically, which are resolved for each call.
+    '''
+    if func is None:
+        return functools.partial(dispatch, args=args)
+    if args < 1:
+        raise ValueError('Generic functions must dispatch on an argument')
+    count = args
+    # Map the sources of each implementation to the implementation.  The
+    # registry is replaced, not changed, so it can be read without locking.
+    registry = {(object,) * count: func}
+    # The registry version, and the implementation for the types of the
+    # dispatched arguments, keyed by the first type, then the other types.
+    resolved = (-1, weakref.WeakKeyDictionary())
+
+    def resolve(classes):
+        for cls in classes:
+            if (
+                not isinstance(cls, Interface) and
+                DynamicInterface.implemented_by(cls)
+            ):
+                return _DYNAMIC
+        return _best(
+            func, classes, registry,
+            lambda sources: all(map(_matches, classes, sources))
+        )
+
+    def lookup(classes):
+        nonlocal resolved
+        version, cache = resolved
+        if version != _jute._version:
+            with _jute._registry_lock:
+                if resolved[0] != _jute._version:
+                    resolved = (_jute._version, weakref.WeakKeyDictionary())
+                version, cache = resolved
+        try:
+            return cache[classes[0]][classes[1:]]
+        except KeyError:
+            # If the registry changes during resolution, the result is
+            # stored in a cache that has already been replaced.
+            impl = resolve(classes)
+            cache.setdefault(classes[0], {})[classes[1:]] = impl
+            return impl
+
+    def register(*sources):
+        """
+        Register an implementation for arguments matching the sources.
+
+        Return a decorator, or, if the implementation is passed after
+        the sources, register it and return it.
+        """
+        if len(sources) == count + 1:
+            *sources, impl = sources
+            register(*sources)(impl)
+            return impl
+        if len(sources) != count:
+            raise TypeError('{} dispatches on {} arguments, got {}'.format(
+                func.__qualname__, count, len(sources)))
+        for source in sources:
+            if not isinstance(source, type):
+                raise TypeError(
+                    'Dispatch source {!r} is not a class'.format(source))
+
+        def decorator(impl):
+            nonlocal registry
+            with _jute._registry_lock:
+                registry = dict(registry)
+                registry[tuple(sources)] = impl
+                _jute._registry_added()
+            return impl
+        return decorator
+
+    def wrapper(*arguments, **kwargs):
+        if len(arguments) < count:
+            raise TypeError('{} requires {} positional arguments'.format(
+                func.__qualname__, count))
+        impl = lookup(tuple(map(type, arguments[:count])))
+        if impl is _DYNAMIC:
+            dispatched = arguments[:count]
+            impl = _best(
+                func, tuple(map(type, dispatched)), registry,
+                lambda sources: all(map(_provides, dispatched, sources))
+            )
+        return impl(*arguments, **kwargs)
+
+    wrapper.register = register
+    functools.update_wrapper(wrapper, func)
+    return wrapper
@@ -23,7 +23,192 @@ can be used to allow interface checks during debugging, and production
 code to use the original objects by running Python with the ``-O`` flag.
 """
 
+import abc
+import asyncio
+import copyreg
+import functools
+import itertools
+import threading
 import types
+import weakref
+
+
+# Registrations take this lock, so casts can read the registry without
+# locking.  Each removal from the registry increments the generation, so
+# caches of classes known to provide an interface can detect changes.
+# Each registration or removal increments the version, for caches that
+# depend on classes not providing an interface.
+_registry_lock = threading.RLock()
+_generation = 0
+_version = 0
+
+
+def _registry_changed():
+    """Mark the registry as changed.  Call with the registry lock held."""
+    global _generation
+    _generation += 1
+    _registry_added()
+
+
+def _registry_added():
+    """Mark a registry addition.  Call with the registry lock held."""
+    global _version
+    _version += 1
+
+
+class ClassSet:
+
+    """
+    A set of classes, held by weak references.
+
+    Classes are removed from the set when they are garbage collected, so
+    the set does not keep dynamically created classes alive.  Each class
+    is stored with the interfaces it was added through, so that it can
+    be removed for one interface and kept for others.
+
+    Reads take no lock.  Changes are made with the registry lock held.
+    """
+
+    __slots__ = ('_entries', '_checks', '_checked', '__weakref__')
+
+    def __init__(self):
+        # Map the id of each class to a weak reference to the class, and
+        # weak references to the interfaces it was added through.
+        self._entries = {}
+        # Weak references to classes that customise subclass checks
+        # (e.g. abstract base classes and protocols), which are checked
+        # using `issubclass`.
+        self._checks = ()
+        # The ABC cache token, and the result of the checks for each
+        # class.  Registering a class with any ABC changes the token.
+        self._checked = (None, None)
+
+    def _entry(self, cls):
+        entry = self._entries.get(id(cls))
+        # The id of a collected class can be reused by a new class.
+        if entry is not None and entry[0]() is cls:
+            return entry
+        return None
+
+    def __contains__(self, cls):
+        return self._entry(cls) is not None
+
+    def __iter__(self):
+        for ref, sources in list(self._entries.values()):
+            cls = ref()
+            if cls is not None:
+                yield cls
+
+    def __len__(self):
+        return sum(1 for cls in self)
+
+    def claims(self, cls):
+        """Return whether the set contains the class or a superclass."""
+        entries = self._entries
+        for base in cls.__mro__:
+            entry = entries.get(id(base))
+            if entry is not None and entry[0]() is base:
+                return True
+        if self._checks:
+            return self._check(cls)
+        return False
+
+    def _check(self, cls):
+        # Subclass checks of protocols inspect the class attributes, and
+        # can be slow, so the result is kept for each class.
+        token = abc.get_cache_token()
+        checked_token, checked = self._checked
+        if checked_token != token:
+            checked = weakref.WeakKeyDictionary()
+            self._checked = (token, checked)
+        result = checked.get(cls)
+        if result is None:
+            result = checked[cls] = any(
+                check is not None and issubclass(cls, check)
+                for check in (ref() for ref in self._checks)
+            )
+        return result
+
+    def add(self, cls, source=None):
+        """Add a class to the set, through the interface *source*."""
+        with _registry_lock:
+            entry = self._entry(cls)
+            if entry is None:
+                ref = weakref.ref(cls, self._remover(id(cls)))
+                if type(cls).__subclasscheck__ is not type.__subclasscheck__:
+                    self._checks += (ref,)
+                    self._checked = (None, None)
+                sources = frozenset()
+            else:
+                ref, sources = entry
+            if source is not None:
+                sources |= {weakref.ref(source)}
+            self._entries[id(cls)] = (ref, sources)
+
+    def discard(self, cls, source):
+        """
+        Remove a class from the set, for the interface *source*.
+
+        The class stays in the set if it was also added through other
+        interfaces.
+        """
+        with _registry_lock:
+            entry = self._entry(cls)
+            if entry is None:
+                return
+            ref, sources = entry
+            sources = sources - {weakref.ref(source)}
+            if sources:
+                self._entries[id(cls)] = (ref, sources)
+            else:
+                self._remove(id(cls), ref)
+
+    def _remove(self, ident, ref):
+        if self._entries.get(ident, (None,))[0] is ref:
+            del self._entries[ident]
+        if ref in self._checks:
+            self._checks = tuple(
+                check for check in self._checks if check is not ref)
+            self._checked = (None, None)
+
+    def _remover(self, ident):
+        # The callback refers to the set weakly, so registered classes do
+        # not keep the set alive.
+        selfref = weakref.ref(self)
+
+        def remove(ref):
+            classes = selfref()
+            if classes is not None:
+                with _registry_lock:
+                    classes._remove(ident, ref)
+        return remove
+
+
+class ClassCache:
+
+    """
+    A set of classes known to provide an interface.
+
+    Reads take no lock.  The cache is emptied when a class is removed
+    from the registry, as the classes in the cache may no longer provide
+    the interface.  Classes are held by weak references.
+    """
+
+    __slots__ = ('_generation', '_classes')
+
+    def __init__(self):
+        self._generation = _generation
+        self._classes = ClassSet()
+
+    def __contains__(self, cls):
+        return self._generation == _generation and cls in self._classes
+
+    def add(self, cls):
+        with _registry_lock:
+            if self._generation != _generation:
+                self._classes = ClassSet()
+                self._generation = _generation
+            self._classes.add(cls)
 
 
 def mkmessage(obj, missing):
@@ -124,6 +309,19 @@ def mkdefault(name):
     return handle
 
 
+def handle_buffer(self, flags):
+    # Export the provider's own memory.  Python 3.12+ (PEP 688) calls
+    # this when the interface is used as a buffer (e.g. `memoryview`,
+    # `bytes`, or `numpy.frombuffer`), so no copy is made.
+    return memoryview(_getattribute(self, 'provider'))
+
+
+def handle_release_buffer(self, view):
+    # Release the view exported by `handle_buffer` straight away, so the
+    # provider is unlocked (e.g. a `bytearray` can be resized again).
+    view.release()
+
+
 def handle_call(self, *args, **kwargs):
     return _getattribute(self, 'provider')(*args, **kwargs)
 
@@ -171,9 +369,82 @@ def handle_getattribute(self, name):
     if name in _getattribute(self, '_provider_attributes'):
         return getattr(_getattribute(self, 'provider'), name)
     else:
-        raise AttributeError(
-            "{!r} interface has no attribute {!r}".format(
-                _getattribute(self, '__class__').__name__, name))
+        return missing_attribute(self, name)
+
+
+def handle_getattribute_wrapped(self, name):
+    """
+    Check and return an attribute for an interface with wrapped methods.
+
+    This replaces :py:func:`handle_getattribute` for interfaces that
+    declare method wrappers (e.g. using :py:func:`cached`).  A method
+    with a wrapper is returned wrapped for the provider.
+    """
+    if name in _getattribute(self, '_provider_attributes'):
+        provider = _getattribute(self, 'provider')
+        value = getattr(provider, name)
+        wrapper = _getattribute(self, '_method_wrappers').get(name)
+        if wrapper is None:
+            return value
+        return wrapper(provider, value)
+    else:
+        return missing_attribute(self, name)
+
+
+def missing_attribute(self, name):
+    """
+    Return an attribute that is not declared in the interface.
+
+    Only ``__reduce_ex__`` is returned, so that :py:mod:`pickle` and
+    :py:mod:`copy` can save the interface object.  Other names raise an
+    :py:exc:`AttributeError`.
+    """
+    if name == '__reduce_ex__':
+        return types.MethodType(reduce_interface, self)
+    raise AttributeError(
+        "{!r} interface has no attribute {!r}".format(
+            _getattribute(self, '__class__').__name__, name))
+
+
+def reduce_interface(self, protocol):
+    """
+    Reduce an interface object to its interface and provider.
+
+    The interface is saved by reference, so a pickle containing many
+    interface objects saves the interface once, and refers to it for
+    each object.
+    """
+    # Get the provider first, as a lazy interface object changes its
+    # class to the interface when the provider is created.
+    provider = _getattribute(self, 'provider')
+    return rewrap, (_getattribute(self, '__class__'), provider)
+
+
+def rewrap(interface, provider):
+    """
+    Wrap an unpickled provider with an interface.
+
+    Each provider class is checked to provide the interface once, and
+    later providers of a known class are wrapped without checking them
+    again.  Dynamic providers may differ for each instance, so are
+    always checked.
+    """
+    provider_type = type(provider)
+    known = interface.__dict__.get('_unpickled')
+    if known is None:
+        with _registry_lock:
+            known = interface.__dict__.get('_unpickled')
+            if known is None:
+                known = ClassCache()
+                type.__setattr__(interface, '_unpickled', known)
+    if provider_type not in known:
+        if interface._verified.claims(provider_type):
+            known.add(provider_type)
+        else:
+            interface.raise_if_not_provided_by(provider)
+            if interface.implemented_by(provider_type):
+                known.add(provider_type)
+    return type.__call__(interface, provider)
 
 
 def handle_init(self, provider):
@@ -183,14 +454,116 @@ def handle_init(self, provider):
     object.__setattr__(self, 'provider', provider)
 
 
+def handle_enter(self):
+    provider = _getattribute(self, 'provider')
+    try:
+        enter = type(provider).__enter__
+    except AttributeError:
+        raise unsupported(provider, '__enter__') from None
+    return enter(provider)
+
+
+def handle_enter_returns_interface(self):
+    """Enter the provider's context, returning this interface."""
+    provider = _getattribute(self, 'provider')
+    result = handle_enter(self)
+    if result is provider:
+        return self
+    return result
+
+
+def handle_exit(self, exc_type, exc_value, traceback):
+    # Pass through the return value, so that a provider can suppress
+    # an exception raised in the `with` block by returning True.
+    provider = _getattribute(self, 'provider')
+    try:
+        exit = type(provider).__exit__
+    except AttributeError:
+        raise unsupported(provider, '__exit__') from None
+    return exit(provider, exc_type, exc_value, traceback)
+
+
 def handle_iter(self):
     return iter(_getattribute(self, 'provider'))
 
 
+def handle_iter_returns_interface(self):
+    """Get an iterator, returning this interface for self-iterators."""
+    provider = _getattribute(self, 'provider')
+    iterator = iter(provider)
+    if iterator is provider:
+        return self
+    return iterator
+
+
 def handle_next(self):
     return next(_getattribute(self, 'provider'))
 
 
+def unsupported(provider, name):
+    return TypeError('{!r} object does not support {}'.format(
+        type(provider).__name__, name))
+
+
+# Asynchronous special methods return the provider's awaitable directly,
+# rather than awaiting it in a coroutine of their own. This avoids
+# creating an extra coroutine object for each call, making an async
+# interface as cheap as a synchronous one.
+
+def handle_aiter(self):
+    provider = _getattribute(self, 'provider')
+    try:
+        aiter = type(provider).__aiter__
+    except AttributeError:
+        raise unsupported(provider, '__aiter__') from None
+    return aiter(provider)
+
+
+def handle_aiter_returns_interface(self):
+    """Get an async iterator, returning this interface for self-iterators."""
+    provider = _getattribute(self, 'provider')
+    iterator = handle_aiter(self)
+    if iterator is provider:
+        return self
+    return iterator
+
+
+def handle_anext(self):
+    provider = _getattribute(self, 'provider')
+    try:
+        anext = type(provider).__anext__
+    except AttributeError:
+        raise unsupported(provider, '__anext__') from None
+    return anext(provider)
+
+
+def handle_aenter(self):
+    provider = _getattribute(self, 'provider')
+    try:
+        aenter = type(provider).__aenter__
+    except AttributeError:
+        raise unsupported(provider, '__aenter__') from None
+    return aenter(provider)
+
+
+async def handle_aenter_returns_interface(self):
+    """Enter the provider's async context, returning this interface."""
+    provider = _getattribute(self, 'provider')
+    result = await handle_aenter(self)
+    if result is provider:
+        return self
+    return result
+
+
+def handle_aexit(self, exc_type, exc_value, traceback):
+    provider = _getattribute(self, 'provider')
+    try:
+        aexit = type(provider).__aexit__
+    except AttributeError:
+        raise unsupported(provider, '__aexit__') from None
+    return aexit(provider, exc_type, exc_value, traceback)
+
+
 def handle_setattr(self, name, value):
     """
     Set an attribute on an interface.
@@ -223,28 +596,230 @@ def handle_repr(self):
         _getattribute(self, 'provider'))
 
 SPECIAL_METHODS = {
+    '__buffer__': handle_buffer,
+    '__release_buffer__': handle_release_buffer,
     '__call__': handle_call,
+    '__enter__': handle_enter,
+    '__exit__': handle_exit,
     '__iter__': handle_iter,
     '__next__': handle_next,
+    '__aiter__': handle_aiter,
+    '__anext__': handle_anext,
+    '__aenter__': handle_aenter,
+    '__aexit__': handle_aexit,
 }
 
+# Alternative special methods for context managers declared using the
+# `returns_interface` decorator.
+RETURNS_INTERFACE_METHODS = {
+    '__enter__': handle_enter_returns_interface,
+    '__iter__': handle_iter_returns_interface,
+    '__aenter__': handle_aenter_returns_interface,
+    '__aiter__': handle_aiter_returns_interface,
+}
 
-def _validate_function(validators, func, args, kwargs):
-    """
-    Validate a function call using a series of validators.
 
-    Each validator is called in sequence. If a validator returns a
-    generator, the generator is run to the first yield, the function is
-    called, and the result is sent to the generator. Sends are performed
-    in the opposite order to the initial validation.
-    """
+def returns_interface(func):
+    '''
+    Decorator to make an interface method return the interface.
+
+    A context manager's ``__enter__`` method commonly returns the context
+    manager itself, so ``with face as x`` gives ``x`` the provider, with
+    access to all its attributes.  Similarly, an iterator's ``__iter__``
+    method returns the iterator itself, so a ``for`` loop would use the
+    provider's ``__next__`` method, not the interface's.  Decorating the
+    ``__enter__``, ``__iter__``, ``__aenter__`` or ``__aiter__`` method
+    in the interface definition makes the interface return itself
+    instead, whenever the provider returns itself::
+
+        class ILock(jute.Opaque):
+
+            @jute.returns_interface
+            def __enter__(self):
+                """Acquire the lock."""
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                """Release the lock."""
+
+    Other return values are passed through unchanged.
+    '''
+    if func.__name__ not in RETURNS_INTERFACE_METHODS:
+        raise TypeError(
+            'returns_interface can only decorate {}'.format(
+                ', '.join(sorted(RETURNS_INTERFACE_METHODS))))
+    func._jute_returns_interface = True
+    return func
+
+
+def mkyields(name, check):
+    if name == '__iter__':
+        def handle(self):
+            # `map` checks each item lazily, as it is produced.
+            return map(check, iter(_getattribute(self, 'provider')))
+    elif name == '__next__':
+        def handle(self):
+            return check(next(_getattribute(self, 'provider')))
+    else:
+        async def handle(self):
+            return check(await handle_anext(self))
+    return handle
+
+
+def mkspecial(name, declaration):
+    """Return the interface method for a declared special method."""
+    check = getattr(declaration, '_jute_yields', None)
+    if getattr(declaration, '_jute_returns_interface', False):
+        if check is not None:
+            # The method returns the provider or its items, not both.
+            raise TypeError(
+                'Cannot use both returns_interface and yields for '
+                '{}'.format(name))
+        return RETURNS_INTERFACE_METHODS[name]
+    if check is not None:
+        return mkyields(name, check)
+    func = SPECIAL_METHODS.get(name)
+    if func is None:
+        func = mkdefault(name)
+    return func
+
+
+def mkchecker(element, cast, sample):
+    """Return a function to check each item yielded by an iterator."""
+    # Classes whose instances are known to conform.  Conformance is
+    # verified once for each class, and then only the class is checked.
+    # Dynamic providers may differ for each instance, so are never added.
+    conforming = ClassCache()
+    if cast:
+        def check(item):
+            if type(item) is element:
+                return item
+            obj = underlying_object(item)
+            obj_type = type(obj)
+            if obj_type not in conforming:
+                element.raise_if_not_provided_by(obj)
+                if element.implemented_by(obj_type):
+                    conforming.add(obj_type)
+            return type.__call__(element, obj)
+        return check
+
+    if isinstance(element, Interface):
+        # Interface objects are checked, and remembered, by the class of
+        # the object they wrap.
+        def item_type(item):
+            return type(underlying_object(item))
+
+        def verify(item):
+            element.raise_if_not_provided_by(underlying_object(item))
+            return element.implemented_by(item_type(item))
+    else:
+        item_type = type
+
+        def verify(item):
+            if not isinstance(item, element):
+                raise TypeError(
+                    'Iterator requires type {}, got type {}'.format(
+                        element, type(item)))
+            return True
+
+    if sample == 1:
+        def check(item):
+            obj_type = item_type(item)
+            if obj_type not in conforming and verify(item):
+                conforming.add(obj_type)
+            return item
+    else:
+        counter = itertools.count()
+
+        def check(item):
+            if next(counter) % sample == 0:
+                obj_type = item_type(item)
+                if obj_type not in conforming and verify(item):
+                    conforming.add(obj_type)
+            return item
+    return check
+
+
+YIELDS_METHODS = frozenset(('__iter__', '__next__', '__anext__'))
+
+
+def yields(element, *, cast=None, sample=1):
+    '''
+    Decorator to declare the items produced by an iterator interface.
+
+    Decorate the ``__iter__``, ``__next__`` or ``__anext__`` method of an
+    interface to check each item as it is produced::
+
+        class IRows(jute.Opaque):
+
+            @jute.yields(IRow)
+            def __iter__(self):
+                """Iterate over the rows."""
+
+    For an iterator interface, also decorate ``__iter__`` with
+    :py:func:`returns_interface`, so that loops over the interface use
+    the checking ``__next__`` method.  A method cannot be decorated with
+    both decorators.
+
+    If *element* is an interface, each item is cast to the interface.
+    Pass ``cast=False`` to check that each item provides the interface,
+    but yield the original items.  If *element* is a type, each item
+    must be an instance of the type.
+
+    Conformance is verified once for each provider class, and later items
+    of the same class are only checked for their class.  For very
+    high-volume streams of unwrapped items, set *sample* to check only
+    one in every *sample* items.
+    '''
+    if cast is None:
+        cast = isinstance(element, Interface)
+    elif cast and not isinstance(element, Interface):
+        raise TypeError('Cannot cast iterator items to non-interface type')
+    if sample < 1 or cast and sample != 1:
+        raise ValueError('Invalid sample rate for iterator items')
+    check = mkchecker(element, cast, sample)
+
+    def decorator(func):
+        if func.__name__ not in YIELDS_METHODS:
+            raise TypeError(
+                'yields can only decorate {}'.format(
+                    ', '.join(sorted(YIELDS_METHODS))))
+        func._jute_yields = check
+        return func
+    return decorator
+
+
+def blocking(func):
+    '''
+    Decorator to declare that an interface method blocks.
+
+    Providers commonly implement methods using blocking file, network or
+    database calls, or long computations.  Calls to methods declared as
+    blocking are run in an executor by :py:meth:`.Interface.async_view`,
+    so that they can be awaited without blocking the event loop::
+
+        class IParser(jute.Opaque):
+
+            @jute.blocking
+            def parse(self, path):
+                """Parse a file."""
+    '''
+    if func.__name__.startswith('__') and func.__name__.endswith('__'):
+        raise TypeError('blocking cannot decorate special methods')
+    func._jute_blocking = True
+    return func
+
+
+def _start_validators(validators, args, kwargs):
     result_handlers = []
     for validate_args in validators:
         handle_result = validate_args(*args, **kwargs)
         if handle_result is not None:
             next(handle_result)
             result_handlers.append(handle_result)
-    result = func(*args, **kwargs)
+    return result_handlers
+
+
+def _finish_validators(result_handlers, result):
     for handle_result in reversed(result_handlers):
         try:
             handle_result.send(result)
@@ -252,9 +827,57 @@ def _validate_function(validators, func, args, kwargs):
             pass
         else:
             raise RuntimeError('too many iterations')
+
+
+def _validate_function(validators, func, args, kwargs):
+    """
+    Validate a function call using a series of validators.
+
+    Each validator is called in sequence. If a validator returns a
+    generator, the generator is run to the first yield, the function is
+    called, and the result is sent to the generator. Sends are performed
+    in the opposite order to the initial validation.
+    """
+    result_handlers = _start_validators(validators, args, kwargs)
+    result = func(*args, **kwargs)
+    _finish_validators(result_handlers, result)
     return result
 
 
+async def _validate_coroutine(validators, func, args, kwargs):
+    """
+    Validate a coroutine function call using a series of validators.
+
+    This is the asynchronous version of :py:func:`_validate_function`.
+    The validators are the same synchronous functions or generators, but
+    the result sent to each generator is the awaited result of the call.
+    The call is awaited directly in this coroutine, so validation does
+    not create any additional tasks or closures.
+    """
+    result_handlers = _start_validators(validators, args, kwargs)
+    result = await func(*args, **kwargs)
+    _finish_validators(result_handlers, result)
+    return result
+
+
+def merge_validators(first, second):
+    """
+    Return a tuple of the validators in two tuples, without duplicates.
+
+    Validators in *first* come first, followed by any validators only in
+    *second*.  If *second* adds no validators, *first* is returned.
+    """
+    if first is second:
+        return first
+    added = tuple(
+        validator for validator in second
+        if not any(validator is existing for existing in first)
+    )
+    if not added:
+        return first
+    return first + added
+
+
 class Interface(type):
 
     """
@@ -292,18 +915,28 @@ class Interface(type):
         # Called when a new class is defined.  Use the dictionary of
         # declared attributes to create a mapping to the wrapped object
         class_attributes = meta._DEFAULT_ATTRIBUTES.copy()
+        # Base classes that are super-interfaces of this interface.  This
+        # interface provides all attributes from the base interfaces.
+        # The validators of each attribute are stored in a tuple, which
+        # is never modified, so tuples are shared with the bases, and
+        # attributes inherited along several paths are not duplicated.
+        base_interfaces = [
+            base for base in bases if isinstance(base, Interface)
+        ]
         provider_attributes = dict()
-        for base in bases:
-            if isinstance(base, Interface):
-                # base class is a super-interface of this interface
-                # This interface provides all attributes from the base
-                # interface
-                for key in base._provider_attributes:
-                    v = provider_attributes.get(key)
-                    if v is None:
-                        v = []
-                        provider_attributes[key] = v
-                    v.extend(base._provider_attributes[key])
+        method_wrappers = dict()
+        for base in base_interfaces:
+            method_wrappers.update(base._method_wrappers)
+            if not provider_attributes:
+                provider_attributes.update(base._provider_attributes)
+                continue
+            for key, validators in base._provider_attributes.items():
+                v = provider_attributes.get(key)
+                if v is None:
+                    provider_attributes[key] = validators
+                else:
+                    provider_attributes[key] = merge_validators(
+                        v, validators)
         for key, value in dct.items():
             # Almost all attributes on the interface are mapped to
             # return the equivalent attributes on the wrapped object.
@@ -317,9 +950,7 @@ class Interface(type):
                 raise InvalidAttributeName(key)
             elif key.startswith('__') and key.endswith('__'):
                 if isinstance(value, types.FunctionType):
-                    func = SPECIAL_METHODS.get(key)
-                    if func is None:
-                        func = mkdefault(key)
+                    func = mkspecial(key, value)
                     # Special methods (e.g. __call__, __iter__) bypass the
                     # usual getattribute machinery. To ensure that the
                     # interface behaves in the same way as the original
@@ -334,10 +965,8 @@ class Interface(type):
                     # that `__getattribute__` does not reject the name for
                     # the cases where Python does go through the usual
                     # process, e.g. a literal `x.__iter__`
-                    v = provider_attributes.get(key)
-                    if v is None:
-                        v = provider_attributes[key] = []
-                    v.append(func)
+                    provider_attributes[key] = (
+                        provider_attributes.get(key, ()) + (func,))
                 else:
                     # Add attribute to interface class, but not to provider
                     # instances.  This is appropriate for the interface
@@ -351,35 +980,60 @@ class Interface(type):
                 # Any other values (e.g. docstrings) are not accessible through
                 # provider instances.
                 if isinstance(value, Attribute):
-                    v = provider_attributes.get(key)
-                    if v is None:
-                        v = provider_attributes[key] = [value]
-                    else:
-                        # check that attribute subclasses previous types
-                        for attr in v:
-                            if not issubclass(value.type, attr.type):
-                                raise InterfaceConformanceError(
-                                    'Attribute {!r} in interface {!r} must'
-                                    ' subclass {}'.format(
-                                        key, name, attr.type
-                                    )
+                    # check that attribute subclasses previous types
+                    for attr in provider_attributes.get(key, ()):
+                        if not issubclass(value.type, attr.type):
+                            raise InterfaceConformanceError(
+                                'Attribute {!r} in interface {!r} must'
+                                ' subclass {}'.format(
+                                    key, name, attr.type
                                 )
-                        v = provider_attributes[key] = [value]
+                            )
+                    provider_attributes[key] = (value,)
+                    method_wrappers.pop(key, None)
                 elif isinstance(value, types.FunctionType):
-                    v = provider_attributes.get(key)
-                    if v is None:
-                        v = provider_attributes[key] = [value]
+                    provider_attributes[key] = (
+                        provider_attributes.get(key, ()) + (value,))
+                    # A redeclared method replaces any inherited wrapper.
+                    wrapper = getattr(value, '_jute_wrapper', None)
+                    if wrapper is None:
+                        method_wrappers.pop(key, None)
                     else:
-                        v.append(value)
+                        method_wrappers[key] = wrapper
                 # All values are added as class attributes, to allow
                 # interface method docstrings to be read.
                 class_attributes[key] = value
+        if (
+            len(base_interfaces) == 1 and
+            provider_attributes == base_interfaces[0]._provider_attributes
+        ):
+            # Share the attribute table of a single base interface if this
+            # interface declares no attributes of its own.
+            provider_attributes = base_interfaces[0]._provider_attributes
+        else:
+            # Tables are read-only, so that shared tables cannot be
+            # changed through one of the interfaces sharing them.
+            provider_attributes = types.MappingProxyType(provider_attributes)
+        for key, wrapper in method_wrappers.items():
+            # Wrappers that depend on other attributes of the interface
+            # check them here.
+            check = getattr(wrapper, 'check_declaration', None)
+            if check is not None:
+                check(name, key, provider_attributes)
         class_attributes['_provider_attributes'] = provider_attributes
+        class_attributes['_method_wrappers'] = method_wrappers
+        if method_wrappers:
+            class_attributes['__getattribute__'] = handle_getattribute_wrapped
         interface = super().__new__(meta, name, bases, class_attributes)
         # An object wrapped by (a subclass of) the interface is
         # guaranteed to provide the matching attributes.
-        interface._verified = (interface,)
-        interface._unverified = ()
+        interface._verified = ClassSet()
+        interface._verified.add(interface, interface)
+        interface._unverified = ClassSet()
+        # Provider classes checked by `cast`.
+        interface._cast_classes = ClassCache()
+        # The registry version, and the result of `_claim` for classes.
+        interface._claims = (None, None)
 
         return interface
 
@@ -387,10 +1041,20 @@ class Interface(type):
         # Calling interface(object) will call this function first.  We
         # get a chance to return the same object if suitable.
         """Cast the object to this interface."""
-        if type(obj) is interface:
+        obj_type = type(obj)
+        if obj_type is interface:
             # If the object to be cast is already an instance of this
             # interface, just return the same object.
             return obj
+        if (
+            not validate and isinstance(obj_type, Interface) and
+            issubclass(obj_type, interface)
+        ):
+            # An upcast from a sub-interface.  The provider was checked
+            # when it was cast to the sub-interface, which includes all
+            # the attributes of this interface, so it is not checked
+            # again.  Interface objects always wrap the underlying object.
+            return super().__call__(_getattribute(obj, 'provider'))
         interface.raise_if_not_provided_by(obj, validate)
         # If interface is provided by object, call type.__call__ which creates
         # a wrapper object to enforce only this interface.
@@ -409,7 +1073,118 @@ class Interface(type):
         should not rely on this behaviour, but should call the
         :py:meth:`.provided_by` method directly.
         """
-        return interface.provided_by(instance)
+        obj_type = type(instance)
+        claim = interface._claim(obj_type)
+        if claim is None:
+            return interface.provided_by(instance)
+        return claim
+
+    def _claim(interface, cls):
+        """
+        Return whether instances of the class claim to provide the interface.
+
+        Return :py:obj:`None` if instances may provide the interface
+        dynamically.  The result is kept for each class until the registry
+        changes.
+        """
+        version = (_version, abc.get_cache_token())
+        claims_version, claims = interface._claims
+        if claims_version != version:
+            claims = weakref.WeakKeyDictionary()
+            interface._claims = (version, claims)
+        try:
+            return claims[cls]
+        except KeyError:
+            if interface.implemented_by(cls):
+                claim = True
+            elif DynamicInterface.implemented_by(cls):
+                claim = None
+            else:
+                claim = False
+            claims[cls] = claim
+            return claim
+
+    def __and__(interface, other):
+        """Return the intersection of two interfaces (see `all_of`)."""
+        if not isinstance(other, Interface):
+            return NotImplemented
+        return all_of(interface, other)
+
+    def lazy(interface, factory):
+        """
+        Return an interface object whose provider is created when needed.
+
+        The returned object provides the interface immediately, but
+        *factory* is only called, with no arguments, the first time an
+        attribute or special method of the interface is used.  The object
+        returned by the factory is then checked to provide the interface,
+        and becomes the provider.  Later accesses take the same path as
+        any other interface object.  If several threads use the object
+        at the same time, the factory is only called once.
+
+        If the factory raises an exception, or returns an object that
+        does not provide the interface, the exception is raised by the
+        access, and the factory is called again on the next access.
+        """
+        lazy_class = interface.__dict__.get('_lazy_class')
+        if lazy_class is None:
+            lazy_class = interface._mklazy()
+        face = object.__new__(lazy_class)
+        state = _getattribute(face, '__dict__')
+        state['_factory'] = factory
+        state['_lock'] = threading.Lock()
+        return face
+
+    def _mklazy(interface):
+        """Return the lazy subclass of the interface, creating it once."""
+        with _registry_lock:
+            lazy_class = interface.__dict__.get('_lazy_class')
+            if lazy_class is not None:
+                return lazy_class
+            # A subclass of the interface, whose `provider` attribute is a
+            # descriptor that creates the provider.  It adds no slots, so
+            # the created provider can be stored in the instance dictionary
+            # and the instance's class switched to the interface, removing
+            # the descriptor from future accesses.
+            namespace = {
+                '__module__': interface.__module__,
+                '__qualname__': interface.__qualname__,
+                '__slots__': (),
+                'provider': LazyProvider(interface),
+            }
+            lazy_class = type.__new__(
+                type(interface), interface.__name__, (interface,), namespace)
+            type.__setattr__(interface, '_lazy_class', lazy_class)
+            return lazy_class
+
+    def async_view(interface, obj, executor=None, validate=None):
+        """
+        Return an object to await the blocking methods of a provider.
+
+        The object is cast to the interface, with the same checks as
+        calling the interface, and the returned view allows access to the
+        attributes of the interface.  Methods declared with
+        :py:func:`blocking` return a coroutine that runs the method in
+        *executor*, or the event loop's default executor, and returns its
+        result::
+
+            parser = IParser.async_view(Parser(), executor=pool)
+            tree = await parser.parse(path)
+
+        Other attributes are returned unchanged.
+        """
+        blocking_methods = interface.__dict__.get('_blocking_methods')
+        if blocking_methods is None:
+            blocking_methods = frozenset(
+                name
+                for name, validators in interface._provider_attributes.items()
+                if any(
+                    getattr(validator, '_jute_blocking', False)
+                    for validator in validators
+                )
+            )
+            type.__setattr__(interface, '_blocking_methods', blocking_methods)
+        return AsyncView(interface(obj, validate), executor, blocking_methods)
 
     def cast(interface, source):
         '''
@@ -439,8 +1214,133 @@ class Interface(type):
             foo = IFoo(fb1)      # upcast does not need cast
             fb2 = IFooBar.cast(foo)  # downcast needs a cast
             baz = IBaz.cast(fb2)     # sidecast needs a cast
+
+        Downcasts and sidecasts check each provider class once, and later
+        casts of providers of the same class are not checked again.
         '''
-        return interface(underlying_object(source))
+        provider = underlying_object(source)
+        provider_type = type(provider)
+        if provider_type in interface._cast_classes:
+            return type.__call__(interface, provider)
+        face = interface(provider)
+        # Dynamic providers may differ for each instance, so are always
+        # checked.
+        if interface.implemented_by(provider_type):
+            interface._cast_classes.add(provider_type)
+        return face
+
+    def cursor(interface, iterable, validate=None):
+        """
+        Iterate over objects using a single reusable interface.
+
+        Each object produced by *iterable* is checked to provide the
+        interface, and then a single interface object is re-pointed at it::
+
+            for row in IRow.cursor(records):
+                total += row.value
+
+        This avoids creating an interface object for every item in large
+        collections.  Conformance is verified once for each provider class.
+
+        The same interface object is yielded for every item, so it must
+        not be kept or used after the loop advances.  Code that needs to
+        keep an item should cast it to the interface to get a separate
+        interface object.
+        """
+        face = None
+        for obj in interface._providers(iterable, validate):
+            if face is None:
+                face = super().__call__(obj)
+            else:
+                object.__setattr__(face, 'provider', obj)
+            yield face
+
+    def _value_checker(interface, name):
+        """
+        Return a function to check values of an attribute of the interface.
+
+        The function checks each value against the attribute's types once
+        for each value type.
+        """
+        try:
+            validators = interface._provider_attributes[name]
+        except KeyError:
+            raise AttributeError(
+                "{!r} interface has no attribute {!r}".format(
+                    interface.__name__, name)) from None
+        types = [
+            validator.type for validator in validators
+            if isinstance(validator, Attribute)
+        ]
+        checked = set()
+
+        def check(value):
+            value_type = type(value)
+            if value_type not in checked:
+                for attribute_type in types:
+                    if not isinstance(value, attribute_type):
+                        raise TypeError(
+                            '{}.{} requires type {}, got type {}'.format(
+                                interface, name, attribute_type, value_type
+                            )
+                        )
+                checked.add(value_type)
+            return value
+        return check
+
+    def _providers(interface, objs, validate):
+        """Iterate over the providers of objects that provide the interface."""
+        conforming = set()
+        for obj in objs:
+            obj = underlying_object(obj)
+            obj_type = type(obj)
+            if obj_type not in conforming or validate:
+                interface.raise_if_not_provided_by(obj, validate)
+                # Dynamic providers may differ for each instance.
+                if interface.implemented_by(obj_type):
+                    conforming.add(obj_type)
+            yield obj
+
+    def gather(interface, objs, name, into=list, validate=None):
+        """
+        Get an attribute of the interface from many objects.
+
+        This is equivalent to ``into([IFoo(obj).name for obj in objs])``,
+        but checks that each provider class conforms to the interface only
+        once, and does not create an interface object for each object.
+        Values are checked against the :py:class:`.Attribute` type once for
+        each value type.
+
+        By default, the values are returned in a list.  Pass a callable as
+        *into* to convert the list of values, e.g.
+        ``functools.partial(array.array, 'd')`` or ``numpy.array``.
+        """
+        check = interface._value_checker(name)
+        values = [
+            check(getattr(obj, name))
+            for obj in interface._providers(objs, validate)
+        ]
+        if into is list:
+            return values
+        return into(values)
+
+    def scatter(interface, objs, name, values, validate=None):
+        """
+        Set an attribute of the interface on many objects.
+
+        This is equivalent to setting ``IFoo(obj).name = value`` for each
+        pair of object and value, but checks that each provider class
+        conforms to the interface only once, and checks values against the
+        :py:class:`.Attribute` type once for each value type.
+        """
+        check = interface._value_checker(name)
+        sentinel = object()
+        for obj, value in itertools.zip_longest(
+                interface._providers(objs, validate), values,
+                fillvalue=sentinel):
+            if obj is sentinel or value is sentinel:
+                raise ValueError('Different numbers of objects and values')
+            setattr(obj, name, check(value))
 
     def raise_if_not_provided_by(interface, obj, validate=None):
         """
@@ -448,7 +1348,7 @@ class Interface(type):
         not.
         """
         obj_type = type(obj)
-        if issubclass(obj_type, interface._verified):
+        if interface._verified.claims(obj_type):
             # an instance of a class that has been verified to provide
             # the interface, so it must support all operations
             if validate:
@@ -457,9 +1357,9 @@ class Interface(type):
                 if missing:
                     raise InterfaceConformanceError(mkmessage(obj, missing))
         elif (
-            issubclass(obj_type, interface._unverified) or (
-                issubclass(obj_type, DynamicInterface._verified) or
-                issubclass(obj_type, DynamicInterface._unverified)
+            interface._unverified.claims(obj_type) or (
+                DynamicInterface._verified.claims(obj_type) or
+                DynamicInterface._unverified.claims(obj_type)
             ) and obj.provides_interface(interface)
         ):
             # The object claims to provide the interface, either by
@@ -479,22 +1379,52 @@ class Interface(type):
                 'Object {} does not provide interface {}'. format(
                     obj, interface.__name__))
 
-    def register_implementation(interface, cls):
+    def register_implementation(interface, cls, enforce=False, exclude=()):
         """
         Register a provider class to the interface.
 
         This is useful for declaring that a standard or third-party class
         provides an interface, when it cannot be decorated with the
         :py:data:`.implements` decorator.
+
+        If *enforce* is true, install descriptors on the class that check
+        the type of values assigned to each typed :py:class:`.Attribute`
+        of the interface, whether or not the assignment is made through
+        the interface.  Instances can then be used without wrapping them
+        in the interface, and still have their attribute types enforced.
+        Names in *exclude* are not enforced, for attributes that are
+        assigned too frequently to afford the check.
         """
         issubclass(cls, cls)      # ensure cls can appear on both sides
-        for base in interface.__mro__:
-            if (
-                isinstance(base, Interface) and
-                cls not in base._verified and
-                cls not in base._unverified
-            ):
-                base._unverified += (cls,)
+        with _registry_lock:
+            # Install the descriptors first, so that a class that cannot
+            # be changed is not registered.
+            if enforce:
+                EnforcedAttribute.install_all(
+                    cls, interface._provider_attributes, exclude)
+            for base in interface.__mro__:
+                if isinstance(base, Interface) and cls not in base._verified:
+                    base._unverified.add(cls, interface)
+            _registry_added()
+
+    def unregister_implementation(interface, cls):
+        """
+        Remove the registration of a provider class to the interface.
+
+        The class no longer implements the interface, or its
+        super-interfaces, unless it is also registered to them directly
+        or through another interface.  Type checks installed using the
+        *enforce* argument of :py:meth:`register_implementation` remain.
+
+        Registered classes are held by weak references, so classes do not
+        need to be unregistered before they are garbage collected.
+        """
+        with _registry_lock:
+            for base in interface.__mro__:
+                if isinstance(base, Interface):
+                    base._verified.discard(cls, interface)
+                    base._unverified.discard(cls, interface)
+            _registry_changed()
 
     def implemented_by(interface, cls):
         """
@@ -507,9 +1437,11 @@ class Interface(type):
         :return bool: :py:obj:`True` if interface is implemented by the class,
             else :py:obj:`False`.
         """
+        if not isinstance(cls, type):
+            raise TypeError('implemented_by() arg must be a class')
         return (
-            issubclass(cls, interface._verified) or
-            issubclass(cls, interface._unverified)
+            interface._verified.claims(cls) or
+            interface._unverified.claims(cls)
         )
 
     def provided_by(interface, obj):
@@ -526,10 +1458,10 @@ class Interface(type):
         """
         obj_type = type(obj)
         return (
-            issubclass(obj_type, interface._verified) or
-            issubclass(obj_type, interface._unverified) or (
-                issubclass(obj_type, DynamicInterface._verified) or
-                issubclass(obj_type, DynamicInterface._unverified)) and
+            interface._verified.claims(obj_type) or
+            interface._unverified.claims(obj_type) or (
+                DynamicInterface._verified.claims(obj_type) or
+                DynamicInterface._unverified.claims(obj_type)) and
                 obj.provides_interface(interface)
         )
 
@@ -549,6 +1481,81 @@ class Interface(type):
         return interface.provided_by(underlying_object(obj))
 
 
+class LazyProvider:
+
+    """
+    Descriptor that creates the provider for an interface on first use.
+
+    See :py:meth:`.Interface.lazy`.
+    """
+
+    __slots__ = ('interface',)
+
+    def __init__(self, interface):
+        self.interface = interface
+
+    def __get__(self, face, cls=None):
+        if face is None:
+            return self
+        state = _getattribute(face, '__dict__')
+        with state['_lock']:
+            if 'provider' not in state:
+                provider = underlying_object(state['_factory']())
+                self.interface.raise_if_not_provided_by(provider)
+                state['provider'] = provider
+                del state['_factory']
+                object.__setattr__(face, '__class__', self.interface)
+        return state['provider']
+
+
+class AsyncView:
+
+    """
+    View of an interface object running blocking methods in an executor.
+
+    See :py:meth:`.Interface.async_view`.
+    """
+
+    def __init__(self, face, executor, blocking_methods):
+        self._face = face
+        self._executor = executor
+        self._blocking_methods = blocking_methods
+
+    def __repr__(self):
+        return '<async view of {!r}>'.format(self._face)
+
+    def _mkmethod(self, name):
+        face = self._face
+        executor = self._executor
+
+        async def method(*args, **kwargs):
+            # Get the method when called, so each call uses the current
+            # attribute of the provider.
+            func = getattr(face, name)
+            if kwargs:
+                func = functools.partial(func, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        method.__name__ = name
+        return method
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self._blocking_methods:
+            method = self._mkmethod(name)
+            # Store the method, so later accesses do not use `__getattr__`.
+            self.__dict__[name] = method
+            return method
+        return getattr(self._face, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._face, name, value)
+
+
 class Attribute:
 
     '''
@@ -581,6 +1588,127 @@ class Attribute:
         self.type = type
 
 
+class EnforcedAttribute:
+
+    """
+    Data descriptor that checks the type of values assigned to an attribute.
+
+    Installed on provider classes registered with ``enforce=True``.  The
+    descriptor wraps whatever the class previously defined for the name.
+    If that is a data descriptor (e.g. a slot or property), values are
+    stored using it.  Otherwise values are stored in the instance
+    dictionary, and the previous class value is the default.
+    """
+
+    __slots__ = ('name', 'types', 'wrapped', 'has_default', 'data')
+
+    @classmethod
+    def install_all(cls, provider, provider_attributes, exclude=()):
+        """
+        Enforce the types of the typed attributes of a provider class.
+
+        If a descriptor cannot be installed, the class is restored and the
+        exception is raised.
+        """
+        # Each changed attribute, whether the class defined it, its
+        # original value, and the types of an already installed descriptor.
+        changed = []
+        try:
+            for name, validators in provider_attributes.items():
+                if name in exclude:
+                    continue
+                types = [
+                    validator.type for validator in validators
+                    if isinstance(validator, Attribute) and
+                    validator.type is not object
+                ]
+                if types:
+                    original = provider.__dict__.get(name)
+                    changed.append((
+                        name, name in provider.__dict__, original,
+                        getattr(original, 'types', None)))
+                    cls.install(provider, name, types)
+        except BaseException:
+            for name, defined, original, types in reversed(changed):
+                if isinstance(original, cls):
+                    original.types = types
+                elif defined:
+                    setattr(provider, name, original)
+                elif name in provider.__dict__:
+                    delattr(provider, name)
+            raise
+
+    @classmethod
+    def install(cls, provider, name, types):
+        """Enforce the types of an attribute of a provider class."""
+        descriptor = provider.__dict__.get(name)
+        if isinstance(descriptor, cls):
+            for attribute_type in types:
+                if attribute_type not in descriptor.types:
+                    descriptor.types += (attribute_type,)
+            return
+        for klass in provider.__mro__:
+            if name in klass.__dict__:
+                wrapped = klass.__dict__[name]
+                has_default = True
+                break
+        else:
+            wrapped = None
+            has_default = False
+        setattr(provider, name, cls(name, tuple(types), wrapped, has_default))
+
+    def __init__(self, name, types, wrapped, has_default):
+        self.name = name
+        self.types = types
+        self.wrapped = wrapped
+        self.has_default = has_default
+        wrapped_type = type(wrapped)
+        self.data = (
+            hasattr(wrapped_type, '__set__') or
+            hasattr(wrapped_type, '__delete__')
+        )
+
+    def __get__(self, obj, cls=None):
+        wrapped = self.wrapped
+        if obj is not None:
+            if self.data:
+                return wrapped.__get__(obj, cls)
+            try:
+                return _getattribute(obj, '__dict__')[self.name]
+            except KeyError:
+                if not self.has_default:
+                    raise AttributeError(
+                        '{!r} object has no attribute {!r}'.format(
+                            type(obj).__name__, self.name)) from None
+        elif not self.has_default:
+            return self
+        if hasattr(type(wrapped), '__get__'):
+            return wrapped.__get__(obj, cls)
+        return wrapped
+
+    def __set__(self, obj, value):
+        for attribute_type in self.types:
+            if not isinstance(value, attribute_type):
+                raise TypeError(
+                    '{}.{} requires type {}, got type {}'.format(
+                        type(obj), self.name, attribute_type, type(value)
+                    )
+                )
+        if self.data:
+            self.wrapped.__set__(obj, value)
+        else:
+            _getattribute(obj, '__dict__')[self.name] = value
+
+    def __delete__(self, obj):
+        if self.data:
+            self.wrapped.__delete__(obj)
+        else:
+            try:
+                del _getattribute(obj, '__dict__')[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+
+
 class Opaque(metaclass=Interface):
 
     """
@@ -622,12 +1750,169 @@ class DynamicInterface(Opaque):
         """
 
 
-def implements(*interfaces):
+class Intersection(Interface):
+
+    """
+    Metaclass of interfaces created by :py:func:`all_of`.
+
+    An object provides an intersection of interfaces if it provides each
+    of the component interfaces, as well as if it provides the
+    intersection directly.
+    """
+
+    def _component_classes(interface):
+        # Return the cache of provider classes that implement each
+        # component, or None for sub-interfaces of an intersection, which
+        # may declare attributes of their own.
+        return interface.__dict__.get('_provider_classes')
+
+    def raise_if_not_provided_by(interface, obj, validate=None):
+        provider_classes = interface._component_classes()
+        obj_type = type(obj)
+        if (
+            provider_classes is None or
+            interface._verified.claims(obj_type) or
+            interface._unverified.claims(obj_type)
+        ):
+            return super().raise_if_not_provided_by(obj, validate)
+        if obj_type in provider_classes and not validate:
+            return
+        for component in interface._components:
+            component.raise_if_not_provided_by(obj, validate)
+        # Dynamic providers may differ for each instance, so are always
+        # checked.
+        if interface.implemented_by(obj_type):
+            provider_classes.add(obj_type)
+
+    def implemented_by(interface, cls):
+        if super().implemented_by(cls):
+            return True
+        return interface._component_classes() is not None and all(
+            component.implemented_by(cls)
+            for component in interface._components
+        )
+
+    def provided_by(interface, obj):
+        if super().provided_by(obj):
+            return True
+        return interface._component_classes() is not None and all(
+            component.provided_by(obj) for component in interface._components
+        )
+
+
+def _reduce_interface(interface):
+    # Interfaces made by a factory, such as `make_interface`, are pickled
+    # as the call that makes them.  Others are pickled by name.
+    made = interface.__dict__.get('_jute_made')
+    if made is None:
+        return interface.__qualname__
+    return made
+
+
+def _reduce_intersection(interface):
+    # Intersections cannot be found by name, so pickle them as a call to
+    # `all_of`.  Sub-interfaces of intersections are pickled as other
+    # interfaces.
+    if interface._component_classes() is None:
+        return _reduce_interface(interface)
+    return all_of, interface._components
+
+
+copyreg.pickle(Interface, _reduce_interface)
+copyreg.pickle(Intersection, _reduce_intersection)
+
+
+# Intersections created by `all_of`, keyed by their set of components.
+_intersections = weakref.WeakValueDictionary()
+
+
+def all_of(*interfaces):
+    """
+    Return an interface combining several interfaces.
+
+    The combined interface provides the attributes of all the interfaces,
+    and an object provides it if it provides each of the interfaces.  A
+    single interface object then gives access to all the attributes::
+
+        def copy(source: jute.all_of(IReadable, ISeekable)):
+            source.seek(0)
+            return source.read()
+
+    The combined interface is a sub-interface of each interface, so it can
+    be upcast to any of them.  It is also available as ``IReadable &
+    ISeekable``.  The same combined interface is returned for the same
+    set of interfaces, in any order.  Each provider class is checked
+    against the combined interface once.
+
+    If one interface is a sub-interface of all the others, it is returned.
+    """
+    components = []
+    for interface in interfaces:
+        if not isinstance(interface, Interface):
+            raise TypeError('{!r} is not an interface'.format(interface))
+        if isinstance(interface, Intersection):
+            parts = interface.__dict__.get('_components', (interface,))
+        else:
+            parts = (interface,)
+        for part in parts:
+            if part not in components:
+                components.append(part)
+    # Remove interfaces that are super-interfaces of other interfaces.
+    components = tuple(
+        interface for interface in components
+        if not any(
+            other is not interface and issubclass(other, interface)
+            for other in components
+        )
+    )
+    if not components:
+        raise TypeError('all_of requires at least one interface')
+    if len(components) == 1:
+        return components[0]
+    key = frozenset(components)
+    combined = _intersections.get(key)
+    if combined is None:
+        with _registry_lock:
+            combined = _intersections.get(key)
+            if combined is None:
+                name = ' & '.join(
+                    component.__name__ for component in components)
+                combined = _intersections[key] = Intersection(
+                    name, components, {
+                        '__module__': components[0].__module__,
+                        '__qualname__': name,
+                        '__doc__': 'Intersection of {}.'.format(name),
+                        '_components': components,
+                        '_provider_classes': ClassCache(),
+                    })
+    return combined
+
+
+def _register_verified(interface, cls):
+    """
+    Register a provider class that is known to provide the interface.
+
+    This is used for provider classes generated from the interface
+    definition, whose instances are guaranteed to provide all attributes,
+    so casts do not need to verify them.
+    """
+    issubclass(cls, cls)      # ensure cls can appear on both sides
+    with _registry_lock:
+        for base in interface.__mro__:
+            if isinstance(base, Interface):
+                base._verified.add(cls, interface)
+        _registry_added()
+
+
+def implements(*interfaces, enforce=False, exclude=()):
     """
     Decorator to mark a class as implementing the supplied interfaces.
 
     To implement an interface, the class instances must define all attributes
     in the interface.
+
+    The *enforce* and *exclude* arguments are passed to
+    :py:meth:`.Interface.register_implementation`.
     """
     # The decorator does not wrap the class. It simply runs the
     # `register_implementation` method for each interface, and returns
@@ -636,6 +1921,6 @@ def implements(*interfaces):
     # http://blog.dscpl.com.au/2014/01/how-you-implemented-your-python.html
     def decorator(cls):
         for interface in interfaces:
-            interface.register_implementation(cls)
+            interface.register_implementation(cls, enforce, exclude)
         return cls
     return decorator
@@ -0,0 +1,74 @@
+"""
+Construction of interfaces from attribute specifications.
+"""
+
+import weakref
+
+from ._jute import (
+    Attribute, Interface, InvalidAttributeName, Opaque, _registry_lock
+)
+
+
+# Interfaces made by `make_interface`, keyed by their structure.  The
+# interfaces are held weakly, so unused interfaces can be collected.
+_interfaces = weakref.WeakValueDictionary()
+
+
+def _attribute_type(name, spec):
+    if name.startswith('__') and name.endswith('__'):
+        # Interfaces keep special names that are not methods as class
+        # attributes, so the attribute would be silently dropped.
+        raise InvalidAttributeName(name)
+    if isinstance(spec, Attribute):
+        return spec.type
+    if isinstance(spec, type):
+        return spec
+    raise TypeError(
+        'Attribute {!r} must be an Attribute or a type, got {!r}'.format(
+            name, spec))
+
+
+def make_interface(name, attributes, bases=(Opaque,)):
+    """
+    Return an interface with the specified attributes.
+
+    *attributes* maps each attribute name to an :py:class:`.Attribute`,
+    or to a type, as a short form of ``Attribute(type=...)``::
+
+        IRow = jute.make_interface('IRow', {'id': int, 'name': str})
+
+    Interfaces are interned.  Calling :py:func:`make_interface` again with
+    the same name, bases, attribute names and attribute types returns the
+    same interface, so interfaces built repeatedly from the same schema
+    share their registered implementations and caches.  Attribute
+    descriptions are not compared.  Attribute names cannot be special
+    names, such as ``__len__``.  The interfaces are pickled as calls
+    to :py:func:`make_interface`.
+    """
+    bases = tuple(bases)
+    for base in bases:
+        if not isinstance(base, Interface):
+            raise TypeError('Base {!r} is not an interface'.format(base))
+    types = tuple(sorted(
+        (key, _attribute_type(key, spec)) for key, spec in attributes.items()
+    ))
+    key = (name, bases, types)
+    interface = _interfaces.get(key)
+    if interface is None:
+        with _registry_lock:
+            # Another thread may have made the interface while waiting.
+            interface = _interfaces.get(key)
+            if interface is None:
+                namespace = {'__qualname__': name}
+                for key_name, spec in attributes.items():
+                    if not isinstance(spec, Attribute):
+                        spec = Attribute(type=spec)
+                    namespace[key_name] = spec
+                interface = _interfaces[key] = Interface(
+                    name, bases, namespace)
+                # Made interfaces cannot be found by name, so record the
+                # call that makes them for pickling.
+                type.__setattr__(
+                    interface, '_jute_made',
+                    (make_interface, (name, dict(attributes), bases)))
+    return interface
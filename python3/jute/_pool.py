@@ -0,0 +1,263 @@
+"""
+Pools of interface providers.
+"""
+
+import asyncio
+import inspect
+import threading
+import weakref
+
+from ._jute import (
+    Attribute, DynamicInterface, implements, underlying_object,
+    _register_verified, _registry_lock
+)
+
+
+class _Slot:
+
+    """A provider in a pool, and the number of calls it is handling."""
+
+    __slots__ = ('provider', 'busy')
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.busy = 0
+
+
+@implements(DynamicInterface)
+class Pool:
+
+    """
+    Dispatch calls on an interface to a pool of providers.
+
+    A pool provides the interface itself.  Each method call made on the
+    pool checks out a provider from the pool, calls the provider's
+    method, and returns the provider to the pool::
+
+        pool = jute.Pool(IConnection, [connect() for i in range(4)])
+        db = IConnection(pool)
+        db.execute(query)
+
+    Each provider handles at most *limit* calls at the same time.  When
+    all providers are busy, callers wait for a provider to be returned.
+    The *policy* selects the provider for each call: ``'round_robin'``
+    uses each available provider in turn, and ``'least_busy'`` uses the
+    provider handling the fewest calls.
+
+    Methods declared as ``async def`` in the interface return a coroutine
+    that waits for a provider without blocking the event loop, and keeps
+    the provider checked out until the provider's coroutine completes.
+    Other methods can be called from any thread.
+
+    Providers are checked to provide the interface once, when they are
+    added to the pool.  Each pool is an instance of a subclass generated
+    for the interface, which is registered as a verified implementation,
+    so casting a pool does not check its attributes.  Reading an
+    :py:class:`.Attribute` of the pool reads it from the first provider,
+    without checking it out.
+
+    Attributes of the interface take precedence over the pool's own
+    methods of the same name, which can still be called through the
+    class, e.g. ``jute.Pool.add(pool, provider)``.
+    """
+
+    POLICIES = ('round_robin', 'least_busy')
+
+    def __new__(cls, interface, *args, **kwargs):
+        return super().__new__(_pool_class(cls, interface))
+
+    def __init__(self, interface, providers=(), *, policy='round_robin',
+                 limit=1):
+        if policy not in self.POLICIES:
+            raise ValueError('Unknown pool policy {!r}'.format(policy))
+        if limit < 1:
+            raise ValueError('Pool limit must be at least 1')
+        self._interface = interface
+        self._policy = policy
+        self._limit = limit
+        self._slots = []
+        self._next = 0
+        self._condition = threading.Condition()
+        self._async_waiters = []
+        for provider in providers:
+            Pool.add(self, provider)
+
+    def __repr__(self):
+        return '<{} of {} {} providers>'.format(
+            type(self).__name__, len(self._slots), self._interface.__name__)
+
+    def provides_interface(self, interface):
+        return interface.implemented_by(self._interface)
+
+    def add(self, provider):
+        """Check that a provider provides the interface and add it."""
+        provider = underlying_object(provider)
+        self._interface.raise_if_not_provided_by(provider, validate=True)
+        with self._condition:
+            self._slots.append(_Slot(provider))
+            self._wake()
+
+    def _select(self):
+        """Return an available slot, or None if all are busy."""
+        slots = self._slots
+        limit = self._limit
+        if self._policy == 'round_robin':
+            count = len(slots)
+            for offset in range(count):
+                index = (self._next + offset) % count
+                slot = slots[index]
+                if slot.busy < limit:
+                    self._next = index + 1
+                    return slot
+            return None
+        if slots:
+            slot = min(slots, key=lambda slot: slot.busy)
+            if slot.busy < limit:
+                return slot
+        return None
+
+    def _acquire(self):
+        with self._condition:
+            slot = self._select()
+            while slot is None:
+                self._condition.wait()
+                slot = self._select()
+            slot.busy += 1
+            return slot
+
+    async def _acquire_async(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                slot = self._select()
+                if slot is not None:
+                    slot.busy += 1
+                    return slot
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except BaseException:
+                with self._condition:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # Already woken, so pass the wake-up on.
+                        self._wake()
+                raise
+
+    def _release(self, slot):
+        with self._condition:
+            slot.busy -= 1
+            self._wake()
+
+    def _wake(self):
+        # Wake one waiting thread and one waiting coroutine.  Each re-checks
+        # for an available provider, and waits again if there is none.
+        self._condition.notify()
+        if self._async_waiters:
+            loop, waiter = self._async_waiters.pop(0)
+            loop.call_soon_threadsafe(_set_waiter, waiter)
+
+    def checkout(self):
+        """
+        Context manager to check out a provider for several calls.
+
+        The provider is returned to the pool when the context exits.
+        """
+        return _Checkout(self)
+
+
+def _mkattribute(name):
+    def get(pool):
+        # Read from a provider without checking it out, so that casting
+        # or reading an attribute never waits for a busy pool.
+        slots = pool._slots
+        if not slots:
+            raise AttributeError(
+                '{!r} pool has no providers to read {!r}'.format(
+                    pool._interface.__name__, name))
+        return getattr(slots[0].provider, name)
+    return property(get)
+
+
+def _mkmethod(name, declaration):
+    if inspect.iscoroutinefunction(declaration):
+        async def method(pool, *args, **kwargs):
+            slot = await pool._acquire_async()
+            try:
+                return await getattr(slot.provider, name)(*args, **kwargs)
+            finally:
+                pool._release(slot)
+    else:
+        def method(pool, *args, **kwargs):
+            slot = pool._acquire()
+            try:
+                return getattr(slot.provider, name)(*args, **kwargs)
+            finally:
+                pool._release(slot)
+    method.__name__ = name
+    return method
+
+
+# Map each interface to the pool classes generated for it, keyed by the
+# pool class they derive from.
+_pool_classes = weakref.WeakKeyDictionary()
+
+
+def _pool_class(cls, interface):
+    """Return a subclass of the pool class with the interface attributes."""
+    classes = _pool_classes.get(interface)
+    pool_class = None if classes is None else classes.get(cls)
+    if pool_class is None:
+        with _registry_lock:
+            # Another thread may have made the class while waiting.
+            classes = _pool_classes.setdefault(interface, {})
+            pool_class = classes.get(cls)
+            if pool_class is None:
+                namespace = {
+                    '__module__': cls.__module__,
+                    '__qualname__': cls.__qualname__,
+                    '__slots__': (),
+                }
+                for name, validators in (
+                        interface._provider_attributes.items()):
+                    if any(
+                        isinstance(validator, Attribute)
+                        for validator in validators
+                    ):
+                        namespace[name] = _mkattribute(name)
+                    else:
+                        namespace[name] = _mkmethod(name, validators[-1])
+                pool_class = classes[cls] = type(cls)(
+                    cls.__name__, (cls,), namespace)
+                # Every attribute of the interface is defined by the class,
+                # so casts do not need to check pools.
+                _register_verified(interface, pool_class)
+    return pool_class
+
+
+def _set_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _Checkout:
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.slot = None
+
+    def __enter__(self):
+        self.slot = self.pool._acquire()
+        return self.slot.provider
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.pool._release(self.slot)
+
+    async def __aenter__(self):
+        self.slot = await self.pool._acquire_async()
+        return self.slot.provider
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.pool._release(self.slot)
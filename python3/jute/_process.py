@@ -0,0 +1,346 @@
+"""
+Interface providers hosted in worker processes.
+"""
+
+import concurrent.futures
+import itertools
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.reduction import ForkingPickler
+
+from ._jute import Attribute, DynamicInterface, implements
+
+
+def _picklable(exc):
+    """Return an exception that can be sent to another process."""
+    try:
+        ForkingPickler.dumps(exc)
+    except Exception:
+        return RuntimeError(repr(exc))
+    return exc
+
+
+def _send_replies(conn, replies):
+    try:
+        conn.send(replies)
+    except Exception:
+        # A value could not be pickled, so send the replies one at a
+        # time, replacing each value that fails with an error.
+        for ident, ok, value in replies:
+            try:
+                conn.send([(ident, ok, value)])
+            except Exception as e:
+                conn.send([(ident, False, _picklable(e))])
+
+
+def _serve(conn, interface, factory, args, kwargs):
+    """Create a provider in a worker process, and run requests on it."""
+    try:
+        provider = factory(*args, **kwargs)
+        interface.raise_if_not_provided_by(provider, validate=True)
+    except BaseException as e:
+        conn.send(_picklable(e))
+        return
+    conn.send(None)
+    names = interface._provider_attributes
+    while True:
+        try:
+            requests = conn.recv()
+        except EOFError:
+            return
+        if requests is None:
+            return
+        replies = []
+        for ident, name, call_args, call_kwargs in requests:
+            try:
+                if name not in names:
+                    raise AttributeError(
+                        "{!r} interface has no attribute {!r}".format(
+                            interface.__name__, name))
+                value = getattr(provider, name)
+                if call_args is not None:
+                    value = value(*call_args, **call_kwargs)
+            except BaseException as e:
+                replies.append((ident, False, e))
+            else:
+                replies.append((ident, True, value))
+        _send_replies(conn, replies)
+
+
+class _Worker:
+
+    """
+    A worker process, and the requests sent to it.
+
+    Requests are queued, and a sender thread sends all queued requests in
+    one message, so calls are pipelined without waiting for replies, and
+    pickled in batches when callers submit them faster than they are
+    sent.  A receiver thread completes the futures of the replies.
+    """
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.lock = threading.Condition()
+        self.outbox = []
+        self.futures = {}
+        self.closed = False
+        for target in (self._send, self._receive):
+            threading.Thread(target=target, daemon=True).start()
+
+    def submit(self, ident, future, name, args, kwargs):
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('Cannot submit calls after close')
+            self.futures[ident] = future
+            self.outbox.append((ident, name, args, kwargs))
+            self.lock.notify()
+
+    def _start(self):
+        # Take the queued requests, dropping those whose calls were
+        # cancelled.  The calls of the others can no longer be cancelled,
+        # so their futures can be completed when the replies arrive.
+        requests = []
+        for request in self.outbox:
+            if self.futures[request[0]].set_running_or_notify_cancel():
+                requests.append(request)
+            else:
+                del self.futures[request[0]]
+        self.outbox = []
+        return requests
+
+    def _send(self):
+        while True:
+            with self.lock:
+                while not self.outbox and not self.closed:
+                    self.lock.wait()
+                requests = self._start()
+                closed = self.closed
+            if requests:
+                try:
+                    self.conn.send(requests)
+                except Exception:
+                    # Send the requests one at a time, so a request that
+                    # cannot be pickled only fails its own call.
+                    for request in requests:
+                        try:
+                            self.conn.send([request])
+                        except Exception as e:
+                            self._fail(request[0], e)
+            if closed:
+                try:
+                    self.conn.send(None)
+                except OSError:
+                    pass
+                return
+
+    def _fail(self, ident, error):
+        with self.lock:
+            future = self.futures.pop(ident, None)
+        if future is not None:
+            future.set_exception(error)
+
+    def _receive(self):
+        while True:
+            try:
+                replies = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            with self.lock:
+                futures = [
+                    (self.futures.pop(ident), ok, value)
+                    for ident, ok, value in replies
+                ]
+            for future, ok, value in futures:
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        with self.lock:
+            self.closed = True
+            self._start()
+            futures = list(self.futures.values())
+            self.futures.clear()
+            self.lock.notify()
+        for future in futures:
+            future.set_exception(
+                BrokenProcessPool('Worker process ended unexpectedly'))
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.lock.notify()
+
+
+def _shutdown(workers):
+    for worker in workers:
+        worker.close()
+    for worker in workers:
+        worker.process.join()
+
+
+@implements(DynamicInterface)
+class ProcessPool:
+
+    """
+    Provide an interface using providers hosted in worker processes.
+
+    Each of *processes* worker processes calls ``factory(*args,
+    **kwargs)`` to create a provider, and checks that it provides the
+    interface.  The process pool provides the interface in the calling
+    process, and forwards calls of the interface's methods to a worker::
+
+        parsers = jute.ProcessPool(IParser, Parser, processes=4)
+        parser = IParser(parsers)
+        tree = parser.parse(text)
+
+    Only the attributes of the interface are forwarded.  Arguments,
+    results and exceptions are pickled, and the interface, factory and
+    factory arguments must be picklable by the start method of the
+    multiprocessing *context*, so define them at module level.  The
+    default context uses the ``'spawn'`` start method.  Each worker has
+    its own provider, so providers should not rely on state changed by
+    earlier calls.  Reading an :py:class:`.Attribute` reads it from one of
+    the providers, and attributes cannot be set.
+
+    Calls can be made from any thread.  Use :py:meth:`submit` to make a
+    call without waiting for the result, or :py:meth:`map` to make many
+    calls.  Calls to a worker are pipelined, and calls made faster than
+    they can be sent are pickled together.  A worker is chosen for each
+    call by the number of calls it is handling.
+    """
+
+    def __init__(self, interface, factory, *args, processes=None,
+                 context=None, **kwargs):
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes < 1:
+            raise ValueError('Number of processes must be at least 1')
+        if context is None:
+            # Forking a process that runs threads, such as the threads of
+            # other process pools, can deadlock the child, and the child
+            # would inherit the pipes of other pools.
+            context = multiprocessing.get_context('spawn')
+        self._interface = interface
+        self._idents = itertools.count()
+        started = []
+        try:
+            for i in range(processes):
+                conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_serve,
+                    args=(child_conn, interface, factory, args, kwargs),
+                    daemon=True)
+                process.start()
+                child_conn.close()
+                started.append((process, conn))
+            for process, conn in started:
+                try:
+                    error = conn.recv()
+                except EOFError:
+                    error = BrokenProcessPool(
+                        'Worker process ended unexpectedly')
+                if error is not None:
+                    raise error
+        except BaseException:
+            for process, conn in started:
+                process.terminate()
+                process.join()
+            raise
+        self._workers = [_Worker(process, conn) for process, conn in started]
+        self._finalizer = weakref.finalize(self, _shutdown, self._workers)
+
+    def __repr__(self):
+        return '<{} of {} {} providers>'.format(
+            type(self).__name__, len(self._workers), self._interface.__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def provides_interface(self, interface):
+        return interface.implemented_by(self._interface)
+
+    def close(self):
+        """Stop the worker processes, after completing submitted calls."""
+        self._finalizer()
+
+    def _submit(self, name, args, kwargs):
+        future = concurrent.futures.Future()
+        worker = min(self._workers, key=lambda worker: len(worker.futures))
+        worker.submit(next(self._idents), future, name, args, kwargs)
+        return future
+
+    def _method_name(self, name):
+        validators = self._interface._provider_attributes.get(name)
+        if validators is None:
+            raise AttributeError(
+                "{!r} interface has no attribute {!r}".format(
+                    self._interface.__name__, name))
+        for declaration in validators:
+            if isinstance(declaration, Attribute):
+                raise TypeError(
+                    '{!r} is not a method of {!r}'.format(
+                        name, self._interface.__name__))
+        return name
+
+    def submit(self, name, *args, **kwargs):
+        """
+        Call a method of the interface in a worker process.
+
+        The call can be cancelled until it is sent to the worker.
+
+        :return concurrent.futures.Future: The future result of the call.
+        """
+        return self._submit(self._method_name(name), args, kwargs)
+
+    def map(self, name, *iterables):
+        """
+        Call a method of the interface for each item of the iterables.
+
+        All the calls are submitted before any result is returned.
+
+        :return: An iterator of the results, in order.
+        """
+        name = self._method_name(name)
+        futures = [
+            self._submit(name, args, {}) for args in zip(*iterables)
+        ]
+
+        def results():
+            for future in futures:
+                yield future.result()
+        return results()
+
+    def __getattr__(self, name):
+        interface = self.__dict__.get('_interface')
+        if interface is None:
+            raise AttributeError(name)
+        try:
+            validators = interface._provider_attributes[name]
+        except KeyError:
+            raise AttributeError(
+                "{!r} interface has no attribute {!r}".format(
+                    interface.__name__, name)) from None
+        for declaration in validators:
+            if isinstance(declaration, Attribute):
+                return self._submit(name, None, None).result()
+
+        def method(*args, **kwargs):
+            return self._submit(name, args, kwargs).result()
+        method.__name__ = name
+        # Store the method, so later accesses do not use `__getattr__`.
+        self.__dict__[name] = method
+        return method
+
+    def __setattr__(self, name, value):
+        interface = self.__dict__.get('_interface')
+        if interface is not None and name in interface._provider_attributes:
+            raise TypeError(
+                'Cannot set attribute {!r} of providers in other '
+                'processes'.format(name))
+        object.__setattr__(self, name, value)
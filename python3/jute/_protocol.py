@@ -0,0 +1,148 @@
+"""
+Protocols and abstract base classes generated from interfaces.
+"""
+
+import abc
+import types
+import typing
+
+from ._jute import Attribute, Interface, _registry_lock
+
+
+def _members(interface):
+    """Return the annotations and methods declared by the interface."""
+    annotations = {}
+    methods = {}
+    for name, validators in interface._provider_attributes.items():
+        for validator in validators:
+            if isinstance(validator, Attribute):
+                annotations[name] = validator.type
+            elif isinstance(validator, types.FunctionType):
+                methods[name] = validator
+    return annotations, methods
+
+
+def _copy_function(func):
+    # Copy the declared function, so that marking it abstract does not
+    # change the interface.
+    copy = types.FunctionType(
+        func.__code__, func.__globals__, func.__name__, func.__defaults__,
+        func.__closure__)
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__qualname__ = func.__qualname__
+    copy.__doc__ = func.__doc__
+    return copy
+
+
+class _InterfaceCheck:
+
+    """
+    Instance and subclass checks answered by an interface.
+
+    A class generated from an interface is checked in the same way as
+    the interface.  The check for each class is kept until the registry
+    changes.  Classes deriving from a generated class are checked as
+    usual.
+    """
+
+    def __instancecheck__(cls, instance):
+        interface = cls.__dict__.get('_abc_jute_interface')
+        if interface is None:
+            return super().__instancecheck__(instance)
+        claim = interface._claim(type(instance))
+        if claim is None:
+            return interface.provided_by(instance)
+        return claim or cls._jute_subclass(type(instance))
+
+    def __subclasscheck__(cls, subclass):
+        interface = cls.__dict__.get('_abc_jute_interface')
+        if interface is None:
+            return super().__subclasscheck__(subclass)
+        return interface._claim(subclass) is True or cls._jute_subclass(
+            subclass)
+
+
+class _ABCMeta(_InterfaceCheck, abc.ABCMeta):
+
+    def _jute_subclass(cls, subclass):
+        # Subclasses and classes registered with the abstract base class.
+        return abc.ABCMeta.__subclasscheck__(cls, subclass)
+
+
+def _generate(interface, attribute, meta, base):
+    if not isinstance(interface, Interface):
+        raise TypeError('{!r} is not an interface'.format(interface))
+    generated = interface.__dict__.get(attribute)
+    if generated is not None:
+        return generated
+    with _registry_lock:
+        generated = interface.__dict__.get(attribute)
+        if generated is None:
+            annotations, methods = _members(interface)
+            namespace = {
+                '__module__': interface.__module__,
+                '__qualname__': interface.__qualname__,
+                '__doc__': interface.__doc__,
+                '__annotations__': annotations,
+                # Protocols ignore names starting with `_abc_` when
+                # collecting their members.
+                '_abc_jute_interface': interface,
+            }
+            for name, func in methods.items():
+                func = _copy_function(func)
+                if meta is _ABCMeta:
+                    func = abc.abstractmethod(func)
+                namespace[name] = func
+            generated = meta(interface.__name__, (base,), namespace)
+            if meta is not _ABCMeta:
+                generated = typing.runtime_checkable(generated)
+            setattr(interface, attribute, generated)
+    return generated
+
+
+# `typing.Protocol` was added in Python 3.8, so `as_protocol` is only
+# defined for Python 3.8 and later.
+if hasattr(typing, 'Protocol'):
+
+    class _ProtocolMeta(_InterfaceCheck, type(typing.Protocol)):
+
+        def _jute_subclass(cls, subclass):
+            # Classes deriving from the protocol, but not structurally
+            # compatible classes, which only provide the interface if they
+            # are registered.
+            return cls in subclass.__mro__
+
+    def as_protocol(interface):
+        """
+        Return a :py:class:`typing.Protocol` with the attributes of an
+        interface.
+
+        The protocol is runtime checkable, and :py:func:`isinstance` and
+        :py:func:`issubclass` return whether an object or class provides
+        the interface, and are cached for each class::
+
+            Readable = jute.as_protocol(IReadable)
+            assert isinstance(BufferedFile(path), Readable)
+
+        Classes must be registered to provide the interface, or derive
+        from the protocol.  Classes that merely match the protocol's
+        structure do not pass the checks.  The same protocol is returned
+        for each call.  Only available on Python 3.8 and later.
+        """
+        return _generate(
+            interface, '_jute_protocol', _ProtocolMeta, typing.Protocol)
+
+
+def as_abc(interface):
+    """
+    Return an abstract base class with the attributes of an interface.
+
+    Each method of the interface is an abstract method of the class, so
+    that subclasses must implement the methods.  Attributes are
+    declared as annotations.  :py:func:`isinstance` and
+    :py:func:`issubclass` accept objects and classes that provide the
+    interface, as well as subclasses and classes registered with the
+    abstract base class, and are cached for each class.  The same class
+    is returned for each call.
+    """
+    return _generate(interface, '_jute_abc', _ABCMeta, abc.ABC)
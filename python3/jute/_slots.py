@@ -0,0 +1,144 @@
+"""
+Generate compact provider classes from interface definitions.
+"""
+
+from ._jute import (
+    Attribute, InterfaceConformanceError, mkmessage, _register_verified
+)
+
+
+def _fields(interface):
+    """Return the attribute names and types of an interface."""
+    fields = []
+    for name, validators in interface._provider_attributes.items():
+        types = tuple(
+            validator.type for validator in validators
+            if isinstance(validator, Attribute)
+        )
+        if types:
+            fields.append((name, types))
+    return fields
+
+
+def provider_class(
+    interface, name=None, *, bases=(), frozen=False, order=False, hash=None
+):
+    """
+    Create a provider class for the attributes of an interface.
+
+    The new class stores each :py:class:`.Attribute` of the interface in
+    a slot.  Its constructor takes a value for each attribute, in order or
+    by keyword, and checks the value against the attribute type.  Since
+    every instance then provides the interface, the class is registered
+    as a verified implementation, so casts do not check its attributes::
+
+        class IPoint(jute.Opaque):
+            x = jute.Attribute(type=int)
+            y = jute.Attribute(type=int)
+
+        Point = jute.provider_class(IPoint, frozen=True)
+        point = IPoint(Point(1, y=2))
+
+    Methods of the interface must be provided by one of the *bases*.
+    Instances compare equal if they have the same class and attribute
+    values.  If *frozen* is true, attributes cannot be changed after
+    construction.  If *order* is true, instances are ordered by their
+    attribute values.  Instances are hashable if *hash* is true, or if
+    *hash* is :py:obj:`None` and *frozen* is true.
+    """
+    fields = _fields(interface)
+    names = tuple(field_name for field_name, types in fields)
+    label = repr(interface)
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(names):
+            raise TypeError('Too many attribute values')
+        values = dict(zip(names, args))
+        for key in kwargs:
+            if key in values or key not in names:
+                raise TypeError('Unexpected attribute {!r}'.format(key))
+        values.update(kwargs)
+        for field_name, types in fields:
+            try:
+                value = values[field_name]
+            except KeyError:
+                raise TypeError(
+                    'Missing attribute {!r}'.format(field_name)) from None
+            for attribute_type in types:
+                if not isinstance(value, attribute_type):
+                    raise TypeError(
+                        '{}.{} requires type {}, got type {}'.format(
+                            label, field_name, attribute_type, type(value)
+                        )
+                    )
+            object.__setattr__(self, field_name, value)
+
+    def _values(self):
+        return tuple(getattr(self, field_name) for field_name in names)
+
+    def __repr__(self):
+        return '{}({})'.format(
+            type(self).__qualname__,
+            ', '.join(
+                '{}={!r}'.format(field_name, getattr(self, field_name))
+                for field_name in names))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return _values(self) == _values(other)
+
+    namespace = {
+        '__slots__': names,
+        '__module__': interface.__module__,
+        '__init__': __init__,
+        '__repr__': __repr__,
+        '__eq__': __eq__,
+    }
+
+    if frozen:
+        def __setattr__(self, key, value):
+            raise AttributeError(
+                'cannot assign to attribute {!r}'.format(key))
+
+        def __delattr__(self, key):
+            raise AttributeError(
+                'cannot delete attribute {!r}'.format(key))
+
+        namespace['__setattr__'] = __setattr__
+        namespace['__delattr__'] = __delattr__
+
+    if order:
+        def mkcompare(compare):
+            def method(self, other):
+                if type(other) is not type(self):
+                    return NotImplemented
+                return compare(_values(self), _values(other))
+            return method
+
+        namespace['__lt__'] = mkcompare(tuple.__lt__)
+        namespace['__le__'] = mkcompare(tuple.__le__)
+        namespace['__gt__'] = mkcompare(tuple.__gt__)
+        namespace['__ge__'] = mkcompare(tuple.__ge__)
+
+    if hash is None:
+        hash = frozen
+    if hash:
+        def __hash__(self):
+            return tuple.__hash__(_values(self))
+        namespace['__hash__'] = __hash__
+    else:
+        namespace['__hash__'] = None
+
+    if name is None:
+        name = '{}Provider'.format(interface.__name__)
+    cls = type(name, bases, namespace)
+
+    missing = [
+        key for key in interface._provider_attributes
+        if key not in names and not hasattr(cls, key)
+    ]
+    if missing:
+        raise InterfaceConformanceError(mkmessage(cls, missing))
+    _register_verified(interface, cls)
+    return cls
@@ -0,0 +1,246 @@
+import unittest
+from unittest import mock
+
+from jute import (
+    DynamicInterface, Opaque, adapt, adapt_all, implements, register_adapter,
+    underlying_object
+)
+from jute import _adapt
+
+
+class IName(Opaque):
+
+    def name(self):
+        """Return the name."""
+
+
+class IFullName(IName):
+
+    def full_name(self):
+        """Return the full name."""
+
+
+class ILabel(Opaque):
+
+    def label(self):
+        """Return a label."""
+
+
+@implements(IName)
+class Person:
+
+    def name(self):
+        return 'person'
+
+
+@implements(ILabel)
+class Label:
+
+    def __init__(self, text):
+        self.text = text
+
+    def label(self):
+        return self.text
+
+
+class Unrelated:
+    pass
+
+
+def mklabel():
+    # Return a new interface and a class implementing it, so that each
+    # test registers its own adapters.
+    class IShown(Opaque):
+
+        def label(self):
+            """Return a label."""
+
+    @implements(IShown)
+    class Shown:
+
+        def __init__(self, text):
+            self.text = text
+
+        def label(self):
+            return self.text
+
+    return IShown, Shown
+
+
+class AdaptTests(unittest.TestCase):
+
+    def test_provided(self):
+        person = Person()
+        name = adapt(person, IName)
+        self.assertIs(type(name), IName)
+        self.assertIs(underlying_object(name), person)
+
+    def test_interface_object(self):
+        face = IName(Person())
+        self.assertIs(adapt(face, IName), face)
+
+    def test_class_source(self):
+        IShown, Shown = mklabel()
+        register_adapter(str, IShown, Shown)
+        self.assertEqual(adapt('text', IShown).label(), 'text')
+
+    def test_interface_source(self):
+        IShown, Shown = mklabel()
+        register_adapter(IName, IShown, lambda n: Shown(n.name()))
+        self.assertEqual(adapt(Person(), IShown).label(), 'person')
+
+    def test_decorator(self):
+        IShown, Shown = mklabel()
+
+        @register_adapter(int, IShown)
+        def from_int(value):
+            return Shown(str(value))
+
+        self.assertEqual(from_int(1).text, '1')
+        self.assertEqual(adapt(2, IShown).label(), '2')
+
+    def test_super_interface(self):
+        class IBase(Opaque):
+
+            def label(self):
+                """Return a label."""
+
+        class IDerived(IBase):
+            pass
+
+        @implements(IDerived)
+        class Derived(Label):
+            pass
+
+        register_adapter(float, IDerived, lambda value: Derived(str(value)))
+        self.assertEqual(adapt(1.5, IBase).label(), '1.5')
+
+    def test_nearest_class_preferred(self):
+        IShown, Shown = mklabel()
+
+        class Base:
+            pass
+
+        class Derived(Base):
+            pass
+
+        register_adapter(Derived, IShown, lambda obj: Shown('derived'))
+        register_adapter(Base, IShown, lambda obj: Shown('base'))
+        self.assertEqual(adapt(Derived(), IShown).label(), 'derived')
+        self.assertEqual(adapt(Base(), IShown).label(), 'base')
+
+    def test_class_preferred_to_interface(self):
+        IShown, Shown = mklabel()
+        register_adapter(Person, IShown, lambda obj: Shown('class'))
+        register_adapter(IName, IShown, lambda obj: Shown('interface'))
+        self.assertEqual(adapt(Person(), IShown).label(), 'class')
+
+    def test_specific_interface_preferred(self):
+        IShown, Shown = mklabel()
+
+        @implements(IFullName)
+        class Full(Person):
+
+            def full_name(self):
+                return 'full'
+
+        register_adapter(IFullName, IShown, lambda obj: Shown('full'))
+        register_adapter(IName, IShown, lambda obj: Shown('name'))
+        self.assertEqual(adapt(Full(), IShown).label(), 'full')
+        self.assertEqual(adapt(Person(), IShown).label(), 'name')
+
+    def test_latest_preferred(self):
+        IShown, Shown = mklabel()
+
+        class Source:
+            pass
+
+        register_adapter(Source, IShown, lambda obj: Shown('first'))
+        self.assertEqual(adapt(Source(), IShown).label(), 'first')
+        register_adapter(Source, IShown, lambda obj: Shown('second'))
+        self.assertEqual(adapt(Source(), IShown).label(), 'second')
+
+    def test_resolution_cached(self):
+        IShown, Shown = mklabel()
+
+        class Source:
+            pass
+
+        register_adapter(Source, IShown, lambda obj: Shown('source'))
+        adapt(Source(), IShown)
+        with mock.patch.object(_adapt, '_resolve') as resolve:
+            adapt(Source(), IShown)
+        self.assertEqual(resolve.call_count, 0)
+
+    def test_registration_invalidates(self):
+        IShown, Shown = mklabel()
+
+        class Source:
+            pass
+
+        register_adapter(IName, IShown, lambda obj: Shown(obj.name()))
+        self.assertIsNone(adapt(Source(), IShown, None))
+        Source.name = lambda self: 'source'
+        IName.register_implementation(Source)
+        self.assertEqual(adapt(Source(), IShown).label(), 'source')
+
+    def test_dynamic_source(self):
+        IShown, Shown = mklabel()
+
+        class Dynamic:
+
+            def name(self):
+                return 'dynamic'
+
+            def provides_interface(self, interface):
+                return interface is IName
+
+        DynamicInterface.register_implementation(Dynamic)
+        register_adapter(IName, IShown, lambda obj: Shown(obj.name()))
+        self.assertEqual(adapt(Dynamic(), IShown).label(), 'dynamic')
+
+    def test_not_adaptable(self):
+        with self.assertRaises(TypeError):
+            adapt(Unrelated(), ILabel)
+        self.assertIsNone(adapt(Unrelated(), ILabel, None))
+
+    def test_adapter_result_checked(self):
+        IShown, Shown = mklabel()
+
+        class Source:
+            pass
+
+        register_adapter(Source, IShown, lambda obj: obj)
+        with self.assertRaises(TypeError):
+            adapt(Source(), IShown)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            register_adapter(str, object, str)
+        with self.assertRaises(TypeError):
+            register_adapter('str', ILabel, Label)
+        with self.assertRaises(TypeError):
+            adapt('text', str)
+
+
+class AdaptAllTests(unittest.TestCase):
+
+    def test_adapt_all(self):
+        IShown, Shown = mklabel()
+        register_adapter(str, IShown, Shown)
+        register_adapter(int, IShown, lambda value: Shown(str(value)))
+        labels = adapt_all(['a', 1, Shown('b')], IShown)
+        self.assertEqual([label.label() for label in labels], ['a', '1', 'b'])
+
+    def test_resolved_once_per_class(self):
+        IShown, Shown = mklabel()
+        register_adapter(str, IShown, Shown)
+        with mock.patch.object(
+                _adapt, '_factory', wraps=_adapt._factory) as factory:
+            list(adapt_all(['a', 'b', 'c'], IShown))
+        self.assertEqual(factory.call_count, 1)
+
+    def test_default(self):
+        labels = list(adapt_all([Unrelated(), Label('a')], ILabel, None))
+        self.assertIsNone(labels[0])
+        self.assertEqual(labels[1].label(), 'a')
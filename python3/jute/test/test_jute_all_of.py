@@ -0,0 +1,166 @@
+import pickle
+import unittest
+from unittest import mock
+
+from jute import (
+    Attribute, Interface, Opaque, all_of, implements, underlying_object,
+    InterfaceConformanceError
+)
+
+
+class IReadable(Opaque):
+
+    def read(self):
+        """Read data."""
+
+
+class ISeekable(Opaque):
+
+    position = Attribute()
+
+    def seek(self, position):
+        """Seek to a position."""
+
+
+class IReadableFile(IReadable):
+
+    name = Attribute()
+
+
+@implements(IReadableFile, ISeekable)
+class File:
+
+    name = 'file'
+    position = 0
+
+    def read(self):
+        return 'data'
+
+    def seek(self, position):
+        self.position = position
+
+
+@implements(IReadable)
+class Stream:
+
+    def read(self):
+        return 'data'
+
+
+@implements(IReadable, ISeekable)
+class NoSeek:
+
+    position = 0
+
+    def read(self):
+        pass
+
+
+class AllOfTests(unittest.TestCase):
+
+    def test_combined_attributes(self):
+        face = all_of(IReadable, ISeekable)(File())
+        face.seek(3)
+        self.assertEqual(face.read(), 'data')
+        self.assertEqual(face.position, 3)
+        with self.assertRaises(AttributeError):
+            face.name
+
+    def test_single_wrapper(self):
+        provider = File()
+        combined = all_of(IReadable, ISeekable)
+        face = combined(provider)
+        self.assertIs(type(face), combined)
+        self.assertIs(underlying_object(face), provider)
+
+    def test_operator(self):
+        self.assertIs(IReadable & ISeekable, all_of(IReadable, ISeekable))
+
+    def test_cached(self):
+        self.assertIs(
+            all_of(IReadable, ISeekable), all_of(ISeekable, IReadable))
+
+    def test_name(self):
+        self.assertEqual(
+            all_of(IReadable, ISeekable).__name__, 'IReadable & ISeekable')
+
+    def test_flattened(self):
+        combined = all_of(IReadable, ISeekable)
+        self.assertIs(all_of(combined, IReadable), combined)
+        self.assertIs(all_of(combined & ISeekable), combined)
+
+    def test_sub_interface_returned(self):
+        self.assertIs(all_of(IReadable, IReadableFile), IReadableFile)
+
+    def test_upcast(self):
+        face = (IReadable & ISeekable)(File())
+        self.assertIs(type(IReadable(face)), IReadable)
+        self.assertIs(type(ISeekable(face)), ISeekable)
+
+    def test_provided_by(self):
+        combined = IReadable & ISeekable
+        self.assertTrue(combined.provided_by(File()))
+        self.assertTrue(combined.implemented_by(File))
+        self.assertFalse(combined.provided_by(Stream()))
+        self.assertIsInstance(File(), combined)
+
+    def test_not_provided(self):
+        with self.assertRaises(TypeError):
+            (IReadable & ISeekable)(Stream())
+
+    def test_non_conforming(self):
+        if __debug__:
+            with self.assertRaises(InterfaceConformanceError):
+                (IReadable & ISeekable)(NoSeek())
+
+    def test_checked_once_per_class(self):
+        combined = IReadableFile & ISeekable
+        combined(File())
+        with mock.patch.object(
+                Interface, 'raise_if_not_provided_by', autospec=True,
+                side_effect=Interface.raise_if_not_provided_by) as check:
+            combined(File())
+        self.assertEqual(check.call_count, 0)
+
+    def test_registered_directly(self):
+        combined = IReadable & ISeekable
+
+        class Direct:
+
+            position = 0
+
+            def read(self):
+                pass
+
+            def seek(self, position):
+                pass
+
+        combined.register_implementation(Direct)
+        self.assertTrue(combined.implemented_by(Direct))
+        self.assertTrue(IReadable.implemented_by(Direct))
+        combined(Direct())
+
+    def test_sub_interface_of_intersection(self):
+        class IReadSeekClose(IReadable & ISeekable):
+
+            def close(self):
+                """Close."""
+
+        self.assertFalse(IReadSeekClose.implemented_by(File))
+        with self.assertRaises(TypeError):
+            IReadSeekClose(File())
+
+    def test_pickle(self):
+        combined = IReadable & ISeekable
+        self.assertIs(pickle.loads(pickle.dumps(combined)), combined)
+        face = pickle.loads(pickle.dumps(combined(File())))
+        self.assertIs(type(face), combined)
+        self.assertEqual(face.read(), 'data')
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            all_of(IReadable, object)
+        with self.assertRaises(TypeError):
+            all_of()
+        with self.assertRaises(TypeError):
+            IReadable & object
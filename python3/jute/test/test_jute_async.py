@@ -0,0 +1,206 @@
+import asyncio
+import unittest
+
+from jute import Opaque, DynamicInterface, implements
+from jute._jute import _validate_coroutine
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncIterator(Opaque):
+
+    def __aiter__(self):
+        """Handle async for loops."""
+
+    def __anext__(self):
+        """Get an awaitable for the next item."""
+
+
+class AsyncContextManager(Opaque):
+
+    def __aenter__(self):
+        """Enter the async context."""
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the async context."""
+
+
+class AsyncMethod(Opaque):
+
+    async def fetch(self, value):
+        """Return the value asynchronously."""
+
+
+class AsyncIterTestMixin:
+
+    def get_test_object(self):
+        return object()
+
+    def test_async_for(self):
+        async def collect(iterator):
+            return [value async for value in iterator]
+        self.assertEqual(run(collect(self.get_test_object())), [0, 1, 2])
+
+    def test_anext(self):
+        iterator = self.get_test_object()
+        self.assertEqual(run(iterator.__anext__()), 0)
+
+
+@implements(AsyncIterator)
+class CountTo3:
+
+    def __init__(self):
+        self.count = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.count == 3:
+            raise StopAsyncIteration
+        self.count += 1
+        return self.count - 1
+
+
+class AsyncIterInstanceTests(AsyncIterTestMixin, unittest.TestCase):
+
+    def get_test_object(self):
+        return CountTo3()
+
+
+class AsyncIterInterfaceTests(AsyncIterTestMixin, unittest.TestCase):
+
+    def get_test_object(self):
+        return AsyncIterator(CountTo3())
+
+
+@implements(DynamicInterface)
+class AsyncIteratorProxy:
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+
+    def provides_interface(self, interface):
+        return interface.implemented_by(AsyncIterator)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self.wrapped.__anext__()
+
+
+class AsyncIterDynamicInterfaceTests(AsyncIterTestMixin, unittest.TestCase):
+
+    def get_test_object(self):
+        return AsyncIterator(AsyncIteratorProxy(CountTo3()))
+
+
+@implements(AsyncContextManager)
+class AsyncResource:
+
+    def __init__(self, suppress=False):
+        self.suppress = suppress
+        self.events = []
+
+    async def __aenter__(self):
+        self.events.append('enter')
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.events.append(exc_type)
+        return self.suppress
+
+
+class AsyncContextManagerTests(unittest.TestCase):
+
+    def test_async_with(self):
+        resource = AsyncResource()
+
+        async def use(manager):
+            async with manager as entered:
+                return entered
+        self.assertIs(run(use(AsyncContextManager(resource))), resource)
+        self.assertEqual(resource.events, ['enter', None])
+
+    def test_exception_propagates(self):
+        resource = AsyncResource()
+
+        async def use(manager):
+            async with manager:
+                raise KeyError('x')
+        with self.assertRaises(KeyError):
+            run(use(AsyncContextManager(resource)))
+        self.assertEqual(resource.events, ['enter', KeyError])
+
+    def test_exception_suppressed(self):
+        resource = AsyncResource(suppress=True)
+
+        async def use(manager):
+            async with manager:
+                raise KeyError('x')
+            return 'suppressed'
+        self.assertEqual(
+            run(use(AsyncContextManager(resource))), 'suppressed')
+
+    def test_forwarder_returns_provider_awaitable(self):
+        """The forwarder does not add a coroutine of its own."""
+        resource = AsyncResource()
+        awaitable = AsyncContextManager(resource).__aenter__()
+        self.assertEqual(awaitable.cr_code.co_name, '__aenter__')
+        self.assertIs(run(awaitable), resource)
+
+
+class AsyncMethodTests(unittest.TestCase):
+
+    def test_async_method(self):
+        @implements(AsyncMethod)
+        class Fetcher:
+
+            async def fetch(self, value):
+                return value
+
+        self.assertEqual(run(AsyncMethod(Fetcher()).fetch(4)), 4)
+
+
+class ValidateCoroutineTests(unittest.TestCase):
+
+    async def func(self, foo):
+        await asyncio.sleep(0)
+        return foo
+
+    def test_non_acting_validator(self):
+        def validate(kan):
+            yield
+        self.assertEqual(
+            run(_validate_coroutine([validate], self.func, (3,), {})), 3)
+
+    def test_failing_args_validator(self):
+        def validate(kan):
+            assert isinstance(kan, str)
+
+        with self.assertRaises(AssertionError):
+            run(_validate_coroutine([validate], self.func, (3,), {}))
+
+    def test_result_validator_sees_awaited_result(self):
+        results = []
+
+        def validate(kan):
+            result = yield
+            results.append(result)
+
+        run(_validate_coroutine([validate], self.func, (3,), {}))
+        self.assertEqual(results, [3])
+
+    def test_too_many_iterations(self):
+        def validate(kan):
+            yield
+            yield
+        with self.assertRaises(RuntimeError):
+            run(_validate_coroutine([validate], self.func, (3,), {}))
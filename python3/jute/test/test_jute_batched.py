@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import unittest
+
+from jute import (
+    Attribute, Opaque, batched, implements, InterfaceConformanceError
+)
+
+
+class IStore(Opaque):
+
+    @batched('get_many', window=0.05)
+    def get(self, key):
+        """Return the value for a key."""
+
+    def get_many(self, keys):
+        """Return the values for a list of keys."""
+
+
+class IAsyncStore(Opaque):
+
+    @batched('get_many', window=0)
+    async def get(self, key):
+        """Return the value for a key."""
+
+    async def get_many(self, keys):
+        """Return the values for a list of keys."""
+
+
+@implements(IStore)
+class Store:
+
+    def __init__(self):
+        self.batches = []
+
+    def get(self, key):
+        raise AssertionError('single call made')
+
+    def get_many(self, keys):
+        self.batches.append(list(keys))
+        if 'error' in keys:
+            raise KeyError('error')
+        if 'short' in keys:
+            return []
+        return [key.upper() for key in keys]
+
+
+@implements(IAsyncStore)
+class AsyncStore:
+
+    def __init__(self):
+        self.batches = []
+
+    async def get(self, key):
+        raise AssertionError('single call made')
+
+    async def get_many(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if 'error' in keys:
+            raise KeyError('error')
+        return [key.upper() for key in keys]
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class BatchedTests(unittest.TestCase):
+
+    def call_in_threads(self, face, keys):
+        results = {}
+        errors = {}
+
+        def call(key):
+            try:
+                results[key] = face.get(key)
+            except Exception as e:
+                errors[key] = e
+
+        threads = [threading.Thread(target=call, args=(key,)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_single_call(self):
+        store = Store()
+        self.assertEqual(IStore(store).get('a'), 'A')
+        self.assertEqual(store.batches, [['a']])
+
+    def test_threads_batched(self):
+        store = Store()
+        results, errors = self.call_in_threads(IStore(store), 'abcd')
+        self.assertEqual(results, {'a': 'A', 'b': 'B', 'c': 'C', 'd': 'D'})
+        self.assertEqual(len(store.batches), 1)
+        self.assertEqual(sorted(store.batches[0]), list('abcd'))
+
+    def test_providers_batched_separately(self):
+        first = Store()
+        second = Store()
+        self.assertEqual(IStore(first).get('a'), 'A')
+        self.assertEqual(IStore(second).get('b'), 'B')
+        self.assertEqual(first.batches, [['a']])
+        self.assertEqual(second.batches, [['b']])
+
+    def test_error_raised_in_each_thread(self):
+        results, errors = self.call_in_threads(
+            IStore(Store()), ['a', 'error'])
+        self.assertEqual(results, {})
+        self.assertEqual(sorted(errors), ['a', 'error'])
+        for error in errors.values():
+            self.assertIsInstance(error, KeyError)
+
+    def test_wrong_number_of_results(self):
+        with self.assertRaises(ValueError):
+            IStore(Store()).get('short')
+
+    def test_batch_method_unchanged(self):
+        store = Store()
+        self.assertEqual(IStore(store).get_many(['a', 'b']), ['A', 'B'])
+
+    def test_asyncio_batched(self):
+        store = AsyncStore()
+        face = IAsyncStore(store)
+
+        async def main():
+            return await asyncio.gather(*[face.get(key) for key in 'abc'])
+
+        self.assertEqual(run(main()), ['A', 'B', 'C'])
+        self.assertEqual(store.batches, [['a', 'b', 'c']])
+
+    def test_asyncio_separate_ticks(self):
+        store = AsyncStore()
+        face = IAsyncStore(store)
+
+        async def main():
+            return [await face.get('a'), await face.get('b')]
+
+        self.assertEqual(run(main()), ['A', 'B'])
+        self.assertEqual(store.batches, [['a'], ['b']])
+
+    def test_asyncio_error(self):
+        face = IAsyncStore(AsyncStore())
+
+        async def main():
+            return await asyncio.gather(
+                face.get('a'), face.get('error'), return_exceptions=True)
+
+        for result in run(main()):
+            self.assertIsInstance(result, KeyError)
+
+    def test_special_method(self):
+        with self.assertRaises(TypeError):
+            class ICall(Opaque):
+
+                @batched('call_many')
+                def __call__(self, arg):
+                    """Call."""
+
+    def test_undeclared_batch_method(self):
+        with self.assertRaises(InterfaceConformanceError):
+            class IMisspelt(Opaque):
+
+                @batched('get_mnay')
+                def get(self, key):
+                    """Return the value for a key."""
+
+    def test_batch_attribute(self):
+        with self.assertRaises(InterfaceConformanceError):
+            class IAttribute(Opaque):
+
+                get_many = Attribute()
+
+                @batched('get_many')
+                def get(self, key):
+                    """Return the value for a key."""
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            batched('get_many', window=-1)
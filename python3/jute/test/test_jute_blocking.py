@@ -0,0 +1,116 @@
+import asyncio
+import concurrent.futures
+import threading
+import unittest
+
+from jute import Attribute, Opaque, blocking, implements
+
+
+class IParser(Opaque):
+
+    name = Attribute()
+
+    @blocking
+    def parse(self, text, upper=False):
+        """Parse text."""
+
+    def check(self, text):
+        """Check text."""
+
+
+class ISubParser(IParser):
+    pass
+
+
+@implements(ISubParser)
+class Parser:
+
+    name = 'parser'
+
+    def __init__(self):
+        self.threads = []
+
+    def parse(self, text, upper=False):
+        self.threads.append(threading.current_thread())
+        return text.upper() if upper else text.split()
+
+    def check(self, text):
+        self.threads.append(threading.current_thread())
+        return bool(text)
+
+    def other(self):
+        pass
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncViewTests(unittest.TestCase):
+
+    def test_blocking_method_in_executor(self):
+        parser = Parser()
+        view = IParser.async_view(parser)
+        self.assertEqual(run(view.parse('a b')), ['a', 'b'])
+        self.assertIsNot(parser.threads[0], threading.current_thread())
+
+    def test_keyword_arguments(self):
+        view = IParser.async_view(Parser())
+        self.assertEqual(run(view.parse('a b', upper=True)), 'A B')
+
+    def test_executor(self):
+        parser = Parser()
+        with concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix='parser') as executor:
+            view = IParser.async_view(parser, executor=executor)
+            run(view.parse('a'))
+        self.assertTrue(parser.threads[0].name.startswith('parser'))
+
+    def test_concurrent_calls(self):
+        view = IParser.async_view(Parser())
+
+        async def main():
+            return await asyncio.gather(view.parse('a'), view.parse('b'))
+
+        self.assertEqual(run(main()), [['a'], ['b']])
+
+    def test_non_blocking_method(self):
+        parser = Parser()
+        view = IParser.async_view(parser)
+        self.assertTrue(view.check('a'))
+        self.assertIs(parser.threads[0], threading.current_thread())
+
+    def test_attribute(self):
+        view = IParser.async_view(Parser())
+        self.assertEqual(view.name, 'parser')
+        view.name = 'renamed'
+        self.assertEqual(view.name, 'renamed')
+
+    def test_restricts_attributes(self):
+        view = IParser.async_view(Parser())
+        with self.assertRaises(AttributeError):
+            view.other
+        with self.assertRaises(AttributeError):
+            view._face.provider
+
+    def test_inherited_blocking(self):
+        parser = Parser()
+        view = ISubParser.async_view(parser)
+        run(view.parse('a'))
+        self.assertIsNot(parser.threads[0], threading.current_thread())
+
+    def test_cast_on_creation(self):
+        with self.assertRaises(TypeError):
+            IParser.async_view(object())
+
+    def test_special_method(self):
+        with self.assertRaises(TypeError):
+            class ICall(Opaque):
+
+                @blocking
+                def __call__(self):
+                    """Call."""
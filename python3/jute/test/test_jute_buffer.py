@@ -0,0 +1,132 @@
+import sys
+import unittest
+
+from jute import Opaque, DynamicInterface, implements
+
+
+# Python classes can only provide the buffer protocol from Python 3.12
+# (PEP 688).  Earlier versions can still call the methods explicitly.
+buffer_protocol = unittest.skipIf(
+    sys.version_info < (3, 12), 'requires buffer protocol for classes')
+
+
+class Buffer(Opaque):
+
+    def __buffer__(self, flags):
+        """Return a memoryview of the object's memory."""
+
+
+class ReleasableBuffer(Buffer):
+
+    def __release_buffer__(self, view):
+        """Release a memoryview returned by __buffer__."""
+
+
+Buffer.register_implementation(bytes)
+ReleasableBuffer.register_implementation(bytearray)
+
+
+class BufferTestMixin:
+
+    def get_test_object(self, data):
+        return data
+
+    def test_buffer_method(self):
+        buf = self.get_test_object(b'foo')
+        view = buf.__buffer__(0)
+        self.assertEqual(view.tobytes(), b'foo')
+
+    @buffer_protocol
+    def test_memoryview(self):
+        buf = self.get_test_object(b'foo')
+        with memoryview(buf) as view:
+            self.assertEqual(view.tobytes(), b'foo')
+            self.assertTrue(view.readonly)
+
+    @buffer_protocol
+    def test_bytes(self):
+        buf = self.get_test_object(b'foo')
+        self.assertEqual(bytes(buf), b'foo')
+
+    @buffer_protocol
+    def test_zero_copy(self):
+        """Writes through the view change the provider's memory."""
+        data = bytearray(b'foo')
+        buf = self.get_test_object(data)
+        with memoryview(buf) as view:
+            view[0] = ord('b')
+        self.assertEqual(data, b'boo')
+
+    @buffer_protocol
+    def test_buffer_released(self):
+        """The provider can be resized after the view is released."""
+        data = bytearray(b'foo')
+        buf = self.get_test_object(data)
+        with memoryview(buf):
+            with self.assertRaises(BufferError):
+                data.append(0)
+        data.append(0)
+
+
+@buffer_protocol
+class BufferInstanceTests(BufferTestMixin, unittest.TestCase):
+
+    def get_test_object(self, data):
+        return data
+
+
+@buffer_protocol
+class BufferInterfaceTests(BufferTestMixin, unittest.TestCase):
+
+    def get_test_object(self, data):
+        return Buffer(data)
+
+
+@implements(DynamicInterface)
+class BufferProxy:
+
+    def __init__(self, data):
+        self.data = data
+
+    def provides_interface(self, interface):
+        return interface.implemented_by(ReleasableBuffer)
+
+    def __buffer__(self, flags):
+        return memoryview(self.data)
+
+    def __release_buffer__(self, view):
+        view.release()
+
+
+class BufferDynamicInterfaceTests(BufferTestMixin, unittest.TestCase):
+
+    def get_test_object(self, data):
+        return Buffer(BufferProxy(data))
+
+
+class ReleasableBufferDynamicInterfaceTests(
+        BufferTestMixin, unittest.TestCase):
+
+    def get_test_object(self, data):
+        return ReleasableBuffer(BufferProxy(data))
+
+    def test_release_buffer_method(self):
+        data = bytearray(b'foo')
+        buf = self.get_test_object(data)
+        view = buf.__buffer__(0)
+        buf.__release_buffer__(view)
+        data.append(0)
+
+
+@buffer_protocol
+class ReleasableBufferInterfaceTests(unittest.TestCase):
+
+    def test_buffer_released(self):
+        data = bytearray(b'foo')
+        buf = ReleasableBuffer(data)
+        with memoryview(buf) as view:
+            view[0] = ord('b')
+            with self.assertRaises(BufferError):
+                data.append(0)
+        data.append(0)
+        self.assertEqual(data, b'boo\x00')
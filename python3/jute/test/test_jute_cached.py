@@ -0,0 +1,239 @@
+import asyncio
+import time
+import unittest
+
+from jute import Attribute, Opaque, cached, implements
+
+
+class IConfig(Opaque):
+
+    name = Attribute()
+
+    @cached(maxsize=2)
+    def lookup(self, key, default=None):
+        """Look up a configuration setting."""
+
+    def uncached(self, key):
+        """Look up a setting without caching."""
+
+
+class ISubConfig(IConfig):
+    pass
+
+
+class IRedeclared(IConfig):
+
+    def lookup(self, key, default=None):
+        """Look up a setting without caching."""
+
+
+@implements(ISubConfig, IRedeclared)
+class Config:
+
+    name = 'config'
+
+    def __init__(self):
+        self.calls = 0
+
+    def lookup(self, key, default=None):
+        self.calls += 1
+        return key.upper()
+
+    def uncached(self, key):
+        self.calls += 1
+        return key.upper()
+
+
+@implements(IConfig)
+class SlotConfig:
+
+    __slots__ = ('calls',)
+
+    name = 'slots'
+
+    def __init__(self):
+        self.calls = 0
+
+    def lookup(self, key, default=None):
+        self.calls += 1
+        return key.upper()
+
+    def uncached(self, key):
+        pass
+
+
+class CachedTests(unittest.TestCase):
+
+    def setUp(self):
+        IConfig.lookup.cache_clear()
+
+    def test_cached(self):
+        config = Config()
+        face = IConfig(config)
+        self.assertEqual(face.lookup('a'), 'A')
+        self.assertEqual(face.lookup('a'), 'A')
+        self.assertEqual(config.calls, 1)
+
+    def test_uncached_method(self):
+        config = Config()
+        face = IConfig(config)
+        face.uncached('a')
+        face.uncached('a')
+        self.assertEqual(config.calls, 2)
+
+    def test_attribute(self):
+        self.assertEqual(IConfig(Config()).name, 'config')
+
+    def test_shared_by_interface_objects(self):
+        config = Config()
+        IConfig(config).lookup('a')
+        IConfig(config).lookup('a')
+        ISubConfig(config).lookup('a')
+        self.assertEqual(config.calls, 1)
+
+    def test_separate_providers(self):
+        first = Config()
+        second = Config()
+        IConfig(first).lookup('a')
+        IConfig(second).lookup('a')
+        self.assertEqual((first.calls, second.calls), (1, 1))
+
+    def test_provider_not_cached_directly(self):
+        config = Config()
+        config.lookup('a')
+        config.lookup('a')
+        self.assertEqual(config.calls, 2)
+
+    def test_keyword_arguments(self):
+        config = Config()
+        face = IConfig(config)
+        face.lookup('a', default=1)
+        face.lookup('a', default=1)
+        face.lookup('a', default=2)
+        face.lookup('a', 1)
+        self.assertEqual(config.calls, 3)
+
+    def test_maxsize(self):
+        config = Config()
+        face = IConfig(config)
+        face.lookup('a')
+        face.lookup('b')
+        face.lookup('a')
+        face.lookup('c')    # evicts 'b'
+        face.lookup('a')
+        self.assertEqual(config.calls, 3)
+        face.lookup('b')
+        self.assertEqual(config.calls, 4)
+
+    def test_cache_info(self):
+        face = IConfig(Config())
+        face.lookup('a')
+        face.lookup('a')
+        face.lookup('b')
+        info = IConfig.lookup.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_cache_clear_provider(self):
+        first = Config()
+        second = Config()
+        IConfig(first).lookup('a')
+        IConfig(second).lookup('a')
+        IConfig.lookup.cache_clear(first)
+        IConfig(first).lookup('a')
+        IConfig(second).lookup('a')
+        self.assertEqual((first.calls, second.calls), (2, 1))
+
+    def test_provider_cache_discarded(self):
+        IConfig(Config()).lookup('a')
+        self.assertEqual(IConfig.lookup.cache_info().currsize, 0)
+
+    def test_no_weak_reference(self):
+        config = SlotConfig()
+        face = IConfig(config)
+        face.lookup('a')
+        face.lookup('a')
+        self.assertEqual(config.calls, 2)
+
+    def test_redeclared_method_not_cached(self):
+        config = Config()
+        face = IRedeclared(config)
+        face.lookup('a')
+        face.lookup('a')
+        self.assertEqual(config.calls, 2)
+
+    def test_ttl(self):
+        class ITimed(Opaque):
+
+            @cached(ttl=0.01)
+            def lookup(self, key, default=None):
+                """Look up a configuration setting."""
+
+        ITimed.register_implementation(Config)
+        config = Config()
+        face = ITimed(config)
+        face.lookup('a')
+        face.lookup('a')
+        self.assertEqual(config.calls, 1)
+        time.sleep(0.02)
+        face.lookup('a')
+        self.assertEqual(config.calls, 2)
+
+    def test_key(self):
+        class IKeyed(Opaque):
+
+            @cached(key=lambda key, default=None: key.lower())
+            def lookup(self, key, default=None):
+                """Look up a configuration setting."""
+
+        IKeyed.register_implementation(Config)
+        config = Config()
+        face = IKeyed(config)
+        self.assertEqual(face.lookup('a'), 'A')
+        self.assertEqual(face.lookup('A'), 'A')
+        self.assertEqual(config.calls, 1)
+
+    def test_coroutine(self):
+        class IAsyncConfig(Opaque):
+
+            @cached()
+            async def lookup(self, key):
+                """Look up a configuration setting."""
+
+        @implements(IAsyncConfig)
+        class AsyncConfig:
+
+            calls = 0
+
+            async def lookup(self, key):
+                self.calls += 1
+                return key.upper()
+
+        config = AsyncConfig()
+        face = IAsyncConfig(config)
+
+        async def main():
+            return [await face.lookup('a'), await face.lookup('a')]
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(main()), ['A', 'A'])
+        finally:
+            loop.close()
+        self.assertEqual(config.calls, 1)
+
+    def test_special_method(self):
+        with self.assertRaises(TypeError):
+            class ICall(Opaque):
+
+                @cached()
+                def __call__(self):
+                    """Call."""
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            cached(maxsize=-1)
+        with self.assertRaises(ValueError):
+            cached(ttl=0)
@@ -0,0 +1,140 @@
+import unittest
+from unittest import mock
+
+from jute import (
+    Attribute, DynamicInterface, Interface, Opaque, implements,
+    underlying_object, InterfaceConformanceError
+)
+
+
+class IFoo(Opaque):
+
+    def foo(self):
+        """Foo."""
+
+
+class IFooBar(IFoo):
+
+    def bar(self):
+        """Bar."""
+
+
+class IBaz(Opaque):
+
+    baz = Attribute()
+
+
+@implements(IFooBar, IBaz)
+class FooBarBaz:
+
+    baz = 1
+
+    def foo(self):
+        pass
+
+    def bar(self):
+        pass
+
+
+def count_checks():
+    return mock.patch.object(
+        Interface, 'raise_if_not_provided_by', autospec=True,
+        side_effect=Interface.raise_if_not_provided_by)
+
+
+class UpcastTests(unittest.TestCase):
+
+    def test_upcast(self):
+        provider = FooBarBaz()
+        foo = IFoo(IFooBar(provider))
+        self.assertIs(type(foo), IFoo)
+        self.assertIs(underlying_object(foo), provider)
+
+    def test_upcast_not_checked(self):
+        foobar = IFooBar(FooBarBaz())
+        with count_checks() as check:
+            IFoo(foobar)
+        self.assertEqual(check.call_count, 0)
+
+    def test_upcast_validated(self):
+        foobar = IFooBar(FooBarBaz())
+        with count_checks() as check:
+            IFoo(foobar, validate=True)
+        self.assertEqual(check.call_count, 1)
+
+    def test_upcast_lazy(self):
+        foo = IFoo(IFooBar.lazy(FooBarBaz))
+        self.assertIsInstance(underlying_object(foo), FooBarBaz)
+
+    def test_upcast_with_cast(self):
+        foobar = IFooBar(FooBarBaz())
+        self.assertIs(type(IFoo.cast(foobar)), IFoo)
+
+
+class CastCacheTests(unittest.TestCase):
+
+    def test_downcast(self):
+        foo = IFoo(FooBarBaz())
+        foobar = IFooBar.cast(foo)
+        self.assertIs(type(foobar), IFooBar)
+        self.assertIs(underlying_object(foobar), underlying_object(foo))
+
+    def test_sidecast(self):
+        baz = IBaz.cast(IFooBar(FooBarBaz()))
+        self.assertEqual(baz.baz, 1)
+
+    def test_checked_once_per_class(self):
+        class ISide(Opaque):
+
+            baz = Attribute()
+
+        ISide.register_implementation(FooBarBaz)
+        faces = [IFoo(FooBarBaz()) for i in range(3)]
+        with count_checks() as check:
+            for face in faces:
+                ISide.cast(face)
+        self.assertEqual(check.call_count, 1)
+
+    def test_invalid_cast_not_cached(self):
+        class IOther(Opaque):
+
+            def other(self):
+                """Other."""
+
+        foo = IFoo(FooBarBaz())
+        for i in range(2):
+            with self.assertRaises(TypeError):
+                IOther.cast(foo)
+
+    def test_unregister_clears_cache(self):
+        class ISide(Opaque):
+
+            baz = Attribute()
+
+        ISide.register_implementation(FooBarBaz)
+        foo = IFoo(FooBarBaz())
+        ISide.cast(foo)
+        ISide.unregister_implementation(FooBarBaz)
+        with self.assertRaises(TypeError):
+            ISide.cast(foo)
+
+    def test_dynamic_provider_checked(self):
+        class ISide(Opaque):
+
+            baz = Attribute()
+
+        @implements(IFoo)
+        class Dynamic:
+
+            def foo(self):
+                pass
+
+            def provides_interface(self, interface):
+                return interface is ISide
+
+        DynamicInterface.register_implementation(Dynamic)
+        face = IFoo(Dynamic())
+        for i in range(2):
+            if __debug__:
+                with self.assertRaises(InterfaceConformanceError):
+                    ISide.cast(face)
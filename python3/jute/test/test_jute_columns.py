@@ -0,0 +1,114 @@
+import array
+import unittest
+
+from jute import Attribute, Columns, Opaque
+
+
+class IPoint(Opaque):
+
+    x = Attribute(type=float)
+    y = Attribute(type=float)
+
+
+class ILabelledPoint(IPoint):
+
+    label = Attribute(type=str)
+    count = Attribute(type=int)
+
+
+class IMethod(Opaque):
+
+    def method(self):
+        """Not an attribute."""
+
+
+class ColumnsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.points = Columns(ILabelledPoint)
+        self.points.append(1.0, 2.0, 'a', 1)
+        self.points.append(x=3.0, y=4.0, label='b', count=2)
+
+    def test_len(self):
+        self.assertEqual(len(self.points), 2)
+
+    def test_names(self):
+        self.assertEqual(self.points.names, ('x', 'y', 'label', 'count'))
+
+    def test_row_provides_interface(self):
+        point = ILabelledPoint(self.points[1])
+        self.assertEqual((point.x, point.y), (3.0, 4.0))
+        self.assertEqual((point.label, point.count), ('b', 2))
+
+    def test_row_provides_base_interface(self):
+        point = IPoint(self.points[0])
+        self.assertEqual((point.x, point.y), (1.0, 2.0))
+
+    def test_negative_index(self):
+        self.assertEqual(self.points[-1].label, 'b')
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.points[2]
+
+    def test_iter(self):
+        self.assertEqual([p.label for p in self.points], ['a', 'b'])
+
+    def test_columns(self):
+        self.assertEqual(self.points.column('x'), array.array('d', [1, 3]))
+        self.assertEqual(self.points.column('count'), array.array('q', [1, 2]))
+        self.assertEqual(self.points.column('label'), ['a', 'b'])
+
+    def test_unknown_column(self):
+        with self.assertRaises(AttributeError):
+            self.points.column('z')
+
+    def test_write_through_row(self):
+        point = ILabelledPoint(self.points[0])
+        point.x = 5.0
+        self.assertEqual(self.points.column('x')[0], 5.0)
+
+    def test_write_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.points[0].x = 'a'
+
+    def test_append_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self.points.append(1.0, 2.0, 3, 4)
+        self.assertEqual(len(self.points), 2)
+
+    def test_array_requires_exact_type(self):
+        with self.assertRaises(TypeError):
+            self.points.append(1.0, 2.0, 'c', True)
+        self.assertEqual(len(self.points), 2)
+        with self.assertRaises(TypeError):
+            self.points[0].count = False
+        self.assertIs(self.points[0].count, 1)
+
+    def test_append_missing_attribute(self):
+        with self.assertRaises(TypeError):
+            self.points.append(1.0, 2.0)
+
+    def test_append_unknown_attribute(self):
+        with self.assertRaises(TypeError):
+            self.points.append(1.0, 2.0, 'c', 3, z=4)
+
+    def test_rows_are_compact(self):
+        self.assertFalse(hasattr(self.points[0], '__dict__'))
+
+    def test_typecodes(self):
+        points = Columns(IPoint, typecodes={'x': 'f'})
+        points.append(1.5, 2.5)
+        self.assertEqual(points.column('x').typecode, 'f')
+        self.assertEqual(points.column('y').typecode, 'd')
+
+    def test_array_rejects_value(self):
+        """Columns stay the same length if an array rejects a value."""
+        points = Columns(ILabelledPoint)
+        with self.assertRaises(OverflowError):
+            points.append(1.0, 2.0, 'a', 2 ** 64)
+        self.assertEqual(len(points.column('x')), 0)
+
+    def test_non_attribute_interface(self):
+        with self.assertRaises(TypeError):
+            Columns(IMethod)
@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+
+from jute import Opaque, DynamicInterface, implements, returns_interface
+
+
+class ContextManager(Opaque):
+
+    def __enter__(self):
+        """Enter the context."""
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the context."""
+
+
+class InterfaceContextManager(Opaque):
+
+    @returns_interface
+    def __enter__(self):
+        """Enter the context, returning the interface."""
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the context."""
+
+
+class AsyncInterfaceContextManager(Opaque):
+
+    @returns_interface
+    def __aenter__(self):
+        """Enter the async context, returning the interface."""
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the async context."""
+
+
+@implements(ContextManager, InterfaceContextManager)
+class Resource:
+
+    def __init__(self, suppress=False):
+        self.suppress = suppress
+        self.events = []
+
+    def __enter__(self):
+        self.events.append('enter')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.events.append(exc_type)
+        return self.suppress
+
+
+class ContextTestMixin:
+
+    def get_test_objects(self, suppress=False):
+        """Return the object to test and the underlying provider."""
+        return object(), object()
+
+    def test_with(self):
+        manager, provider = self.get_test_objects()
+        with manager:
+            pass
+        self.assertEqual(provider.events, ['enter', None])
+
+    def test_exception_propagates(self):
+        manager, provider = self.get_test_objects()
+        with self.assertRaises(KeyError):
+            with manager:
+                raise KeyError('x')
+        self.assertEqual(provider.events, ['enter', KeyError])
+
+    def test_exception_suppressed(self):
+        manager, provider = self.get_test_objects(suppress=True)
+        with manager:
+            raise KeyError('x')
+        self.assertEqual(provider.events, ['enter', KeyError])
+
+    def test_enter_returns_provider(self):
+        manager, provider = self.get_test_objects()
+        with manager as entered:
+            self.assertIs(entered, provider)
+
+    def test_attribute(self):
+        manager, provider = self.get_test_objects()
+        manager.__enter__()
+        self.assertFalse(manager.__exit__(None, None, None))
+
+
+class ContextInstanceTests(ContextTestMixin, unittest.TestCase):
+
+    def get_test_objects(self, suppress=False):
+        provider = Resource(suppress)
+        return provider, provider
+
+
+class ContextInterfaceTests(ContextTestMixin, unittest.TestCase):
+
+    def get_test_objects(self, suppress=False):
+        provider = Resource(suppress)
+        return ContextManager(provider), provider
+
+
+@implements(DynamicInterface)
+class ResourceProxy(Resource):
+
+    def provides_interface(self, interface):
+        return interface.implemented_by(ContextManager)
+
+
+class ContextDynamicInterfaceTests(ContextTestMixin, unittest.TestCase):
+
+    def get_test_objects(self, suppress=False):
+        provider = ResourceProxy(suppress)
+        return ContextManager(provider), provider
+
+
+class ReturnsInterfaceTests(unittest.TestCase):
+
+    def test_enter_returns_interface(self):
+        face = InterfaceContextManager(Resource())
+        with face as entered:
+            self.assertIs(entered, face)
+
+    def test_enter_returns_other_value(self):
+        @implements(InterfaceContextManager)
+        class Opener(Resource):
+
+            def __enter__(self):
+                return 'file'
+
+        with InterfaceContextManager(Opener()) as entered:
+            self.assertEqual(entered, 'file')
+
+    def test_aenter_returns_interface(self):
+        @implements(AsyncInterfaceContextManager)
+        class AsyncResource:
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_value, traceback):
+                return False
+
+        async def use(manager):
+            async with manager as entered:
+                return entered
+
+        face = AsyncInterfaceContextManager(AsyncResource())
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertIs(loop.run_until_complete(use(face)), face)
+        finally:
+            loop.close()
+
+    def test_invalid_method(self):
+        with self.assertRaises(TypeError):
+            class AnInterface(Opaque):
+
+                @returns_interface
+                def __exit__(self, exc_type, exc_value, traceback):
+                    pass
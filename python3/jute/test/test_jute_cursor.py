@@ -0,0 +1,80 @@
+import unittest
+
+from jute import (
+    Attribute, Opaque, DynamicInterface, implements, underlying_object,
+    InterfaceConformanceError
+)
+
+
+class IRow(Opaque):
+
+    value = Attribute()
+
+
+@implements(IRow)
+class Row:
+
+    def __init__(self, value):
+        self.value = value
+
+
+@implements(IRow)
+class NoValue:
+    pass
+
+
+class CursorTests(unittest.TestCase):
+
+    def test_values(self):
+        rows = [Row(1), Row(2), Row(3)]
+        self.assertEqual([row.value for row in IRow.cursor(rows)], [1, 2, 3])
+
+    def test_single_interface_object(self):
+        rows = [Row(1), Row(2)]
+        faces = [id(row) for row in IRow.cursor(rows)]
+        self.assertEqual(len(set(faces)), 1)
+
+    def test_provider_is_current_item(self):
+        rows = [Row(1), Row(2)]
+        for face, row in zip(IRow.cursor(rows), rows):
+            self.assertIs(underlying_object(face), row)
+            self.assertIs(type(face), IRow)
+
+    def test_restricts_attributes(self):
+        rows = [Row(1)]
+        for face in IRow.cursor(rows):
+            with self.assertRaises(AttributeError):
+                face.other
+
+    def test_set_attribute(self):
+        rows = [Row(1), Row(2)]
+        for face in IRow.cursor(rows):
+            face.value *= 10
+        self.assertEqual([row.value for row in rows], [10, 20])
+
+    def test_unwraps_interfaces(self):
+        row = Row(1)
+        for face in IRow.cursor([IRow(row)]):
+            self.assertIs(underlying_object(face), row)
+
+    def test_non_provider_fails(self):
+        with self.assertRaises(TypeError):
+            list(IRow.cursor([Row(1), 'not a row']))
+
+    def test_non_conforming_provider(self):
+        with self.assertRaises(InterfaceConformanceError):
+            list(IRow.cursor([Row(1), NoValue()], validate=True))
+
+    def test_dynamic_provider_checked_each_time(self):
+        @implements(DynamicInterface)
+        class MaybeRow:
+
+            def __init__(self, is_row):
+                self.is_row = is_row
+                self.value = 1
+
+            def provides_interface(self, interface):
+                return self.is_row and interface.implemented_by(IRow)
+
+        with self.assertRaises(TypeError):
+            list(IRow.cursor([MaybeRow(True), MaybeRow(False)]))
@@ -217,3 +217,57 @@ class WhenSubinterfaceHasCommonSuperattributes(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             IAttributeTypeA(Implementation())
+
+
+class IMethod(Opaque):
+
+    def method(self):
+        """A method."""
+
+
+class IMethodLeft(IMethod):
+    pass
+
+
+class IMethodRight(IMethod):
+
+    def other(self):
+        """Another method."""
+
+
+class IMethodDiamond(IMethodLeft, IMethodRight):
+    pass
+
+
+class WhenInterfacesShareAttributeTables(unittest.TestCase):
+
+    def test_tables_are_tuples(self):
+        self.assertIsInstance(IMethod._provider_attributes['method'], tuple)
+
+    def test_table_shared_without_declarations(self):
+        self.assertIs(
+            IMethodLeft._provider_attributes, IMethod._provider_attributes)
+
+    def test_table_read_only(self):
+        with self.assertRaises(TypeError):
+            IMethodLeft._provider_attributes['other'] = ()
+        self.assertNotIn('other', IMethod._provider_attributes)
+
+    def test_validators_shared(self):
+        self.assertIs(
+            IMethodRight._provider_attributes['method'],
+            IMethod._provider_attributes['method'])
+
+    def test_diamond_not_duplicated(self):
+        self.assertEqual(
+            len(IMethodDiamond._provider_attributes['method']), 1)
+        self.assertIn('other', IMethodDiamond._provider_attributes)
+
+    def test_redeclared_method_added(self):
+        class IRedeclared(IMethod):
+
+            def method(self):
+                """The method, again."""
+
+        self.assertEqual(len(IRedeclared._provider_attributes['method']), 2)
+        self.assertEqual(len(IMethod._provider_attributes['method']), 1)
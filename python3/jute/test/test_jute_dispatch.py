@@ -0,0 +1,211 @@
+import unittest
+from unittest import mock
+
+from jute import (
+    AmbiguousDispatchError, DynamicInterface, Opaque, dispatch, implements
+)
+from jute import _dispatch
+
+
+class IShape(Opaque):
+
+    def area(self):
+        """Return the area."""
+
+
+class ICircle(IShape):
+
+    radius = 1
+
+
+class IColoured(Opaque):
+
+    def colour(self):
+        """Return the colour."""
+
+
+@implements(IShape)
+class Square:
+
+    def area(self):
+        return 1
+
+
+@implements(ICircle)
+class Circle:
+
+    radius = 1
+
+    def area(self):
+        return 3
+
+
+@implements(IShape, IColoured)
+class RedSquare(Square):
+
+    def colour(self):
+        return 'red'
+
+
+def mkdescribe():
+    @dispatch
+    def describe(obj):
+        return 'object'
+
+    @describe.register(IShape)
+    def describe_shape(shape):
+        return 'shape'
+
+    return describe
+
+
+class DispatchTests(unittest.TestCase):
+
+    def test_default(self):
+        self.assertEqual(mkdescribe()(1), 'object')
+
+    def test_interface(self):
+        self.assertEqual(mkdescribe()(Square()), 'shape')
+
+    def test_sub_interface(self):
+        describe = mkdescribe()
+
+        @describe.register(ICircle)
+        def describe_circle(circle):
+            return 'circle'
+
+        self.assertEqual(describe(Circle()), 'circle')
+        self.assertEqual(describe(Square()), 'shape')
+
+    def test_class_preferred(self):
+        describe = mkdescribe()
+        describe.register(Square, lambda square: 'square')
+        self.assertEqual(describe(Square()), 'square')
+        self.assertEqual(describe(RedSquare()), 'square')
+
+    def test_interface_object(self):
+        describe = mkdescribe()
+        describe.register(Square, lambda square: 'square')
+        self.assertEqual(describe(IShape(Square())), 'shape')
+        self.assertEqual(describe(IColoured(RedSquare())), 'object')
+
+    def test_arguments(self):
+        @dispatch
+        def scale(shape, factor, offset=0):
+            return None
+
+        @scale.register(IShape)
+        def scale_shape(shape, factor, offset=0):
+            return shape.area() * factor + offset
+
+        self.assertEqual(scale(Circle(), 2, offset=1), 7)
+
+    def test_registration_after_call(self):
+        describe = mkdescribe()
+        self.assertEqual(describe(Circle()), 'shape')
+        describe.register(ICircle, lambda circle: 'circle')
+        self.assertEqual(describe(Circle()), 'circle')
+
+    def test_implementation_registered_after_call(self):
+        describe = mkdescribe()
+
+        class Late:
+
+            def area(self):
+                return 0
+
+        self.assertEqual(describe(Late()), 'object')
+        IShape.register_implementation(Late)
+        self.assertEqual(describe(Late()), 'shape')
+
+    def test_cached(self):
+        describe = mkdescribe()
+        describe(Square())
+        with mock.patch.object(_dispatch, '_best') as best:
+            describe(Square())
+        self.assertEqual(best.call_count, 0)
+
+    def test_dynamic(self):
+        describe = mkdescribe()
+
+        class Dynamic:
+
+            def __init__(self, shape):
+                self.shape = shape
+
+            def area(self):
+                return 0
+
+            def provides_interface(self, interface):
+                return self.shape and interface is IShape
+
+        DynamicInterface.register_implementation(Dynamic)
+        self.assertEqual(describe(Dynamic(True)), 'shape')
+        self.assertEqual(describe(Dynamic(False)), 'object')
+
+    def test_ambiguous(self):
+        describe = mkdescribe()
+        describe.register(IColoured, lambda coloured: 'coloured')
+        with self.assertRaises(AmbiguousDispatchError) as cm:
+            describe(RedSquare())
+        self.assertIn('RedSquare', str(cm.exception))
+        describe.register(RedSquare, lambda square: 'red square')
+        self.assertEqual(describe(RedSquare()), 'red square')
+
+    def test_missing_argument(self):
+        with self.assertRaises(TypeError):
+            mkdescribe()()
+
+    def test_invalid_registration(self):
+        describe = mkdescribe()
+        with self.assertRaises(TypeError):
+            describe.register(IShape, ICircle, IColoured)
+        with self.assertRaises(TypeError):
+            describe.register('IShape')
+
+    def test_wrapped(self):
+        describe = mkdescribe()
+        self.assertEqual(describe.__name__, 'describe')
+
+
+class MultipleDispatchTests(unittest.TestCase):
+
+    def mkcollide(self):
+        @dispatch(args=2)
+        def collide(first, second):
+            return 'objects'
+
+        @collide.register(IShape, IShape)
+        def collide_shapes(first, second):
+            return 'shapes'
+
+        @collide.register(ICircle, object)
+        def collide_circle(first, second):
+            return 'circle'
+
+        return collide
+
+    def test_dispatch(self):
+        collide = self.mkcollide()
+        self.assertEqual(collide(Square(), Square()), 'shapes')
+        self.assertEqual(collide(Circle(), 1), 'circle')
+        self.assertEqual(collide(Square(), 1), 'objects')
+
+    def test_ambiguous(self):
+        collide = self.mkcollide()
+        with self.assertRaises(AmbiguousDispatchError):
+            collide(Circle(), Square())
+
+    def test_resolved(self):
+        collide = self.mkcollide()
+        collide.register(ICircle, IShape, lambda first, second: 'circle shape')
+        self.assertEqual(collide(Circle(), Square()), 'circle shape')
+
+    def test_invalid(self):
+        collide = self.mkcollide()
+        with self.assertRaises(TypeError):
+            collide.register(IShape)
+        with self.assertRaises(TypeError):
+            collide(Square())
+        with self.assertRaises(ValueError):
+            dispatch(args=0)(lambda: None)
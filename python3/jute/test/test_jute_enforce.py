@@ -0,0 +1,185 @@
+import unittest
+
+from jute import Attribute, Opaque, implements
+
+
+class IValue(Opaque):
+
+    value = Attribute(type=int)
+    count = Attribute(type=int)
+    label = Attribute()
+
+
+class IPositive(IValue):
+
+    value = Attribute(type=bool)
+
+
+class EnforceTests(unittest.TestCase):
+
+    def test_direct_assignment_checked(self):
+        @implements(IValue, enforce=True)
+        class Value:
+
+            def __init__(self, value):
+                self.value = value
+                self.count = 0
+                self.label = None
+
+        obj = Value(1)
+        obj.value = 2
+        self.assertEqual(obj.value, 2)
+        with self.assertRaises(TypeError):
+            obj.value = 'a'
+        with self.assertRaises(TypeError):
+            Value('a')
+
+    def test_interface_assignment_checked(self):
+        @implements(IValue, enforce=True)
+        class Value:
+
+            value = 1
+            count = 0
+            label = None
+
+        face = IValue(Value())
+        face.value = 2
+        self.assertEqual(face.value, 2)
+        with self.assertRaises(TypeError):
+            face.value = 'a'
+
+    def test_untyped_attribute_not_enforced(self):
+        @implements(IValue, enforce=True)
+        class Value:
+            pass
+
+        self.assertNotIn('label', Value.__dict__)
+        obj = Value()
+        obj.label = 'anything'
+
+    def test_exclude(self):
+        @implements(IValue, enforce=True, exclude=('count',))
+        class Value:
+            pass
+
+        obj = Value()
+        obj.count = 'not checked'
+        with self.assertRaises(TypeError):
+            obj.value = 'checked'
+
+    def test_class_default(self):
+        @implements(IValue, enforce=True)
+        class Value:
+
+            value = 1
+
+        obj = Value()
+        self.assertEqual(obj.value, 1)
+        self.assertEqual(Value.value, 1)
+        obj.value = 2
+        self.assertEqual(obj.value, 2)
+        self.assertEqual(Value.value, 1)
+        del obj.value
+        self.assertEqual(obj.value, 1)
+
+    def test_no_default(self):
+        @implements(IValue, enforce=True)
+        class Value:
+            pass
+
+        obj = Value()
+        with self.assertRaises(AttributeError):
+            obj.value
+        with self.assertRaises(AttributeError):
+            del obj.value
+
+    def test_slots(self):
+        @implements(IValue, enforce=True)
+        class Value:
+
+            __slots__ = ('value', 'count', 'label')
+
+        obj = Value()
+        obj.value = 1
+        self.assertEqual(obj.value, 1)
+        with self.assertRaises(TypeError):
+            obj.value = 'a'
+        del obj.value
+        with self.assertRaises(AttributeError):
+            obj.value
+
+    def test_property(self):
+        @implements(IValue, enforce=True)
+        class Value:
+
+            _value = 0
+
+            @property
+            def value(self):
+                return self._value
+
+            @value.setter
+            def value(self, value):
+                self._value = value
+
+        obj = Value()
+        obj.value = 3
+        self.assertEqual(obj._value, 3)
+        with self.assertRaises(TypeError):
+            obj.value = 'a'
+
+    def test_subclass_enforced(self):
+        @implements(IValue, enforce=True)
+        class Value:
+            pass
+
+        class SubValue(Value):
+            pass
+
+        with self.assertRaises(TypeError):
+            SubValue().value = 'a'
+
+    def test_all_interfaces_enforced(self):
+        @implements(IValue, IPositive, enforce=True)
+        class Value:
+            pass
+
+        obj = Value()
+        obj.value = True
+        with self.assertRaises(TypeError):
+            obj.value = 1
+
+    def test_not_enforced_by_default(self):
+        @implements(IValue)
+        class Value:
+            pass
+
+        obj = Value()
+        obj.value = 'a'
+
+    def test_immutable_class_not_registered(self):
+        class IInteger(Opaque):
+
+            real = Attribute(type=int)
+
+        with self.assertRaises(TypeError):
+            IInteger.register_implementation(int, enforce=True)
+        self.assertFalse(IInteger.implemented_by(int))
+
+    def test_failed_install_restored(self):
+        class Meta(type):
+
+            def __setattr__(cls, name, value):
+                if name == 'count':
+                    raise AttributeError(name)
+                super().__setattr__(name, value)
+
+        class Value(metaclass=Meta):
+
+            value = 1
+
+        with self.assertRaises(AttributeError):
+            IValue.register_implementation(Value, enforce=True)
+        self.assertFalse(IValue.implemented_by(Value))
+        self.assertEqual(Value.__dict__['value'], 1)
+        self.assertNotIn('count', Value.__dict__)
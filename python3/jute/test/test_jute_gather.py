@@ -0,0 +1,103 @@
+import array
+import functools
+import unittest
+
+from jute import Attribute, Opaque, implements, InterfaceConformanceError
+
+
+class IValue(Opaque):
+
+    value = Attribute(type=float)
+    label = Attribute()
+
+    def method(self):
+        """A method."""
+
+
+@implements(IValue)
+class Value:
+
+    label = 'label'
+
+    def __init__(self, value):
+        self.value = value
+
+    def method(self):
+        pass
+
+
+@implements(IValue)
+class NoLabel:
+
+    def __init__(self, value):
+        self.value = value
+
+    def method(self):
+        pass
+
+
+class GatherTests(unittest.TestCase):
+
+    def test_gather(self):
+        objs = [Value(1.0), Value(2.0)]
+        self.assertEqual(IValue.gather(objs, 'value'), [1.0, 2.0])
+
+    def test_gather_interfaces(self):
+        objs = [IValue(Value(1.0)), Value(2.0)]
+        self.assertEqual(IValue.gather(objs, 'value'), [1.0, 2.0])
+
+    def test_gather_into(self):
+        objs = [Value(1.0), Value(2.0)]
+        values = IValue.gather(
+            objs, 'value', into=functools.partial(array.array, 'd'))
+        self.assertEqual(values, array.array('d', [1.0, 2.0]))
+
+    def test_gather_method(self):
+        obj = Value(1.0)
+        methods = IValue.gather([obj], 'method')
+        self.assertEqual(methods, [obj.method])
+
+    def test_gather_undeclared_attribute(self):
+        with self.assertRaises(AttributeError):
+            IValue.gather([Value(1.0)], 'other')
+
+    def test_gather_non_provider(self):
+        with self.assertRaises(TypeError):
+            IValue.gather([Value(1.0), 'value'], 'value')
+
+    def test_gather_non_conforming_provider(self):
+        with self.assertRaises(InterfaceConformanceError):
+            IValue.gather([NoLabel(1.0)], 'value', validate=True)
+
+    def test_gather_wrong_type(self):
+        with self.assertRaises(TypeError):
+            IValue.gather([Value(1.0), Value(2)], 'value')
+
+
+class ScatterTests(unittest.TestCase):
+
+    def test_scatter(self):
+        objs = [Value(1.0), Value(2.0)]
+        IValue.scatter(objs, 'value', [3.0, 4.0])
+        self.assertEqual([obj.value for obj in objs], [3.0, 4.0])
+
+    def test_scatter_iterable(self):
+        objs = [Value(1.0), Value(2.0)]
+        IValue.scatter(objs, 'value', iter([3.0, 4.0]))
+        self.assertEqual([obj.value for obj in objs], [3.0, 4.0])
+
+    def test_scatter_undeclared_attribute(self):
+        with self.assertRaises(AttributeError):
+            IValue.scatter([Value(1.0)], 'other', [1])
+
+    def test_scatter_wrong_type(self):
+        objs = [Value(1.0), Value(2.0)]
+        with self.assertRaises(TypeError):
+            IValue.scatter(objs, 'value', [3.0, 'a'])
+        self.assertEqual(objs[1].value, 2.0)
+
+    def test_scatter_different_lengths(self):
+        with self.assertRaises(ValueError):
+            IValue.scatter([Value(1.0)], 'value', [3.0, 4.0])
+        with self.assertRaises(ValueError):
+            IValue.scatter([Value(1.0), Value(2.0)], 'value', [3.0])
@@ -0,0 +1,147 @@
+import threading
+import time
+import unittest
+
+from jute import (
+    Attribute, Opaque, implements, underlying_object,
+    InterfaceConformanceError
+)
+
+
+class ICounter(Opaque):
+
+    count = Attribute()
+
+    def increment(self):
+        """Increment the count."""
+
+    def __call__(self):
+        """Return the count."""
+
+
+class ISub(ICounter):
+    pass
+
+
+@implements(ISub)
+class Counter:
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+    def __call__(self):
+        return self.count
+
+
+class Factory:
+
+    def __init__(self, cls=Counter, delay=0):
+        self.cls = cls
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.cls()
+
+
+class LazyTests(unittest.TestCase):
+
+    def test_factory_not_called_until_access(self):
+        factory = Factory()
+        ICounter.lazy(factory)
+        self.assertEqual(factory.calls, 0)
+
+    def test_provides_interface(self):
+        face = ICounter.lazy(Factory())
+        self.assertIsInstance(face, ICounter)
+
+    def test_attribute_access(self):
+        factory = Factory()
+        face = ICounter.lazy(factory)
+        self.assertEqual(face.count, 0)
+        face.increment()
+        self.assertEqual(face.count, 1)
+        self.assertEqual(factory.calls, 1)
+
+    def test_set_attribute(self):
+        factory = Factory()
+        face = ICounter.lazy(factory)
+        face.count = 5
+        self.assertEqual(face.count, 5)
+        self.assertEqual(factory.calls, 1)
+
+    def test_special_method(self):
+        factory = Factory()
+        face = ICounter.lazy(factory)
+        self.assertEqual(face(), 0)
+        self.assertEqual(factory.calls, 1)
+
+    def test_becomes_interface(self):
+        face = ICounter.lazy(Factory())
+        face.increment()
+        self.assertIs(type(face), ICounter)
+
+    def test_restricts_attributes(self):
+        face = ICounter.lazy(Factory())
+        with self.assertRaises(AttributeError):
+            face.other
+
+    def test_underlying_object(self):
+        factory = Factory()
+        face = ICounter.lazy(factory)
+        self.assertIsInstance(underlying_object(face), Counter)
+        self.assertEqual(factory.calls, 1)
+
+    def test_cast(self):
+        face = ICounter.lazy(Factory())
+        self.assertIs(type(Opaque(face)), Opaque)
+        self.assertIsInstance(underlying_object(ICounter(face)), Counter)
+
+    def test_sub_interface(self):
+        face = ISub.lazy(Factory())
+        self.assertEqual(ICounter(face).count, 0)
+
+    def test_non_provider(self):
+        factory = Factory(cls=object)
+        face = ICounter.lazy(factory)
+        with self.assertRaises(TypeError):
+            face.count
+        with self.assertRaises(TypeError):
+            face.count
+        self.assertEqual(factory.calls, 2)
+
+    def test_non_conforming_provider(self):
+        @implements(ICounter)
+        class NoCount:
+
+            def increment(self):
+                pass
+
+            def __call__(self):
+                pass
+
+        face = ICounter.lazy(Factory(cls=NoCount))
+        if __debug__:
+            with self.assertRaises(InterfaceConformanceError):
+                face.increment()
+
+    def test_threads_call_factory_once(self):
+        factory = Factory(delay=0.01)
+        face = ICounter.lazy(factory)
+        results = []
+
+        def access():
+            results.append(face.count)
+
+        threads = [threading.Thread(target=access) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [0] * 10)
+        self.assertEqual(factory.calls, 1)
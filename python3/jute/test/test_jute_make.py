@@ -0,0 +1,114 @@
+import gc
+import pickle
+import threading
+import unittest
+import weakref
+
+from jute import (
+    Attribute, Interface, Opaque, make_interface, InvalidAttributeName
+)
+
+
+class IBase(Opaque):
+
+    key = Attribute(type=int)
+
+
+class Row:
+
+    id = 1
+
+
+class MakeInterfaceTests(unittest.TestCase):
+
+    def test_interface(self):
+        IRow = make_interface('IRow', {'id': int, 'name': Attribute()})
+        self.assertIsInstance(IRow, Interface)
+        self.assertEqual(IRow.__name__, 'IRow')
+        self.assertEqual(IRow.id.type, int)
+        self.assertEqual(IRow.name.type, object)
+
+    def test_cast(self):
+        IRow = make_interface('IRow', {'id': int})
+
+        class Row:
+            id = 1
+
+        IRow.register_implementation(Row)
+        self.assertEqual(IRow(Row()).id, 1)
+
+    def test_interned(self):
+        first = make_interface('IRow', {'id': int, 'name': str})
+        second = make_interface(
+            'IRow', {'name': Attribute(type=str), 'id': int})
+        self.assertIs(first, second)
+
+    def test_registration_shared(self):
+        class Row:
+            id = 1
+
+        make_interface('IRow', {'id': int}).register_implementation(Row)
+        interface = make_interface('IRow', {'id': int})
+        self.assertTrue(interface.implemented_by(Row))
+
+    def test_different_structure(self):
+        first = make_interface('IRow', {'id': int})
+        self.assertIsNot(first, make_interface('IRow', {'id': str}))
+        self.assertIsNot(first, make_interface('IRow', {'key': int}))
+        self.assertIsNot(first, make_interface('IOther', {'id': int}))
+        self.assertIsNot(
+            first, make_interface('IRow', {'id': int}, bases=(IBase,)))
+
+    def test_bases(self):
+        IRow = make_interface('IRow', {'id': int}, bases=(IBase,))
+        self.assertTrue(issubclass(IRow, IBase))
+        self.assertIn('key', IRow._provider_attributes)
+
+    def test_not_kept_alive(self):
+        ref = weakref.ref(make_interface('IUnused', {'id': int}))
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_invalid_attribute(self):
+        with self.assertRaises(TypeError):
+            make_interface('IRow', {'id': 1})
+
+    def test_pickle(self):
+        IRow = make_interface('IRow', {'id': Attribute('Key', type=int)})
+        IRow.register_implementation(Row)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                self.assertIs(pickle.loads(pickle.dumps(IRow, protocol)), IRow)
+                face = pickle.loads(pickle.dumps(IRow(Row()), protocol))
+                self.assertIs(type(face), IRow)
+                self.assertEqual(face.id, 1)
+
+    def test_pickle_sub_interface(self):
+        IKeyed = make_interface('IKeyed', {'id': int}, bases=(IBase,))
+        self.assertIs(pickle.loads(pickle.dumps(IKeyed)), IKeyed)
+
+    def test_pickle_not_made(self):
+        self.assertIs(pickle.loads(pickle.dumps(IBase)), IBase)
+
+    def test_invalid_base(self):
+        with self.assertRaises(TypeError):
+            make_interface('IRow', {'id': int}, bases=(object,))
+
+    def test_reserved_name(self):
+        with self.assertRaises(InvalidAttributeName):
+            make_interface('IRow', {'__getattribute__': int})
+        with self.assertRaises(InvalidAttributeName):
+            make_interface('IRow', {'__len__': int, 'id': int})
+
+    def test_threads(self):
+        interfaces = []
+
+        def make():
+            interfaces.append(make_interface('IThreaded', {'id': int}))
+
+        threads = [threading.Thread(target=make) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(interfaces)), 1)
@@ -0,0 +1,117 @@
+import copy
+import pickle
+import unittest
+
+from jute import Attribute, Opaque, implements, underlying_object
+
+
+class IPoint(Opaque):
+
+    x = Attribute()
+
+    def move(self, dx):
+        """Move the point."""
+
+
+@implements(IPoint)
+class Point:
+
+    def __init__(self, x):
+        self.x = x
+
+    def move(self, dx):
+        self.x += dx
+
+
+class Claimed:
+
+    def __init__(self, x):
+        self.x = x
+
+    def move(self, dx):
+        self.x += dx
+
+
+IPoint.register_implementation(Claimed)
+
+
+class Counted:
+
+    """Count the number of times a class is checked for conformance."""
+
+    checks = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    def __getattr__(self, name):
+        if name == 'move':
+            type(self).checks += 1
+            return lambda dx: None
+        raise AttributeError(name)
+
+
+IPoint.register_implementation(Counted)
+
+
+class PickleTests(unittest.TestCase):
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                face = pickle.loads(pickle.dumps(IPoint(Point(1)), protocol))
+                self.assertIs(type(face), IPoint)
+                self.assertIsInstance(underlying_object(face), Point)
+                self.assertEqual(face.x, 1)
+
+    def test_pickle_claimed(self):
+        face = pickle.loads(pickle.dumps(IPoint(Claimed(2))))
+        self.assertIs(type(face), IPoint)
+        self.assertEqual(face.x, 2)
+
+    def test_class_checked_once(self):
+        Counted.checks = 0
+        data = pickle.dumps([IPoint(Counted(1)) for i in range(3)])
+        checks = Counted.checks
+        faces = pickle.loads(data)
+        self.assertEqual([face.x for face in faces], [1, 1, 1])
+        self.assertLessEqual(Counted.checks, checks + 1)
+
+    def test_shared_provider(self):
+        point = Point(1)
+        faces = pickle.loads(pickle.dumps([IPoint(point), IPoint(point)]))
+        self.assertIs(underlying_object(faces[0]), underlying_object(faces[1]))
+
+    def test_compact(self):
+        points = [Point(i) for i in range(1000)]
+        faces = [IPoint(point) for point in points]
+        # Protocols before 4 do not memoize the interface reference as
+        # compactly.
+        protocol = pickle.HIGHEST_PROTOCOL
+        size = len(pickle.dumps(points, protocol))
+        self.assertLess(
+            len(pickle.dumps(faces, protocol)), size + 10 * len(faces))
+
+    def test_lazy(self):
+        face = pickle.loads(pickle.dumps(IPoint.lazy(lambda: Point(3))))
+        self.assertIs(type(face), IPoint)
+        self.assertEqual(face.x, 3)
+
+    def test_copy(self):
+        point = Point(1)
+        face = copy.copy(IPoint(point))
+        self.assertIs(type(face), IPoint)
+        self.assertIs(underlying_object(face), point)
+
+    def test_deepcopy(self):
+        point = Point(1)
+        face = copy.deepcopy(IPoint(point))
+        self.assertIs(type(face), IPoint)
+        self.assertIsNot(underlying_object(face), point)
+        self.assertEqual(face.x, 1)
+
+    def test_reduce_not_visible(self):
+        face = IPoint(Point(1))
+        self.assertNotIn('__reduce_ex__', dir(face))
+        with self.assertRaises(AttributeError):
+            face.__reduce__
@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from jute import (
+    Attribute, Opaque, Pool, implements, InterfaceConformanceError
+)
+from jute import _jute
+
+
+class IConnection(Opaque):
+
+    name = Attribute()
+
+    def execute(self, query):
+        """Execute a query."""
+
+    async def fetch(self, query):
+        """Fetch a query result asynchronously."""
+
+
+@implements(IConnection)
+class Connection:
+
+    def __init__(self, name, delay=0):
+        self.name = name
+        self.delay = delay
+        self.active = 0
+        self.most_active = 0
+
+    def execute(self, query):
+        self.active += 1
+        self.most_active = max(self.active, self.most_active)
+        time.sleep(self.delay)
+        self.active -= 1
+        return self.name, query
+
+    async def fetch(self, query):
+        self.active += 1
+        self.most_active = max(self.active, self.most_active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self.name, query
+
+    def other(self):
+        pass
+
+
+@implements(IConnection)
+class NoName:
+
+    def execute(self, query):
+        pass
+
+    async def fetch(self, query):
+        pass
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class PoolTests(unittest.TestCase):
+
+    def test_provides_interface(self):
+        pool = Pool(IConnection, [Connection('a')])
+        self.assertTrue(IConnection.provided_by(pool))
+        self.assertTrue(Opaque.provided_by(pool))
+        db = IConnection(pool)
+        self.assertEqual(db.execute('q'), ('a', 'q'))
+
+    def test_restricts_attributes(self):
+        db = IConnection(Pool(IConnection, [Connection('a')]))
+        with self.assertRaises(AttributeError):
+            db.other
+        with self.assertRaises(AttributeError):
+            Pool(IConnection, [Connection('a')]).other
+
+    def test_attribute(self):
+        db = IConnection(Pool(IConnection, [Connection('a')]))
+        self.assertEqual(db.name, 'a')
+
+    def test_attribute_read_while_busy(self):
+        pool = Pool(IConnection, [Connection('a')])
+        with pool.checkout():
+            self.assertEqual(IConnection(pool).name, 'a')
+
+    def test_attribute_without_providers(self):
+        db = IConnection(Pool(IConnection))
+        with self.assertRaises(AttributeError):
+            db.name
+
+    def test_cast_not_checked(self):
+        pool = Pool(IConnection, [Connection('a')])
+        with mock.patch.object(
+                _jute, 'missing_attributes',
+                side_effect=_jute.missing_attributes) as check:
+            IConnection(pool)
+        self.assertEqual(check.call_count, 0)
+
+    def test_interface_method_named_like_pool_method(self):
+        class IBag(Opaque):
+
+            def add(self, item):
+                """Add an item."""
+
+        class Bag:
+
+            def __init__(self):
+                self.items = []
+
+            def add(self, item):
+                self.items.append(item)
+
+        IBag.register_implementation(Bag)
+        bag = Bag()
+        pool = Pool(IBag, [bag])
+        IBag(pool).add(1)
+        self.assertEqual(bag.items, [1])
+
+    def test_round_robin(self):
+        pool = Pool(IConnection, [Connection('a'), Connection('b')])
+        names = [pool.execute('q')[0] for i in range(4)]
+        self.assertEqual(names, ['a', 'b', 'a', 'b'])
+
+    def test_least_busy(self):
+        pool = Pool(
+            IConnection, [Connection('a'), Connection('b')],
+            policy='least_busy', limit=2)
+        with pool.checkout() as first:
+            self.assertEqual(pool.execute('q')[0], 'b')
+        self.assertEqual(first.name, 'a')
+
+    def test_checkout(self):
+        pool = Pool(IConnection, [Connection('a'), Connection('b')])
+        with pool.checkout() as connection:
+            self.assertEqual(connection.name, 'a')
+            self.assertEqual(pool.execute('q')[0], 'b')
+            self.assertEqual(pool.execute('q')[0], 'b')
+
+    def test_bounded_threads(self):
+        connections = [Connection('a', 0.01), Connection('b', 0.01)]
+        pool = Pool(IConnection, connections)
+        results = []
+
+        def call():
+            results.append(pool.execute('q'))
+
+        threads = [threading.Thread(target=call) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        for connection in connections:
+            self.assertEqual(connection.most_active, 1)
+
+    def test_limit(self):
+        connections = [Connection('a', 0.01)]
+        pool = Pool(IConnection, connections, limit=3)
+        threads = [
+            threading.Thread(target=pool.execute, args=('q',))
+            for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(connections[0].most_active, 3)
+
+    def test_asyncio(self):
+        connections = [Connection('a', 0.01), Connection('b', 0.01)]
+        db = IConnection(Pool(IConnection, connections))
+
+        async def main():
+            return await asyncio.gather(*[db.fetch(i) for i in range(6)])
+
+        results = run(main())
+        self.assertEqual([query for name, query in results], list(range(6)))
+        for connection in connections:
+            self.assertEqual(connection.most_active, 1)
+
+    def test_asyncio_cancelled_waiter(self):
+        connections = [Connection('a', 0.01)]
+        pool = Pool(IConnection, connections)
+
+        async def main():
+            first = asyncio.ensure_future(pool.fetch(1))
+            cancelled = asyncio.ensure_future(pool.fetch(2))
+            last = asyncio.ensure_future(pool.fetch(3))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await first, await last
+
+        self.assertEqual(run(main()), (('a', 1), ('a', 3)))
+
+    def test_async_checkout(self):
+        pool = Pool(IConnection, [Connection('a')])
+
+        async def main():
+            async with pool.checkout() as connection:
+                return connection.name
+
+        self.assertEqual(run(main()), 'a')
+
+    def test_add_checks_provider(self):
+        pool = Pool(IConnection)
+        with self.assertRaises(TypeError):
+            pool.add(object())
+        with self.assertRaises(InterfaceConformanceError):
+            pool.add(NoName())
+
+    def test_add_interface(self):
+        pool = Pool(IConnection)
+        pool.add(IConnection(Connection('a')))
+        self.assertEqual(pool.execute('q'), ('a', 'q'))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            Pool(IConnection, policy='random')
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            Pool(IConnection, limit=0)
@@ -0,0 +1,200 @@
+import os
+import threading
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+
+from jute import (
+    Attribute, Opaque, ProcessPool, implements, InterfaceConformanceError
+)
+
+
+class IWorker(Opaque):
+
+    name = Attribute()
+
+    def square(self, value):
+        """Return the square of a value."""
+
+    def pid(self):
+        """Return the process id."""
+
+    def fail(self, message):
+        """Raise an error."""
+
+    def unpicklable(self):
+        """Return an object that cannot be pickled."""
+
+    def exit(self):
+        """Exit the process."""
+
+
+@implements(IWorker)
+class Worker:
+
+    def __init__(self, name='worker'):
+        self.name = name
+
+    def square(self, value):
+        return value * value
+
+    def pid(self):
+        return os.getpid()
+
+    def fail(self, message):
+        raise ValueError(message)
+
+    def unpicklable(self):
+        return threading.Lock()
+
+    def exit(self):
+        os._exit(1)
+
+    def other(self):
+        pass
+
+
+@implements(IWorker)
+class NoName:
+
+    def square(self, value):
+        pass
+
+    def pid(self):
+        pass
+
+    def fail(self, message):
+        pass
+
+    def unpicklable(self):
+        pass
+
+    def exit(self):
+        pass
+
+
+def broken_factory():
+    raise KeyError('broken')
+
+
+class ProcessPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ProcessPool(IWorker, Worker, 'remote', processes=2)
+        self.addCleanup(self.pool.close)
+
+    def test_provides_interface(self):
+        self.assertTrue(IWorker.provided_by(self.pool))
+        worker = IWorker(self.pool)
+        self.assertEqual(worker.square(3), 9)
+
+    def test_runs_in_other_process(self):
+        self.assertNotEqual(self.pool.pid(), os.getpid())
+
+    def test_attribute(self):
+        self.assertEqual(IWorker(self.pool).name, 'remote')
+
+    def test_set_attribute(self):
+        with self.assertRaises(TypeError):
+            self.pool.name = 'local'
+
+    def test_restricts_attributes(self):
+        with self.assertRaises(AttributeError):
+            self.pool.other
+        with self.assertRaises(AttributeError):
+            self.pool.submit('other')
+
+    def test_submit(self):
+        futures = [self.pool.submit('square', i) for i in range(10)]
+        self.assertEqual(
+            [future.result() for future in futures],
+            [i * i for i in range(10)])
+
+    def test_cancel(self):
+        futures = [self.pool.submit('square', i) for i in range(200)]
+        cancelled = [future.cancel() for future in futures]
+        self.assertEqual(self.pool.submit('square', 3).result(timeout=5), 9)
+        for future, was_cancelled in zip(futures, cancelled):
+            if not was_cancelled:
+                self.assertIn(future.result(timeout=5), range(200 * 200))
+
+    def test_submit_attribute(self):
+        with self.assertRaises(TypeError):
+            self.pool.submit('name')
+
+    def test_map(self):
+        self.assertEqual(
+            list(self.pool.map('square', range(100))),
+            [i * i for i in range(100)])
+
+    def test_exception(self):
+        with self.assertRaisesRegex(ValueError, 'failed'):
+            self.pool.fail('failed')
+
+    def test_unpicklable_result(self):
+        futures = [
+            self.pool.submit('square', 2),
+            self.pool.submit('unpicklable'),
+            self.pool.submit('square', 3),
+        ]
+        self.assertEqual(futures[0].result(), 4)
+        with self.assertRaises(Exception):
+            futures[1].result()
+        self.assertEqual(futures[2].result(), 9)
+
+    def test_unpicklable_argument(self):
+        with self.assertRaises(Exception):
+            self.pool.square(threading.Lock())
+        self.assertEqual(self.pool.square(2), 4)
+
+    def test_threads(self):
+        results = []
+
+        def call(value):
+            results.append(self.pool.square(value))
+
+        threads = [
+            threading.Thread(target=call, args=(i,)) for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), [i * i for i in range(10)])
+
+    def test_worker_exit(self):
+        pool = ProcessPool(IWorker, Worker, processes=1)
+        self.addCleanup(pool.close)
+        with self.assertRaises(BrokenProcessPool):
+            pool.exit()
+
+    def test_close(self):
+        pool = ProcessPool(IWorker, Worker, processes=1)
+        future = pool.submit('square', 2)
+        pool.close()
+        self.assertEqual(future.result(), 4)
+        with self.assertRaises(RuntimeError):
+            pool.square(2)
+
+
+class ProcessPoolCreationTests(unittest.TestCase):
+
+    def test_factory_error(self):
+        with self.assertRaises(KeyError):
+            ProcessPool(IWorker, broken_factory, processes=1)
+
+    def test_non_conforming_provider(self):
+        with self.assertRaises(InterfaceConformanceError):
+            ProcessPool(IWorker, NoName, processes=1)
+
+    def test_invalid_processes(self):
+        with self.assertRaises(ValueError):
+            ProcessPool(IWorker, Worker, processes=0)
+
+    def test_context_manager(self):
+        with ProcessPool(IWorker, Worker, processes=1) as pool:
+            self.assertEqual(pool.square(2), 4)
+
+    def test_spawned_by_default(self):
+        with ProcessPool(IWorker, Worker, processes=1) as pool:
+            for worker in pool._workers:
+                self.assertEqual(worker.process._start_method, 'spawn')
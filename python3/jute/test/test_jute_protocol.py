@@ -0,0 +1,243 @@
+import abc
+import collections.abc
+import sys
+import typing
+import unittest
+from unittest import mock
+
+from jute import Attribute, DynamicInterface, Opaque, as_abc, implements
+
+# `typing.Protocol` was added in Python 3.8
+protocols = unittest.skipIf(
+    sys.version_info < (3, 8), 'requires typing.Protocol')
+
+if sys.version_info >= (3, 8):
+    from jute import as_protocol
+
+
+class IReadable(Opaque):
+
+    name = Attribute(type=str)
+
+    def read(self, size=-1):
+        """Read data."""
+
+
+class IReadableFile(IReadable):
+
+    def close(self):
+        """Close the file."""
+
+
+@implements(IReadable)
+class Stream:
+
+    name = 'stream'
+
+    def read(self, size=-1):
+        return 'data'
+
+
+class Lookalike:
+
+    name = 'lookalike'
+
+    def read(self, size=-1):
+        return 'data'
+
+
+if sys.version_info >= (3, 8):
+
+    @typing.runtime_checkable
+    class SupportsRead(typing.Protocol):
+
+        def read(self, size=-1):
+            ...
+
+
+def count_claims(interface):
+    return mock.patch.object(
+        type(interface), 'implemented_by', autospec=True,
+        side_effect=type(interface).implemented_by)
+
+
+@protocols
+class ProtocolTests(unittest.TestCase):
+
+    def test_protocol(self):
+        Readable = as_protocol(IReadable)
+        self.assertTrue(issubclass(Readable, typing.Protocol))
+        self.assertEqual(Readable.__name__, 'IReadable')
+        self.assertEqual(Readable.__annotations__, {'name': str})
+        self.assertTrue(callable(Readable.read))
+
+    def test_same_protocol(self):
+        self.assertIs(as_protocol(IReadable), as_protocol(IReadable))
+
+    def test_sub_interface(self):
+        self.assertIsNot(as_protocol(IReadableFile), as_protocol(IReadable))
+        self.assertTrue(hasattr(as_protocol(IReadableFile), 'close'))
+
+    def test_isinstance(self):
+        Readable = as_protocol(IReadable)
+        self.assertIsInstance(Stream(), Readable)
+        self.assertIsInstance(IReadable(Stream()), Readable)
+        self.assertNotIsInstance(Lookalike(), Readable)
+        self.assertTrue(issubclass(Stream, Readable))
+        self.assertFalse(issubclass(Lookalike, Readable))
+
+    def test_derived(self):
+        class Derived(as_protocol(IReadable)):
+
+            name = 'derived'
+
+            def read(self, size=-1):
+                return 'data'
+
+        self.assertIsInstance(Derived(), as_protocol(IReadable))
+
+    def test_cached(self):
+        Readable = as_protocol(IReadableFile)
+        isinstance(Stream(), Readable)
+        with count_claims(IReadableFile) as check:
+            isinstance(Stream(), Readable)
+            issubclass(Stream, Readable)
+        self.assertEqual(check.call_count, 0)
+
+    def test_registration_invalidates(self):
+        class IOther(Opaque):
+
+            def read(self, size=-1):
+                """Read data."""
+
+        Other = as_protocol(IOther)
+        self.assertNotIsInstance(Lookalike(), Other)
+        IOther.register_implementation(Lookalike)
+        self.assertIsInstance(Lookalike(), Other)
+        IOther.unregister_implementation(Lookalike)
+        self.assertNotIsInstance(Lookalike(), Other)
+
+    def test_dynamic(self):
+        class Dynamic:
+
+            def __init__(self, readable):
+                self.readable = readable
+
+            def provides_interface(self, interface):
+                return self.readable and interface is IReadable
+
+        DynamicInterface.register_implementation(Dynamic)
+        self.assertIsInstance(Dynamic(True), as_protocol(IReadable))
+        self.assertNotIsInstance(Dynamic(False), as_protocol(IReadable))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            as_protocol(Stream)
+
+
+class ABCTests(unittest.TestCase):
+
+    def test_abc(self):
+        Readable = as_abc(IReadable)
+        self.assertIsInstance(Readable, abc.ABCMeta)
+        self.assertEqual(Readable.__abstractmethods__, frozenset({'read'}))
+        with self.assertRaises(TypeError):
+            Readable()
+
+    def test_isinstance(self):
+        Readable = as_abc(IReadable)
+        self.assertIsInstance(Stream(), Readable)
+        self.assertNotIsInstance(Lookalike(), Readable)
+
+    def test_subclass(self):
+        class Reader(as_abc(IReadable)):
+
+            name = 'reader'
+
+            def read(self, size=-1):
+                return 'data'
+
+        self.assertIsInstance(Reader(), as_abc(IReadable))
+
+    def test_abc_registered(self):
+        class Registered:
+            pass
+
+        as_abc(IReadableFile).register(Registered)
+        self.assertIsInstance(Registered(), as_abc(IReadableFile))
+
+    def test_interface_not_changed(self):
+        as_abc(IReadable)
+        self.assertFalse(
+            getattr(IReadable.__dict__['read'], '__isabstractmethod__', False))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            as_abc(Stream)
+
+
+class RegisterProtocolTests(unittest.TestCase):
+
+    @protocols
+    def test_protocol_implementation(self):
+        class IReader(Opaque):
+
+            def read(self, size=-1):
+                """Read data."""
+
+        IReader.register_implementation(SupportsRead)
+        self.assertTrue(IReader.implemented_by(Lookalike))
+        self.assertEqual(IReader(Lookalike()).read(), 'data')
+        self.assertFalse(IReader.implemented_by(int))
+
+    @protocols
+    def test_protocol_check_cached(self):
+        class IReader(Opaque):
+
+            def read(self, size=-1):
+                """Read data."""
+
+        IReader.register_implementation(SupportsRead)
+        IReader.implemented_by(Lookalike)
+        with mock.patch.object(
+                type(SupportsRead), '__subclasscheck__') as check:
+            IReader.implemented_by(Lookalike)
+        self.assertEqual(check.call_count, 0)
+
+    def test_abc_registration_invalidates(self):
+        class ISized(Opaque):
+
+            def __len__(self):
+                """Return the size."""
+
+        class Sized(abc.ABC):
+            pass
+
+        class Box:
+
+            def __len__(self):
+                return 0
+
+        ISized.register_implementation(Sized)
+        self.assertFalse(ISized.implemented_by(Box))
+        Sized.register(Box)
+        self.assertTrue(ISized.implemented_by(Box))
+
+    @protocols
+    def test_unsupported_protocol(self):
+        class SupportsClose(typing.Protocol):
+
+            def close(self):
+                ...
+
+        with self.assertRaises(TypeError):
+            IReadableFile.register_implementation(SupportsClose)
+
+    def test_abstract_base_class(self):
+        class ISized(Opaque):
+
+            def __len__(self):
+                """Return the size."""
+
+        ISized.register_implementation(collections.abc.Sized)
+        self.assertTrue(ISized.implemented_by(dict))
@@ -0,0 +1,103 @@
+import collections.abc
+import gc
+import unittest
+import weakref
+
+from jute import Opaque, implements
+
+
+class ISized(Opaque):
+
+    def __len__(self):
+        """Return the size."""
+
+
+class IBase(Opaque):
+
+    def method(self):
+        """A method."""
+
+
+class IDerived(IBase):
+    pass
+
+
+def mkclass():
+    return type('Dynamic', (), {'method': lambda self: None})
+
+
+class WeakRegistryTests(unittest.TestCase):
+
+    def test_class_not_kept_alive(self):
+        cls = mkclass()
+        IDerived.register_implementation(cls)
+        ref = weakref.ref(cls)
+        del cls
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_dead_classes_pruned(self):
+        class IChurn(IBase):
+            pass
+
+        for i in range(1000):
+            IChurn.register_implementation(mkclass())
+        gc.collect()
+        self.assertEqual(len(IChurn._unverified), 0)
+
+    def test_subclass_of_registered_class(self):
+        cls = mkclass()
+        IBase.register_implementation(cls)
+        self.assertTrue(IBase.implemented_by(type('Sub', (cls,), {})))
+
+    def test_abstract_base_class(self):
+        class ISizedABC(ISized):
+            pass
+
+        ISizedABC.register_implementation(collections.abc.Sized)
+        self.assertTrue(ISizedABC.implemented_by(list))
+        self.assertEqual(len(ISizedABC([1, 2])), 2)
+        ISizedABC.unregister_implementation(collections.abc.Sized)
+        self.assertFalse(ISizedABC.implemented_by(list))
+
+
+class UnregisterTests(unittest.TestCase):
+
+    def test_unregister(self):
+        cls = mkclass()
+        IDerived.register_implementation(cls)
+        IDerived.unregister_implementation(cls)
+        self.assertFalse(IDerived.implemented_by(cls))
+        self.assertFalse(IBase.implemented_by(cls))
+        with self.assertRaises(TypeError):
+            IBase(cls())
+
+    def test_unregister_keeps_other_registrations(self):
+        cls = mkclass()
+        IBase.register_implementation(cls)
+        IDerived.register_implementation(cls)
+        IDerived.unregister_implementation(cls)
+        self.assertFalse(IDerived.implemented_by(cls))
+        self.assertTrue(IBase.implemented_by(cls))
+
+    def test_unregister_decorated(self):
+        @implements(IDerived)
+        class Provider:
+
+            def method(self):
+                pass
+
+        IDerived.unregister_implementation(Provider)
+        self.assertFalse(IDerived.provided_by(Provider()))
+
+    def test_unregister_unregistered(self):
+        cls = mkclass()
+        IBase.unregister_implementation(cls)
+        self.assertFalse(IBase.implemented_by(cls))
+
+    def test_reregister(self):
+        cls = mkclass()
+        IBase.register_implementation(cls)
+        IBase.unregister_implementation(cls)
+        IBase.register_implementation(cls)
+        self.assertTrue(IBase.implemented_by(cls))
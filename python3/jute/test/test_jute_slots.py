@@ -0,0 +1,113 @@
+import unittest
+
+from jute import (
+    Attribute, Opaque, provider_class, InterfaceConformanceError
+)
+
+
+class IPoint(Opaque):
+
+    x = Attribute(type=int)
+    y = Attribute(type=int)
+
+
+class INamedPoint(IPoint):
+
+    def name(self):
+        """Return the name of the point."""
+
+
+class Named:
+
+    __slots__ = ()
+
+    def name(self):
+        return 'point at {}, {}'.format(self.x, self.y)
+
+
+Point = provider_class(IPoint)
+FrozenPoint = provider_class(IPoint, 'FrozenPoint', frozen=True, order=True)
+
+
+class ProviderClassTests(unittest.TestCase):
+
+    def test_name(self):
+        self.assertEqual(Point.__name__, 'IPointProvider')
+        self.assertEqual(FrozenPoint.__name__, 'FrozenPoint')
+
+    def test_provides_interface(self):
+        point = IPoint(Point(1, y=2))
+        self.assertEqual((point.x, point.y), (1, 2))
+
+    def test_registered_as_verified(self):
+        self.assertIn(Point, IPoint._verified)
+
+    def test_slots(self):
+        self.assertEqual(Point.__slots__, ('x', 'y'))
+        self.assertFalse(hasattr(Point(1, 2), '__dict__'))
+
+    def test_type_checked(self):
+        with self.assertRaises(TypeError):
+            Point(1, 'a')
+
+    def test_missing_value(self):
+        with self.assertRaises(TypeError):
+            Point(1)
+
+    def test_unexpected_value(self):
+        with self.assertRaises(TypeError):
+            Point(1, 2, z=3)
+        with self.assertRaises(TypeError):
+            Point(1, 2, 3)
+        with self.assertRaises(TypeError):
+            Point(1, x=2)
+
+    def test_repr(self):
+        self.assertEqual(repr(Point(1, 2)), 'IPointProvider(x=1, y=2)')
+
+    def test_eq(self):
+        self.assertEqual(Point(1, 2), Point(1, 2))
+        self.assertNotEqual(Point(1, 2), Point(1, 3))
+        self.assertNotEqual(Point(1, 2), FrozenPoint(1, 2))
+
+    def test_mutable(self):
+        point = Point(1, 2)
+        point.x = 3
+        self.assertEqual(point.x, 3)
+
+    def test_mutable_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(Point(1, 2))
+
+    def test_frozen(self):
+        point = FrozenPoint(1, 2)
+        with self.assertRaises(AttributeError):
+            point.x = 3
+        with self.assertRaises(AttributeError):
+            del point.x
+        with self.assertRaises(AttributeError):
+            IPoint(point).x = 3
+
+    def test_frozen_hashable(self):
+        self.assertEqual(hash(FrozenPoint(1, 2)), hash(FrozenPoint(1, 2)))
+
+    def test_hash(self):
+        HashablePoint = provider_class(IPoint, hash=True)
+        point = HashablePoint(1, 2)
+        self.assertEqual(hash(point), hash(HashablePoint(1, 2)))
+
+    def test_order(self):
+        self.assertLess(FrozenPoint(1, 2), FrozenPoint(1, 3))
+        self.assertGreater(FrozenPoint(2, 0), FrozenPoint(1, 3))
+        with self.assertRaises(TypeError):
+            Point(1, 2) < Point(1, 3)
+
+    def test_methods_from_bases(self):
+        NamedPoint = provider_class(INamedPoint, bases=(Named,))
+        point = INamedPoint(NamedPoint(1, 2))
+        self.assertEqual(point.name(), 'point at 1, 2')
+        self.assertFalse(hasattr(NamedPoint(1, 2), '__dict__'))
+
+    def test_missing_methods(self):
+        with self.assertRaises(InterfaceConformanceError):
+            provider_class(INamedPoint)
@@ -0,0 +1,118 @@
+import sys
+import threading
+import unittest
+
+from jute import Attribute, Opaque, implements
+from jute._jute import ClassCache
+
+
+class IBase(Opaque):
+
+    value = Attribute()
+
+
+class IDerived(IBase):
+
+    def method(self):
+        """A method."""
+
+
+@implements(IDerived)
+class Provider:
+
+    value = 1
+
+    def method(self):
+        pass
+
+
+def run_threads(count, target):
+    threads = [
+        threading.Thread(target=target, args=(i,)) for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class RegistryThreadTests(unittest.TestCase):
+
+    def setUp(self):
+        interval = sys.getswitchinterval()
+        self.addCleanup(sys.setswitchinterval, interval)
+        sys.setswitchinterval(1e-6)
+
+    def test_concurrent_registration(self):
+        class IRegistry(IBase):
+            pass
+
+        classes = [type('Class{}'.format(i), (), {}) for i in range(400)]
+
+        def register(i):
+            for cls in classes[i::8]:
+                IRegistry.register_implementation(cls)
+
+        run_threads(8, register)
+        for cls in classes:
+            self.assertTrue(IRegistry.implemented_by(cls))
+            self.assertTrue(IBase.implemented_by(cls))
+
+    def test_cast_during_registration(self):
+        class IRegistry(IDerived):
+            pass
+
+        IRegistry.register_implementation(Provider)
+        provider = Provider()
+        errors = []
+
+        def work(i):
+            try:
+                if i % 2:
+                    for j in range(50):
+                        IRegistry.register_implementation(
+                            type('Class{}'.format(j), (), {}))
+                else:
+                    for j in range(500):
+                        IRegistry(provider).method()
+            except Exception as e:
+                errors.append(e)
+
+        run_threads(8, work)
+        self.assertEqual(errors, [])
+
+    def test_concurrent_lazy(self):
+        class ILazy(IBase):
+            pass
+
+        ILazy.register_implementation(Provider)
+        classes = set()
+
+        def create(i):
+            classes.add(type(ILazy.lazy(Provider)))
+
+        run_threads(8, create)
+        self.assertEqual(len(classes), 1)
+
+
+class ClassCacheTests(unittest.TestCase):
+
+    def test_add(self):
+        cache = ClassCache()
+        self.assertNotIn(Provider, cache)
+        cache.add(Provider)
+        self.assertIn(Provider, cache)
+
+    def test_registration_keeps(self):
+        cache = ClassCache()
+        cache.add(Provider)
+        IBase.register_implementation(type('Other', (), {}))
+        self.assertIn(Provider, cache)
+
+    def test_unregistration_clears(self):
+        cache = ClassCache()
+        cache.add(Provider)
+        other = type('Other', (), {})
+        IBase.register_implementation(other)
+        IBase.unregister_implementation(other)
+        self.assertNotIn(Provider, cache)
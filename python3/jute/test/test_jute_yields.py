@@ -0,0 +1,228 @@
+import asyncio
+import unittest
+
+from jute import (
+    Attribute, Opaque, DynamicInterface, implements, returns_interface,
+    yields, InterfaceConformanceError
+)
+
+
+class IRow(Opaque):
+
+    value = Attribute()
+
+
+@implements(IRow)
+class Row:
+
+    def __init__(self, value):
+        self.value = value
+
+
+@implements(IRow)
+class NoValue:
+    pass
+
+
+class Rows(Opaque):
+
+    @yields(IRow)
+    def __iter__(self):
+        """Iterate over rows."""
+
+
+class RowIterator(Opaque):
+
+    @returns_interface
+    def __iter__(self):
+        """Return the iterator."""
+
+    @yields(IRow)
+    def __next__(self):
+        """Return the next row."""
+
+
+class CheckedRows(Opaque):
+
+    @yields(IRow, cast=False)
+    def __iter__(self):
+        """Iterate over rows."""
+
+
+class Integers(Opaque):
+
+    @yields(int)
+    def __iter__(self):
+        """Iterate over integers."""
+
+
+class SampledIntegers(Opaque):
+
+    @yields(int, sample=2)
+    def __iter__(self):
+        """Iterate over integers, checking every second item."""
+
+
+Rows.register_implementation(list)
+CheckedRows.register_implementation(list)
+Integers.register_implementation(list)
+SampledIntegers.register_implementation(list)
+RowIterator.register_implementation(type(iter([])))
+
+
+class YieldsCastTests(unittest.TestCase):
+
+    def test_iter_casts_items(self):
+        rows = [Row(1), Row(2)]
+        result = list(Rows(rows))
+        self.assertEqual([type(r) for r in result], [IRow, IRow])
+        self.assertEqual([r.value for r in result], [1, 2])
+
+    def test_next_casts_items(self):
+        rows = RowIterator(iter([Row(1)]))
+        row = next(rows)
+        self.assertIs(type(row), IRow)
+        self.assertEqual(row.value, 1)
+
+    def test_for_loop_over_iterator_casts_items(self):
+        rows = RowIterator(iter([Row(1), Row(2)]))
+        self.assertEqual([type(r) for r in rows], [IRow, IRow])
+
+    def test_items_checked_lazily(self):
+        """Items are checked as they are produced, not when iterating."""
+        iterator = iter(Rows([Row(1), 'not a row']))
+        self.assertEqual(next(iterator).value, 1)
+        with self.assertRaises(TypeError):
+            next(iterator)
+
+    def test_interface_item_not_rewrapped(self):
+        row = IRow(Row(1))
+        self.assertIs(list(Rows([row]))[0], row)
+
+    def test_non_conforming_item(self):
+        if __debug__:
+            with self.assertRaises(InterfaceConformanceError):
+                list(Rows([NoValue()]))
+
+    def test_dynamic_items_checked_each_time(self):
+        @implements(DynamicInterface)
+        class MaybeRow:
+
+            def __init__(self, is_row):
+                self.is_row = is_row
+                self.value = 1
+
+            def provides_interface(self, interface):
+                return self.is_row and interface.implemented_by(IRow)
+
+        iterator = iter(Rows([MaybeRow(True), MaybeRow(False)]))
+        next(iterator)
+        with self.assertRaises(TypeError):
+            next(iterator)
+
+    def test_anext_casts_items(self):
+        class AsyncRows(Opaque):
+
+            @returns_interface
+            def __aiter__(self):
+                """Return the async iterator."""
+
+            @yields(IRow)
+            def __anext__(self):
+                """Return the next row."""
+
+        @implements(AsyncRows)
+        class OneRow:
+
+            def __init__(self):
+                self.done = False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if self.done:
+                    raise StopAsyncIteration
+                self.done = True
+                return Row(3)
+
+        async def collect(rows):
+            return [row async for row in rows]
+
+        loop = asyncio.new_event_loop()
+        try:
+            rows = loop.run_until_complete(collect(AsyncRows(OneRow())))
+        finally:
+            loop.close()
+        self.assertEqual([type(row) for row in rows], [IRow])
+        self.assertEqual(rows[0].value, 3)
+
+
+class YieldsValidateTests(unittest.TestCase):
+
+    def test_interface_items_not_cast(self):
+        rows = [Row(1), Row(2)]
+        self.assertEqual(list(CheckedRows(rows)), rows)
+
+    def test_interface_items_checked(self):
+        with self.assertRaises(TypeError):
+            list(CheckedRows([Row(1), 2]))
+
+    def test_wrapped_items_checked(self):
+        """Wrapped items are checked by the class of the wrapped object."""
+        class IAny(Opaque):
+            pass
+
+        class Other:
+            pass
+
+        IAny.register_implementation(Row)
+        IAny.register_implementation(Other)
+        with self.assertRaises(TypeError):
+            list(CheckedRows([IAny(Row(1)), IAny(Other())]))
+
+    def test_type_items(self):
+        self.assertEqual(list(Integers([1, 2])), [1, 2])
+        with self.assertRaises(TypeError):
+            list(Integers([1, 'a']))
+
+    def test_sampled_items(self):
+        """Only a sample of the items are checked."""
+        items = list(SampledIntegers([1, 'a', 3, 'b']))
+        self.assertEqual(items, [1, 'a', 3, 'b'])
+
+
+class YieldsDeclarationTests(unittest.TestCase):
+
+    def test_invalid_method(self):
+        with self.assertRaises(TypeError):
+            class AnInterface(Opaque):
+
+                @yields(int)
+                def __call__(self):
+                    pass
+
+    def test_returns_interface(self):
+        for first, second in [
+            (returns_interface, yields(int)),
+            (yields(int), returns_interface),
+        ]:
+            with self.assertRaises(TypeError):
+                class AnInterface(Opaque):
+
+                    @first
+                    @second
+                    def __iter__(self):
+                        pass
+
+    def test_cannot_cast_to_type(self):
+        with self.assertRaises(TypeError):
+            yields(int, cast=True)
+
+    def test_cannot_sample_casts(self):
+        with self.assertRaises(ValueError):
+            yields(IRow, sample=10)
+
+    def test_invalid_sample(self):
+        with self.assertRaises(ValueError):
+            yields(int, sample=0)
@@ -5,8 +5,8 @@ GITHUB_URL = 'https://github.com/jongiddy/jute'
 VERSION = '0.2.1'
 
 
-if sys.version_info[0] < 3:
-    sys.exit('The jute package requires Python 3.')
+if sys.version_info < (3, 7):
+    sys.exit('The jute package requires Python 3.7 or later.')
 
 
 def contents_of(filename):
@@ -33,9 +33,12 @@ setup(
         "Operating System :: OS Independent",
         "Programming Language :: Python",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.3",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Programming Language :: Python :: Implementation :: CPython",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],